@@ -33,6 +33,11 @@ if [ -d $fixtures_dir ]; then
     done
 fi
 
+# Collect the Prometheus metrics of all uWSGI workers
+export prometheus_multiproc_dir=${prometheus_multiproc_dir:-/tmp/prometheus}
+rm -rf "$prometheus_multiproc_dir"
+mkdir -p "$prometheus_multiproc_dir"
+
 # Start server
 >&2 echo "Starting server"
 uwsgi \
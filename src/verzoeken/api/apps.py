@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    name = "verzoeken.api"
+
+    def ready(self):
+        from . import auth  # noqa
+        from .spec_cache import load_specs
+
+        load_specs()
@@ -1,13 +1,69 @@
 import logging
+import threading
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from vng_api_common.models import APICredential
+from zds_client import ClientAuth
 
 logger = logging.getLogger(__name__)
 
+_credentials = {"loaded": None, "credentials": []}
+_lock = threading.Lock()
+
+
+def _get_credentials() -> List[APICredential]:
+    """
+    Return all credentials, longest API root first, from memory.
+
+    The credentials are reloaded when they change in this process, and every
+    ``API_CREDENTIALS_CACHE_TIMEOUT`` seconds to pick up changes made by other
+    processes.
+    """
+    loaded = _credentials["loaded"]
+    if loaded is not None and time.monotonic() - loaded < (
+        settings.API_CREDENTIALS_CACHE_TIMEOUT
+    ):
+        return _credentials["credentials"]
+
+    with _lock:
+        credentials = sorted(
+            APICredential.objects.all(),
+            key=lambda credential: len(credential.api_root),
+            reverse=True,
+        )
+        _credentials.update(loaded=time.monotonic(), credentials=credentials)
+    return credentials
+
+
+@receiver([post_save, post_delete], sender=APICredential)
+def clear_credentials_cache(**kwargs) -> None:
+    _credentials["loaded"] = None
+
+
+def get_client_auth(url: str, **kwargs) -> Optional[ClientAuth]:
+    """
+    Cached equivalent of :meth:`APICredential.get_auth`.
+    """
+    for credential in _get_credentials():
+        if url.startswith(credential.api_root):
+            return ClientAuth(
+                client_id=credential.client_id,
+                secret=credential.secret,
+                user_id=credential.user_id,
+                user_representation=credential.user_representation,
+                **kwargs,
+            )
+    return None
+
 
 def get_auth(url: str) -> dict:
     logger.info("Authenticating for %s", url)
-    auth = APICredential.get_auth(url)
+    auth = get_client_auth(url)
     if auth is None:
         logger.warning("Could not authenticate for %s", url)
         return {}
@@ -0,0 +1,347 @@
+"""
+Benchmark the API with realistic data volumes.
+
+The data is generated with the factories of the datamodel and inserted in
+bulk. Every scenario (list, filter, retrieve and create for every resource)
+is requested a number of times through the full Django stack, recording the
+latencies and the number of queries. The results can be compared with the
+results of an earlier run to catch regressions.
+
+Everything runs in a transaction that is rolled back afterwards, so the
+benchmark leaves no data behind. See the ``benchmark`` management command.
+"""
+import statistics
+import time
+import uuid
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+import requests_mock
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient, APIRequestFactory
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth, reverse
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+)
+
+from .serializers import (
+    KlantVerzoekSerializer,
+    ObjectVerzoekSerializer,
+    VerzoekContactMomentSerializer,
+    VerzoekInformatieObjectSerializer,
+    VerzoekProductSerializer,
+    VerzoekSerializer,
+)
+
+BATCH_SIZE = 5000
+CLIENT_ID = "benchmark"
+HOST = "benchmark.local"
+REMOTE_URL = "https://benchmark.invalid/api/v1/resources"
+
+# factory -> field with the URL of the remote resource
+RELATION_FACTORIES = {
+    KlantVerzoekFactory: "klant",
+    ObjectVerzoekFactory: "object",
+    VerzoekContactMomentFactory: "contactmoment",
+    VerzoekInformatieObjectFactory: "informatieobject",
+    VerzoekProductFactory: "product",
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def with_etags(objects: Iterable) -> list:
+    objects = list(objects)
+    for obj in objects:
+        obj.update_etag()
+    return objects
+
+
+def seed(verzoeken: int, relations: int) -> None:
+    """
+    Insert ``verzoeken`` VERZOEKen with ``relations`` relations of every type.
+    """
+    for batch in batched(range(verzoeken), BATCH_SIZE):
+        objects = Verzoek.objects.bulk_create(
+            with_etags(
+                VerzoekFactory.build(identificatie=f"BENCHMARK-{number}")
+                for number in batch
+            )
+        )
+        for factory, field in RELATION_FACTORIES.items():
+            model = factory._meta.get_model_class()
+            model.objects.bulk_create(
+                with_etags(
+                    factory.build(verzoek=verzoek, **{field: remote_url()})
+                    for verzoek in objects
+                    for _i in range(relations)
+                ),
+                batch_size=BATCH_SIZE,
+            )
+
+
+def get_client() -> APIClient:
+    JWTSecret.objects.update_or_create(identifier=CLIENT_ID, defaults={"secret": "x"})
+    Applicatie.objects.create(
+        client_ids=[CLIENT_ID], label="benchmark", heeft_alle_autorisaties=True
+    )
+    client = APIClient(HTTP_HOST=HOST)
+    client.credentials(HTTP_AUTHORIZATION=generate_jwt_auth(CLIENT_ID, "x"))
+    return client
+
+
+def remote_url() -> str:
+    return f"{REMOTE_URL}/{uuid.uuid4()}"
+
+
+def _post(client: APIClient, model, get_data: Callable) -> Callable:
+    return lambda: client.post(reverse(model), get_data())
+
+
+def get_scenarios(client: APIClient) -> Dict[str, Callable]:
+    verzoek = Verzoek.objects.order_by("?").first()
+    verzoek_url = f"http://{HOST}{reverse(verzoek)}"
+
+    scenarios = {
+        "verzoek.list": lambda: client.get(reverse(Verzoek)),
+        "verzoek.filter": lambda: client.get(
+            reverse(Verzoek), {"bronorganisatie": verzoek.bronorganisatie}
+        ),
+        "verzoek.retrieve": lambda: client.get(reverse(verzoek)),
+        "verzoek.create": lambda: client.post(
+            reverse(Verzoek),
+            {
+                "bronorganisatie": verzoek.bronorganisatie,
+                "status": VerzoekStatus.ontvangen,
+            },
+        ),
+    }
+
+    for model in (
+        KlantVerzoek,
+        ObjectVerzoek,
+        VerzoekContactMoment,
+        VerzoekInformatieObject,
+        VerzoekProduct,
+    ):
+        name = model._meta.model_name
+        instance = model.objects.filter(verzoek=verzoek).first()
+        scenarios.update(
+            {
+                f"{name}.list": lambda model=model: client.get(reverse(model)),
+                f"{name}.filter": lambda model=model: client.get(
+                    reverse(model), {"verzoek": verzoek_url}
+                ),
+            }
+        )
+        if instance is not None:
+            scenarios[f"{name}.retrieve"] = lambda instance=instance: client.get(
+                reverse(instance)
+            )
+
+    # the relations with a remote counterpart can't be created without the
+    # remote API, the others are validated against a mocked remote API
+    create_data = {
+        KlantVerzoek: lambda: {"verzoek": verzoek_url, "klant": remote_url()},
+        VerzoekContactMoment: lambda: {
+            "verzoek": verzoek_url,
+            "contactmoment": remote_url(),
+        },
+        VerzoekProduct: lambda: {"verzoek": verzoek_url, "product": remote_url()},
+    }
+    for model, get_data in create_data.items():
+        scenarios[f"{model._meta.model_name}.create"] = _post(client, model, get_data)
+
+    return scenarios
+
+
+def measure(request: Callable, repeat: int) -> dict:
+    request()  # warm up
+
+    durations = []
+    for _i in range(repeat):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = request()
+            durations.append((time.perf_counter() - start) * 1000)
+
+    durations.sort()
+    return {
+        "status": response.status_code,
+        "queries": len(queries),
+        "min_ms": round(durations[0], 2),
+        "median_ms": round(statistics.median(durations), 2),
+        "p95_ms": round(durations[int(0.95 * (len(durations) - 1))], 2),
+        "max_ms": round(durations[-1], 2),
+    }
+
+
+SETUP_SERIALIZERS = (
+    VerzoekSerializer,
+    KlantVerzoekSerializer,
+    ObjectVerzoekSerializer,
+    VerzoekContactMomentSerializer,
+    VerzoekInformatieObjectSerializer,
+    VerzoekProductSerializer,
+)
+
+
+def get_request() -> Request:
+    request = Request(APIRequestFactory().get(reverse(Verzoek), HTTP_HOST=HOST))
+    request.versioning_scheme = api_settings.DEFAULT_VERSIONING_CLASS()
+    request.version = api_settings.DEFAULT_VERSION
+    return request
+
+
+def measure_serializer(objects: int, repeat: int) -> dict:
+    request = get_request()
+    verzoeken = list(Verzoek.objects.all()[:objects])
+
+    durations = []
+    for _i in range(repeat):
+        start = time.perf_counter()
+        VerzoekSerializer(verzoeken, many=True, context={"request": request}).data
+        durations.append(time.perf_counter() - start)
+
+    fastest = min(durations)
+    return {
+        "objects": len(verzoeken),
+        "objects_per_second": round(len(verzoeken) / fastest) if fastest else 0,
+    }
+
+
+def measure_serializer_setup(repeat: int, instances: int = 100) -> dict:
+    """
+    Measure setting up the serializers with their fields, as done per request.
+    """
+    context = {"request": get_request()}
+
+    durations = []
+    for _i in range(repeat):
+        start = time.perf_counter()
+        for _j in range(instances):
+            for serializer_class in SETUP_SERIALIZERS:
+                serializer_class(context=context).fields
+        durations.append(time.perf_counter() - start)
+
+    fastest = min(durations)
+    count = instances * len(SETUP_SERIALIZERS)
+    return {
+        "objects": count,
+        "objects_per_second": round(count / fastest) if fastest else 0,
+    }
+
+
+@override_settings(
+    ALLOWED_HOSTS=[HOST],
+    NOTIFICATIONS_DISABLED=True,
+    PERFORMANCE_LOG_SAMPLE_RATE=0,
+)
+def run_benchmark(
+    verzoeken: int,
+    relations: int,
+    repeat: int,
+    serializer_objects: int,
+    scenarios: Optional[List[str]] = None,
+) -> dict:
+    results = {}
+    try:
+        with transaction.atomic():
+            start = time.perf_counter()
+            seed(verzoeken, relations)
+            seed_duration = time.perf_counter() - start
+
+            client = get_client()
+            with requests_mock.Mocker() as m:
+                m.get(requests_mock.ANY, json={})
+                for name, request in get_scenarios(client).items():
+                    if scenarios and name not in scenarios:
+                        continue
+                    results[name] = measure(request, repeat)
+
+            results["verzoekserializer.throughput"] = measure_serializer(
+                serializer_objects, repeat
+            )
+            results["serializers.setup"] = measure_serializer_setup(repeat)
+            raise Rollback
+    except Rollback:
+        pass
+
+    return {
+        "created": timezone.now().isoformat(),
+        "version": settings.API_VERSION,
+        "volumes": {"verzoeken": verzoeken, "relations": relations},
+        "repeat": repeat,
+        "seed_seconds": round(seed_duration, 2),
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Return the regressions of the current results compared to the baseline.
+
+    A scenario regresses when its median latency increased by more than
+    ``threshold`` (a fraction), or when it executes more queries.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+
+        if "median_ms" in result:
+            ratio = result["median_ms"] / max(previous["median_ms"], 0.01)
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name}: median {previous['median_ms']}ms -> "
+                    f"{result['median_ms']}ms"
+                )
+            if result["queries"] > previous["queries"]:
+                regressions.append(
+                    f"{name}: queries {previous['queries']} -> {result['queries']}"
+                )
+        elif "objects_per_second" in result:
+            ratio = previous["objects_per_second"] / max(
+                result["objects_per_second"], 1
+            )
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name}: {previous['objects_per_second']} -> "
+                    f"{result['objects_per_second']} objects per second"
+                )
+    return regressions
@@ -0,0 +1,196 @@
+"""
+Render and parse the camelCase JSON of the API.
+
+:mod:`djangorestframework_camel_case` converts every key of every object in a
+request or response with a regular expression. Nearly all keys are names of
+fields of the serializers in :mod:`verzoeken.api.serializers` though, so their
+conversions are computed once (see :func:`get_key_maps`). Other keys are still
+converted with the regular expression, so the output is the same.
+
+The JSON can optionally be encoded with `orjson`_ by setting ``JSON_BACKEND``
+to ``"orjson"``. It is not enabled by default: floats in exponent notation are
+formatted differently than with :mod:`json` and NaN is rendered as ``null``.
+
+.. _orjson: https://github.com/ijl/orjson
+"""
+import inspect
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, NamedTuple, Set
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import force_text
+from django.utils.functional import Promise
+
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as _CamelCaseJSONParser,
+)
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as _CamelCaseJSONRenderer,
+)
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import (
+    camel_to_underscore,
+    camelize_re,
+    is_iterable,
+    underscore_to_camel,
+)
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# values that are rendered as they are
+SCALARS = (str, int, float, type(None))
+
+
+class KeyMaps(NamedTuple):
+    camelized: Dict[str, str]
+    underscored: Dict[str, str]
+
+
+def _get_field_names(serializer: serializers.Serializer) -> Set[str]:
+    names = set()
+    for name, field in serializer.fields.items():
+        names.add(name)
+        field = getattr(field, "child", field)
+        if isinstance(field, serializers.Serializer):
+            names |= _get_field_names(field)
+    return names
+
+
+def camelize_key(key: str) -> str:
+    return camelize_re.sub(underscore_to_camel, key)
+
+
+def underscoreize_key(key: str) -> str:
+    return camel_to_underscore(key, **api_settings.JSON_UNDERSCOREIZE)
+
+
+@lru_cache(maxsize=None)
+def get_key_maps() -> KeyMaps:
+    """
+    Map the field names of the API serializers to camelCase and back.
+    """
+    # imported here, the serializers can't be loaded with the DRF settings
+    from . import serializers as api_serializers
+
+    names = set()
+    for _name, serializer_class in inspect.getmembers(api_serializers, inspect.isclass):
+        if (
+            issubclass(serializer_class, serializers.Serializer)
+            and serializer_class.__module__ == api_serializers.__name__
+        ):
+            names |= _get_field_names(serializer_class())
+
+    camelized = {name: camelize_key(name) for name in names if "_" in name}
+    underscored = {
+        camel: underscoreize_key(camel)
+        for camel in set(camelized.values()) | (names - set(camelized))
+    }
+    return KeyMaps(camelized, underscored)
+
+
+def _camelize(data, keys: Dict[str, str]):
+    if isinstance(data, dict):
+        new_dict = OrderedDict()
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_text(key)
+            if isinstance(key, str) and "_" in key:
+                key = keys.get(key) or camelize_key(key)
+            new_dict[key] = (
+                value if isinstance(value, SCALARS) else _camelize(value, keys)
+            )
+        return new_dict
+    if isinstance(data, SCALARS):
+        return data
+    if isinstance(data, Promise):
+        return force_text(data)
+    if isinstance(data, (list, tuple)):
+        return [
+            item if isinstance(item, SCALARS) else _camelize(item, keys)
+            for item in data
+        ]
+    if is_iterable(data):
+        return [_camelize(item, keys) for item in data]
+    return data
+
+
+def camelize(data):
+    """
+    Convert the keys of ``data`` to camelCase, like
+    :func:`djangorestframework_camel_case.util.camelize`.
+    """
+    return _camelize(data, get_key_maps().camelized)
+
+
+def _underscoreize(data, keys: Dict[str, str]):
+    if isinstance(data, dict):
+        return {
+            (keys.get(key) or underscoreize_key(key))
+            if isinstance(key, str)
+            else key: _underscoreize(value, keys)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_underscoreize(item, keys) for item in data]
+    return data
+
+
+def underscoreize(data):
+    """
+    Convert the keys of parsed JSON ``data`` to snake_case, like
+    :func:`djangorestframework_camel_case.util.underscoreize`.
+    """
+    return _underscoreize(data, get_key_maps().underscored)
+
+
+def _dumps_orjson(data, encoder_class) -> bytes:
+    if orjson is None:
+        raise ImproperlyConfigured("JSON_BACKEND 'orjson' requires orjson")
+
+    content = orjson.dumps(
+        data,
+        default=encoder_class().default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+    # like rest_framework.renderers.JSONRenderer, for use in JavaScript
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+class CamelCaseJSONRenderer(_CamelCaseJSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = camelize(data)
+
+        use_orjson = (
+            settings.JSON_BACKEND == "orjson"
+            and data is not None
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+        if use_orjson:
+            return _dumps_orjson(data, self.encoder_class)
+
+        # skip the camelize of the library
+        return super(_CamelCaseJSONRenderer, self).render(
+            data, accepted_media_type, renderer_context
+        )
+
+
+class CamelCaseJSONParser(_CamelCaseJSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = json.loads(stream.read().decode(encoding))
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+        return underscoreize(data)
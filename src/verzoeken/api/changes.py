@@ -0,0 +1,258 @@
+"""
+List the changes of VERZOEKen and their relations, for incremental synchronisation.
+
+Every resource keeps the time of its last change (``laatst_gewijzigd``) and
+deletions leave a :class:`~verzoeken.datamodel.models.Tombstone`. The change
+feed lists the resources and tombstones ordered by ``(laatst_gewijzigd,
+uuid)``. Every table is read with an index range scan starting at the
+position in the token, and the results of the tables are merged. A resource
+that changes again moves to the end of the feed, so it's only listed once.
+
+Changes are only listed once they are ``CHANGE_FEED_DELAY`` seconds old, so
+a transaction that is still running while a consumer reads past its changes
+doesn't cause them to be skipped.
+"""
+import base64
+import binascii
+import heapq
+import json
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.utils.urls import replace_query_param
+
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Tombstone,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+
+from .pagination import _keyset_filter
+from .serializers import (
+    KlantVerzoekSerializer,
+    ObjectVerzoekSerializer,
+    VerzoekContactMomentSerializer,
+    VerzoekInformatieObjectSerializer,
+    VerzoekProductSerializer,
+    VerzoekSerializer,
+)
+
+ORDERING = ("laatst_gewijzigd", "uuid")
+
+# type in the feed -> (queryset, serializer)
+RESOURCES = {
+    "verzoek": (
+        Verzoek.objects.select_related(
+            "in_te_trekken_verzoek",
+            "intrekkende_verzoek",
+            "aangevulde_verzoek",
+            "aanvullende_verzoek",
+        ).defer("zoekvector"),
+        VerzoekSerializer,
+    ),
+    "objectverzoek": (
+        ObjectVerzoek.objects.select_related("verzoek"),
+        ObjectVerzoekSerializer,
+    ),
+    "verzoekproduct": (
+        VerzoekProduct.objects.select_related("verzoek"),
+        VerzoekProductSerializer,
+    ),
+    "verzoekinformatieobject": (
+        VerzoekInformatieObject.objects.select_related("verzoek"),
+        VerzoekInformatieObjectSerializer,
+    ),
+    "verzoekcontactmoment": (
+        VerzoekContactMoment.objects.select_related("verzoek"),
+        VerzoekContactMomentSerializer,
+    ),
+    "klantverzoek": (
+        KlantVerzoek.objects.select_related("verzoek"),
+        KlantVerzoekSerializer,
+    ),
+}
+
+TOKEN_QUERY_PARAM = "token"
+
+
+class ChangeSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(
+        choices=list(RESOURCES), help_text=_("Het type van de resource.")
+    )
+    url = serializers.URLField(help_text=_("URL-referentie naar de resource."))
+    laatst_gewijzigd = serializers.DateTimeField(
+        help_text=_("Het tijdstip waarop de resource is aangemaakt of gewijzigd.")
+    )
+    verwijderd = serializers.BooleanField(
+        help_text=_("Geeft aan of de resource verwijderd is.")
+    )
+    resource = serializers.JSONField(
+        allow_null=True,
+        help_text=_(
+            "De resource zoals die op het moment van opvragen is, of `null` als "
+            "de resource verwijderd is."
+        ),
+    )
+
+
+class ChangeFeedSerializer(serializers.Serializer):
+    next = serializers.URLField(
+        allow_null=True,
+        help_text=_("URL van de volgende pagina met wijzigingen, indien aanwezig."),
+    )
+    token = serializers.CharField(
+        allow_blank=True,
+        help_text=_(
+            "Het token om later de wijzigingen na deze pagina op te vragen, met "
+            "de query parameter `token`."
+        ),
+    )
+    results = ChangeSerializer(many=True)
+
+
+def encode_token(position: tuple) -> str:
+    payload = json.dumps([position[0].isoformat(), str(position[1])]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_token(token: str) -> Optional[tuple]:
+    if not token:
+        return None
+
+    try:
+        raw_timestamp, raw_uuid = json.loads(
+            base64.urlsafe_b64decode(token.encode("ascii"))
+        )
+        timestamp = parse_datetime(raw_timestamp)
+        if timestamp is None:
+            raise ValueError("Invalid timestamp")
+        return timestamp, uuid.UUID(raw_uuid)
+    except (binascii.Error, TypeError, UnicodeError, ValueError):
+        raise ValidationError(
+            {TOKEN_QUERY_PARAM: _("Ongeldig token.")}, code="invalid-token"
+        )
+
+
+def _get_candidates(queryset, position: Optional[tuple], until, limit: int):
+    queryset = queryset.filter(laatst_gewijzigd__lte=until).order_by(*ORDERING)
+    if position is not None:
+        queryset = queryset.filter(_keyset_filter(ORDERING, list(position), "gt"))
+    return queryset[:limit]
+
+
+def _labelled(type_name: str, objects) -> Iterator[Tuple[str, object]]:
+    for obj in objects:
+        yield type_name, obj
+
+
+def get_changes(
+    position: Optional[tuple], page_size: int
+) -> Tuple[List[Tuple[str, object]], bool]:
+    """
+    Return the next ``page_size`` changes after ``position`` as (type, object).
+
+    Changed resources are returned as the model instance, deletions as the
+    :class:`Tombstone`. The boolean tells if there are more changes.
+    """
+    until = timezone.now() - timedelta(seconds=settings.CHANGE_FEED_DELAY)
+
+    # every table is read up to one row past the page, to know if there is more
+    sources = [
+        _labelled(type_name, _get_candidates(queryset, position, until, page_size + 1))
+        for type_name, (queryset, _serializer) in RESOURCES.items()
+    ]
+    sources.append(
+        (
+            (tombstone.resource, tombstone)
+            for tombstone in _get_candidates(
+                Tombstone.objects.all(), position, until, page_size + 1
+            )
+        )
+    )
+
+    merged = heapq.merge(
+        *sources, key=lambda change: (change[1].laatst_gewijzigd, change[1].uuid)
+    )
+    changes = list(islice(merged, page_size + 1))
+    return changes[:page_size], len(changes) > page_size
+
+
+def render_changes(changes: List[Tuple[str, object]], request: Request) -> List[dict]:
+    # serialize the resources per type, in one go
+    instances: Dict[str, list] = {type_name: [] for type_name in RESOURCES}
+    for type_name, obj in changes:
+        if not isinstance(obj, Tombstone):
+            instances[type_name].append(obj)
+
+    representations = {}
+    for type_name, objects in instances.items():
+        if not objects:
+            continue
+        serializer_class = RESOURCES[type_name][1]
+        data = serializer_class(objects, many=True, context={"request": request}).data
+        for obj, representation in zip(objects, data):
+            representations[(type_name, obj.uuid)] = representation
+
+    results = []
+    for type_name, obj in changes:
+        deleted = isinstance(obj, Tombstone)
+        representation = None if deleted else representations[(type_name, obj.uuid)]
+        url = (
+            reverse(f"{type_name}-detail", kwargs={"uuid": obj.uuid}, request=request)
+            if deleted
+            else representation["url"]
+        )
+        results.append(
+            OrderedDict(
+                [
+                    ("type", type_name),
+                    ("url", url),
+                    ("laatst_gewijzigd", obj.laatst_gewijzigd),
+                    ("verwijderd", deleted),
+                    ("resource", representation),
+                ]
+            )
+        )
+    return results
+
+
+def get_change_feed(request: Request, page_size: int) -> OrderedDict:
+    token = request.query_params.get(TOKEN_QUERY_PARAM, "")
+    position = decode_token(token)
+
+    changes, has_next = get_changes(position, page_size)
+    if changes:
+        last = changes[-1][1]
+        token = encode_token((last.laatst_gewijzigd, last.uuid))
+
+    next_url = (
+        replace_query_param(request.build_absolute_uri(), TOKEN_QUERY_PARAM, token)
+        if has_next
+        else None
+    )
+    return OrderedDict(
+        [
+            ("next", next_url),
+            ("token", token),
+            (
+                "results",
+                ChangeSerializer(render_changes(changes, request), many=True).data,
+            ),
+        ]
+    )
@@ -0,0 +1,145 @@
+"""
+Stream (filtered) VERZOEKen as newline delimited JSON or CSV.
+
+The VERZOEKen are read with a server side cursor and written row by row, so an
+export of any size is served in constant memory. The relations of the
+VERZOEKen are optionally included, retrieved with one query per relation per
+chunk of VERZOEKen.
+"""
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+from vng_api_common.utils import underscore_to_camel
+
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekProduct,
+)
+
+from .camel_case import camelize
+from .serializers import (
+    KlantVerzoekSerializer,
+    ObjectVerzoekSerializer,
+    VerzoekContactMomentSerializer,
+    VerzoekProductSerializer,
+    VerzoekSerializer,
+)
+
+CHUNK_SIZE = 500
+
+# key in the export -> (model, serializer)
+RELATIONS = {
+    "klantverzoeken": (KlantVerzoek, KlantVerzoekSerializer),
+    "objectverzoeken": (ObjectVerzoek, ObjectVerzoekSerializer),
+    "verzoekproducten": (VerzoekProduct, VerzoekProductSerializer),
+    "verzoekcontactmomenten": (VerzoekContactMoment, VerzoekContactMomentSerializer),
+}
+
+VERZOEK_COLUMNS = [
+    underscore_to_camel(field) for field in VerzoekSerializer.Meta.fields
+]
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # only used for error responses, the export itself is streamed
+        return "".join(NDJSONRenderer.stream([data]))
+
+    @staticmethod
+    def stream(rows: Iterable[dict]) -> Iterator[str]:
+        for row in rows:
+            yield json.dumps(row, cls=JSONEncoder) + "\n"
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # only used for error responses, the export itself is streamed
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        return "".join(CSVRenderer.stream([data], columns=list(data)))
+
+    @staticmethod
+    def stream(rows: Iterable[dict], columns: List[str]) -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(
+                [
+                    value
+                    if value is None or isinstance(value, (str, int, float))
+                    else json.dumps(value, cls=JSONEncoder)
+                    for value in (row.get(column) for column in columns)
+                ]
+            )
+
+
+def buffered(stream: Iterable[str], size: int = 64 * 1024) -> Iterator[str]:
+    """
+    Join the (small) rows into larger chunks to write to the client.
+    """
+    buffer, length = [], 0
+    for value in stream:
+        buffer.append(value)
+        length += len(value)
+        if length >= size:
+            yield "".join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _get_relations(verzoeken: List[Verzoek], request: Request) -> Dict[int, dict]:
+    relations = {verzoek.pk: {key: [] for key in RELATIONS} for verzoek in verzoeken}
+    for key, (model, serializer_class) in RELATIONS.items():
+        queryset = model.objects.filter(verzoek__in=verzoeken).select_related("verzoek")
+        for relation in queryset.order_by("pk"):
+            data = serializer_class(relation, context={"request": request}).data
+            relations[relation.verzoek_id][key].append(data)
+    return relations
+
+
+def export_verzoeken(
+    queryset, request: Request, include_relations: bool = False
+) -> Iterator[dict]:
+    """
+    Yield the camelized API representation of the VERZOEKen in the queryset.
+    """
+    verzoeken = queryset.iterator(chunk_size=CHUNK_SIZE)
+    while True:
+        chunk = list(islice(verzoeken, CHUNK_SIZE))
+        if not chunk:
+            return
+
+        relations = _get_relations(chunk, request) if include_relations else {}
+        for verzoek in chunk:
+            data = VerzoekSerializer(verzoek, context={"request": request}).data
+            if include_relations:
+                data.update(relations[verzoek.pk])
+            yield camelize(data)
+
+
+def get_columns(include_relations: bool = False) -> List[str]:
+    if not include_relations:
+        return VERZOEK_COLUMNS
+    return VERZOEK_COLUMNS + list(RELATIONS)
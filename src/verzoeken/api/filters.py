@@ -1,3 +1,5 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
 from django.utils.translation import ugettext_lazy as _
 
 from django_filters import filters
@@ -6,6 +8,7 @@ from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
 from verzoeken.datamodel.models import (
+    SEARCH_CONFIG,
     KlantVerzoek,
     ObjectVerzoek,
     Verzoek,
@@ -16,6 +19,15 @@ from verzoeken.datamodel.models import (
 
 
 class VerzoekFilter(FilterSet):
+    zoek = filters.CharFilter(
+        method="filter_zoek",
+        help_text=_(
+            "Zoek in de tekst van de VERZOEKen. Alle woorden moeten voorkomen, "
+            "ongeacht de vervoeging. De best passende VERZOEKen komen eerst, "
+            "behalve bij keyset-paginering met `cursor`."
+        ),
+    )
+
     class Meta:
         model = Verzoek
         fields = {
@@ -59,6 +71,14 @@ class VerzoekFilter(FilterSet):
             filter = super().filter_for_field(f, name, lookup_expr)
         return filter
 
+    def filter_zoek(self, queryset, name, value):
+        query = SearchQuery(value, config=SEARCH_CONFIG)
+        return (
+            queryset.filter(zoekvector=query)
+            .annotate(zoek_rang=SearchRank(F("zoekvector"), query))
+            .order_by("-zoek_rang", "-registratiedatum", "id")
+        )
+
 
 class ObjectVerzoekFilter(FilterSet):
     class Meta:
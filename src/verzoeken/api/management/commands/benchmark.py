@@ -0,0 +1,87 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API with generated data, in a transaction that is rolled "
+        "back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verzoeken",
+            type=int,
+            default=10000,
+            help="Number of VERZOEKen to generate (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--relations",
+            type=int,
+            default=1,
+            help="Number of relations of every type per VERZOEK (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of measurements per scenario (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--serializer-objects",
+            type=int,
+            default=1000,
+            help="Number of VERZOEKen to serialize at once (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run this scenario, e.g. verzoek.list (can be repeated)",
+        )
+        parser.add_argument("--output", help="Write the results as JSON to this file")
+        parser.add_argument(
+            "--compare", help="Compare the results with the results in this file"
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Fraction a scenario may be slower than in the compared results "
+            "(default: %(default)s)",
+        )
+
+    def handle(self, **options):
+        try:
+            from verzoeken.api.benchmark import compare, run_benchmark
+        except ImportError as exc:
+            raise CommandError(
+                f"The benchmark requires the test dependencies: {exc}"
+            ) from exc
+
+        results = run_benchmark(
+            verzoeken=options["verzoeken"],
+            relations=options["relations"],
+            repeat=options["repeat"],
+            serializer_objects=options["serializer_objects"],
+            scenarios=options["scenarios"],
+        )
+
+        output = json.dumps(results, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as outfile:
+                outfile.write(output)
+        else:
+            self.stdout.write(output)
+
+        if options["compare"]:
+            with open(options["compare"]) as infile:
+                baseline = json.load(infile)
+
+            regressions = compare(baseline, results, options["threshold"])
+            if regressions:
+                raise CommandError(
+                    "Performance regressions:\n" + "\n".join(regressions)
+                )
+            self.stdout.write("No performance regressions")
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from verzoeken.api.spec_cache import SPEC_SETTINGS, refresh_spec
+
+
+class Command(BaseCommand):
+    help = "Download the OAS specs of the remote APIs used for validation"
+
+    def handle(self, **options):
+        for setting in SPEC_SETTINGS:
+            path = refresh_spec(setting)
+            self.stdout.write(f"Stored {setting} in {path}")
@@ -0,0 +1,628 @@
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models, transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import ugettext_lazy as _
+
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.notifications import viewsets as notifications
+from vng_api_common.notifications.models import NotificationsConfig
+from vng_api_common.utils import underscore_to_camel
+from vng_api_common.viewsets import CheckQueryParamsMixin as _CheckQueryParamsMixin
+from zds_client import ClientError
+
+from verzoeken.datamodel.etags import VERSION_FIELDS
+from verzoeken.sync.notifications import enqueue_notification, enqueue_notifications
+
+from .rows import RowRepresentation
+
+logger = logging.getLogger(__name__)
+
+
+class _QueryParamsRequest:
+    """
+    Minimal request stand-in exposing a subset of the query parameters.
+    """
+
+    def __init__(self, request, exclude: Set[str]):
+        self.query_params = {
+            key: value
+            for key, value in request.query_params.items()
+            if key not in exclude
+        }
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Validate query parameters, taking the project specific parameters into account.
+
+    The upstream check only knows about filters and page number pagination.
+    Query parameters handled elsewhere (such as the keyset pagination ``cursor``)
+    are declared through :meth:`get_extra_query_params`.
+    """
+
+    def get_extra_query_params(self) -> Set[str]:
+        extra = set()
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param:
+            extra.add(cursor_query_param)
+        for name in ("fields_query_param", "expand_query_param"):
+            query_param = getattr(self, name, None)
+            if query_param:
+                extra.add(query_param)
+        return extra
+
+    def _check_query_params(self, request) -> None:
+        extra = self.get_extra_query_params()
+        if extra & set(request.query_params.keys()):
+            request = _QueryParamsRequest(request, exclude=extra)
+        super()._check_query_params(request)
+
+
+def _get_sources(field: serializers.Field) -> Optional[List[str]]:
+    """
+    Return the model attributes a serializer field is read from.
+    """
+    if isinstance(field, serializers.HyperlinkedIdentityField):
+        return [field.lookup_field]
+    if field.source != "*":
+        return [field.source.split(".")[0]]
+    if isinstance(field, serializers.Serializer):
+        sources = [_get_sources(child) for child in field.fields.values()]
+        if None not in sources:
+            return [source for child_sources in sources for source in child_sources]
+    return None
+
+
+def get_sparse_queryset(
+    queryset: models.QuerySet, fields: Iterable[serializers.Field], extra=()
+) -> models.QuerySet:
+    """
+    Select only the columns and relations needed to serialize ``fields``.
+    """
+    model = queryset.model
+    only, related = set(extra), set()
+    for field in fields:
+        sources = _get_sources(field)
+        if sources is None:
+            return queryset
+
+        for source in sources:
+            try:
+                model_field = model._meta.get_field(source)
+            except FieldDoesNotExist:
+                return queryset
+            if model_field.concrete:
+                only.add(model_field.name)
+            if model_field.is_relation:
+                related.add(model_field.name)
+
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        queryset = queryset.select_related(None)
+        keep = [name for name in select_related if name in related]
+        if keep:
+            queryset = queryset.select_related(*keep)
+    return queryset.only(*only)
+
+
+def get_query_param_names(
+    request: Request, param: str, available: Iterable[str], message: str, code: str
+) -> List[str]:
+    """
+    Parse the comma separated (camelCase) names in a query parameter.
+
+    Names that are not ``available`` give a validation error on the parameter.
+    """
+    value = request.query_params.get(param, "")
+    names = [
+        camel_to_underscore(name.strip()) for name in value.split(",") if name.strip()
+    ]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValidationError(
+            {param: message % ", ".join(underscore_to_camel(name) for name in unknown)},
+            code=code,
+        )
+    return names
+
+
+class SparseFieldsetsMixin:
+    """
+    Render only the fields requested in the ``fields`` query parameter.
+
+    The field names are separated by commas and written as in the response.
+    Both the rendered fields and the columns selected from the database are
+    narrowed down to the requested fields.
+    """
+
+    fields_query_param = "fields"
+    sparse_fieldsets_actions = ("list", "retrieve")
+
+    def get_requested_fields(self) -> Optional[List[str]]:
+        if self.action not in self.sparse_fieldsets_actions:
+            return None
+
+        # viewsets instantiated to resolve URLs get a plain Django request
+        if not isinstance(self.request, Request):
+            return None
+
+        if not hasattr(self, "_requested_fields"):
+            names = get_query_param_names(
+                self.request,
+                self.fields_query_param,
+                available=self.get_serializer_class().Meta.fields,
+                message=_("Onbekende velden: %s"),
+                code="unknown-fields",
+            )
+            self._requested_fields = names or None
+        return self._requested_fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if not fields:
+            return queryset
+
+        serializer_fields = self.get_serializer_class()().fields
+        return get_sparse_queryset(
+            queryset,
+            [serializer_fields[name] for name in fields],
+            # the lookup field is used in the URLs of (expanded) relations
+            extra=(
+                self.lookup_field,
+                *getattr(self, "cursor_ordering", ()),
+                *getattr(self, "etag_fields", ()),
+            ),
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_requested_fields()
+        if fields:
+            child = getattr(serializer, "child", serializer)
+            for name in list(child.fields):
+                if name not in fields:
+                    child.fields.pop(name)
+        return serializer
+
+
+class ExpandMixin:
+    """
+    Inline the related resources named in the ``expand`` query parameter.
+
+    ``expandable_relations`` maps the name of the relation in the response to
+    the (reverse) relation on the model and the serializer of the related
+    resource. The related resources are retrieved with one query per relation
+    with ``prefetch_related``, for a single object as well as for a page.
+    """
+
+    expand_query_param = "expand"
+    expand_actions = ("list", "retrieve")
+    expandable_relations = {}
+
+    def get_expand(self) -> List[str]:
+        if self.action not in self.expand_actions:
+            return []
+
+        # viewsets instantiated to resolve URLs get a plain Django request
+        if not isinstance(self.request, Request):
+            return []
+
+        if not hasattr(self, "_expand"):
+            self._expand = get_query_param_names(
+                self.request,
+                self.expand_query_param,
+                available=self.expandable_relations,
+                message=_("Onbekende relaties: %s"),
+                code="unknown-expand",
+            )
+        return self._expand
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        for name in self.get_expand():
+            relation, serializer_class = self.expandable_relations[name]
+            queryset = queryset.prefetch_related(
+                models.Prefetch(
+                    relation,
+                    queryset=serializer_class.Meta.model.objects.order_by("pk"),
+                )
+            )
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        child = getattr(serializer, "child", serializer)
+        for name in self.get_expand():
+            relation, serializer_class = self.expandable_relations[name]
+            child.fields[name] = serializer_class(
+                source=relation, many=True, read_only=True
+            )
+        return serializer
+
+    def get_etag(self, instance) -> Optional[str]:
+        # changes of the expanded relations are not covered by the ETag
+        if self.get_expand():
+            return None
+        return super().get_etag(instance)
+
+    def get_list_etag(self, objects, pagination: Optional[dict]) -> Optional[str]:
+        if self.get_expand():
+            return None
+        return super().get_list_etag(objects, pagination)
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional ``GET`` and ``HEAD`` requests from the stored ETags.
+
+    The ETag and the time of the last change are stored with the objects (see
+    :mod:`verzoeken.datamodel.etags`), so an unchanged resource is answered
+    with ``304 Not Modified`` without rendering it. A ``HEAD`` request only
+    gets the headers.
+
+    The ETag of a list is calculated from the ETags of the objects on the page
+    and the pagination. Lists have no ``Last-Modified`` header, since removing
+    an object from the list doesn't change the modification times.
+    """
+
+    # vng_api_common documents the HEAD operations of these actions
+    _conditional_retrieves = ("retrieve",)
+    etag_fields = VERSION_FIELDS
+
+    def initialize_request(self, request, *args, **kwargs):
+        request = super().initialize_request(request, *args, **kwargs)
+        # DRF answers HEAD requests with the GET action without assigning it,
+        # which would bypass the scopes required for the action
+        if self.action is None and request.method == "HEAD":
+            self.action = self.action_map.get("get")
+        return request
+
+    def _hash(self, *values) -> str:
+        # the representation also depends on the URL (host, version and the
+        # query parameters)
+        values = (self.request.build_absolute_uri(), *values)
+        rendered = json.dumps(values, default=str).encode("utf-8")
+        return hashlib.md5(rendered).hexdigest()
+
+    def get_etag(self, instance) -> Optional[str]:
+        return self._hash(instance.get_etag())
+
+    def get_list_etag(self, objects, pagination: Optional[dict]) -> Optional[str]:
+        return self._hash(
+            pagination,
+            [
+                # rows of values, see RowListMixin
+                obj["_etag_value"] if isinstance(obj, dict) else obj.get_etag()
+                for obj in objects
+            ],
+        )
+
+    def get_conditional_response(
+        self, request, etag: Optional[str], last_modified=None, get_response=None
+    ):
+        headers = {}
+        if etag is not None:
+            headers["ETag"] = quote_etag(etag)
+            if last_modified is not None:
+                headers["Last-Modified"] = http_date(last_modified.timestamp())
+
+            response = get_conditional_response(
+                request._request,
+                etag=headers["ETag"],
+                last_modified=last_modified and int(last_modified.timestamp()),
+            )
+            if response is not None:
+                for header, value in headers.items():
+                    response[header] = value
+                return response
+
+        response = Response() if request.method == "HEAD" else get_response()
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = self.get_etag(instance)
+        return self.get_conditional_response(
+            request,
+            etag,
+            last_modified=instance.laatst_gewijzigd,
+            get_response=lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_list_response(
+            queryset,
+            render=lambda objects: self.get_serializer(objects, many=True).data,
+        )
+
+    def get_list_response(self, queryset, render: Callable[[list], list]):
+        page = self.paginate_queryset(queryset)
+        objects = list(queryset) if page is None else page
+
+        def get_response():
+            data = render(objects)
+            if page is None:
+                return Response(data)
+            return self.get_paginated_response(data)
+
+        # the pagination links and count, without the results
+        pagination = None if page is None else self.get_paginated_response([]).data
+        etag = self.get_list_etag(objects, pagination)
+        return self.get_conditional_response(
+            self.request, etag, get_response=get_response
+        )
+
+
+class RowListMixin:
+    """
+    Render the list from rows of column values instead of model instances.
+
+    The page is read with ``.values()`` and rendered with the
+    :class:`~verzoeken.api.rows.RowRepresentation` of the serializer, which
+    renders the same data without instantiating the models or resolving a URL
+    per hyperlinked field. Lists without a row representation (such as with
+    ``expand``) are rendered with the serializer.
+    """
+
+    row_list_actions = ("list",)
+
+    def get_row_representation(self) -> Optional[RowRepresentation]:
+        if self.action not in self.row_list_actions:
+            return None
+        return RowRepresentation.from_serializer(self.get_serializer(many=True).child)
+
+    def list(self, request, *args, **kwargs):
+        representation = self.get_row_representation()
+        if representation is None:
+            return super().list(request, *args, **kwargs)
+
+        # the cursor of a page is read from the columns of its last row
+        get_cursor_ordering = getattr(self.paginator, "get_cursor_ordering", None)
+        columns = (
+            "pk",
+            "_etag_value",
+            *representation.columns,
+            *(get_cursor_ordering(self) if get_cursor_ordering else ()),
+        )
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_list_response(
+            queryset.values(*dict.fromkeys(columns)),
+            render=lambda rows: [representation.render(row) for row in rows],
+        )
+
+    def get_list_etag(self, objects, pagination: Optional[dict]) -> Optional[str]:
+        # rows inserted in bulk get their ETag value when it's first asked for
+        missing = {
+            row["pk"]: row
+            for row in objects
+            if isinstance(row, dict) and not row["_etag_value"]
+        }
+        if missing:
+            model = self.get_queryset().model
+            for obj in model._default_manager.filter(pk__in=missing):
+                missing[obj.pk]["_etag_value"] = obj.get_etag()
+        return super().get_list_etag(objects, pagination)
+
+
+class NotificationQueueMixin:
+    """
+    Queue the notifications instead of sending them during the request.
+
+    See :mod:`verzoeken.sync.notifications`. With ``NOTIFICATIONS_QUEUE``
+    disabled (the default), the notification is sent immediately as before.
+    """
+
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if settings.NOTIFICATIONS_DISABLED or not settings.NOTIFICATIONS_QUEUE:
+            return super().notify(status_code, data, instance=instance)
+
+        if not 200 <= status_code < 300:
+            logger.info(
+                "Not notifying, status code '%s' does not represent success.",
+                status_code,
+            )
+            return
+
+        message = self.construct_message(data, instance=instance)
+        enqueue_notification(message)
+
+    def send_notifications(self, messages: List[dict]) -> None:
+        """
+        Queue or send already constructed notification messages.
+        """
+        if settings.NOTIFICATIONS_DISABLED:
+            return
+
+        if settings.NOTIFICATIONS_QUEUE:
+            enqueue_notifications(messages)
+            return
+
+        client = NotificationsConfig.get_client()
+        for message in messages:
+            try:
+                client.create("notificaties", message)
+            except ClientError:
+                logger.warning(
+                    "Could not deliver message to %s",
+                    client.base_url,
+                    exc_info=True,
+                    extra={"notification_message": message},
+                )
+
+
+class NotificationCreateMixin(
+    NotificationQueueMixin, notifications.NotificationCreateMixin
+):
+    pass
+
+
+class NotificationDestroyMixin(
+    NotificationQueueMixin, notifications.NotificationDestroyMixin
+):
+    pass
+
+
+class NotificationViewSetMixin(
+    NotificationQueueMixin, notifications.NotificationViewSetMixin
+):
+    pass
+
+
+class BulkCreateMixin:
+    """
+    Create a list of objects in a single request.
+
+    When a list is posted to the collection, all objects are validated together
+    and created in one transaction - either all of them are created or none.
+    The objects are inserted in bulk (see
+    :class:`verzoeken.api.serializers.BulkCreateListSerializer`), as are their
+    audit trail rows and queued notifications.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        with transaction.atomic():
+            serializer = self.get_serializer(data=request.data, many=True)
+            serializer.is_valid(raise_exception=True)
+            instances = serializer.save()
+            data = serializer.data
+            self.create_bulk_audittrails(status.HTTP_201_CREATED, instances, data)
+            self.notify_bulk(status.HTTP_201_CREATED, data)
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def build_audittrail(
+        self,
+        status_code,
+        action,
+        version_before_edit,
+        version_after_edit,
+        unique_representation,
+    ) -> AuditTrail:
+        """
+        Build the unsaved audit trail of ``AuditTrailMixin.create_audittrail``.
+
+        Mirrors the upstream implementation, which saves the row right away.
+        """
+        data = version_after_edit if version_after_edit else version_before_edit
+        if self.basename == self.audit.main_resource:
+            main_object = data["url"]
+        else:
+            main_object = self.get_audittrail_main_object_url(
+                data, self.audit.main_resource
+            )
+
+        return AuditTrail(
+            actie=action,
+            actie_weergave=CommonResourceAction.labels.get(action, ""),
+            resultaat=status_code,
+            hoofd_object=main_object,
+            resource=self.basename,
+            resource_url=data["url"],
+            resource_weergave=unique_representation,
+            oud=version_before_edit,
+            nieuw=version_after_edit,
+            **self.get_audittrail_request_fields(),
+        )
+
+    def get_audittrail_request_fields(self) -> dict:
+        """
+        Return the fields of the audit trails that only depend on the request.
+        """
+        if hasattr(self, "_audittrail_request_fields"):
+            return self._audittrail_request_fields
+
+        applications = self.request.jwt_auth.applicaties
+        if len(applications) > 1:
+            logger.warning(
+                "Unexpectedly found %d applications, expected at most one",
+                len(applications),
+            )
+
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        user_id = self.request.jwt_auth.payload.get("user_id", "")
+        if not user_id:
+            user_id = get_header(self.request, "X-NLX-Request-User-Id") or ""
+
+        self._audittrail_request_fields = {
+            "bron": self.audit.component_name,
+            "request_id": get_header(self.request, "X-NLX-Request-Id") or "",
+            "applicatie_id": app_id,
+            "applicatie_weergave": app_presentation,
+            "gebruikers_id": user_id,
+            "gebruikers_weergave": self.request.jwt_auth.payload.get(
+                "user_representation", ""
+            ),
+            "toelichting": get_header(self.request, "X-Audit-Toelichting") or "",
+        }
+        return self._audittrail_request_fields
+
+    def create_audittrail(self, *args, **kwargs) -> None:
+        # single creates and deletes share the rows built for bulk creates
+        self.build_audittrail(*args, **kwargs).save()
+
+    def create_bulk_audittrails(
+        self, status_code: int, instances: List[models.Model], data: List[dict]
+    ) -> None:
+        AuditTrail.objects.bulk_create(
+            [
+                self.build_audittrail(
+                    status_code,
+                    CommonResourceAction.create,
+                    None,
+                    item,
+                    instance.unique_representation(),
+                )
+                for instance, item in zip(instances, data)
+            ]
+        )
+
+    def notify_bulk(self, status_code: int, data: List[dict]) -> None:
+        """
+        Send a notification for each of the created objects.
+
+        The message is constructed once per main object, which requires looking
+        up and serializing the main object.
+        """
+        if settings.NOTIFICATIONS_DISABLED or not 200 <= status_code < 300:
+            return
+
+        main_resource_key = self.get_main_resource_key(self.get_kanaal())
+
+        messages, constructed = [], {}
+        for item in data:
+            main_object_url = item[main_resource_key]
+            if main_object_url not in constructed:
+                constructed[main_object_url] = self.construct_message(item)
+            messages.append(
+                {**constructed[main_object_url], "resourceUrl": item["url"]}
+            )
+        self.send_notifications(messages)
@@ -0,0 +1,193 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework.compat import coreapi, coreschema
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _keyset_filter(fields: Tuple[str, ...], values: list, lookup: str) -> Q:
+    """
+    Build the lexicographic "row comes after/before" condition for a keyset.
+
+    Expressed as ``a >= x AND (a > x OR (b > y ...))`` so that the database can
+    start a range scan on the leading column of a composite index.
+    """
+    field, value = fields[0], values[0]
+    if len(fields) == 1:
+        return Q(**{f"{field}__{lookup}": value})
+
+    return Q(**{f"{field}__{lookup}e": value}) & (
+        Q(**{f"{field}__{lookup}": value})
+        | _keyset_filter(fields[1:], values[1:], lookup)
+    )
+
+
+class CursorPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination with an opt-in keyset (cursor) mode.
+
+    Without the ``cursor`` query parameter, this behaves exactly like
+    :class:`PageNumberPagination`. As soon as ``cursor`` is present (an empty
+    value requests the first page), the results are paginated on the
+    ``cursor_ordering`` of the view (defaulting to ``id``), so every page is
+    fetched with an index range scan instead of ``OFFSET`` and no ``COUNT`` is
+    performed. The response then contains only ``next``, ``previous`` and
+    ``results``.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "De cursor-waarde voor keyset-paginering. Geef een lege waarde op om de "
+        "eerste pagina op te vragen; de links `next` en `previous` bevatten de "
+        "cursor voor de volgende of vorige pagina. Met deze parameter wordt het "
+        "totaal aantal resultaten niet berekend."
+    )
+    invalid_cursor_message = _("Invalid cursor")
+    cursor_ordering = ("id",)
+
+    use_cursor = False
+
+    def get_cursor_ordering(self, view) -> Tuple[str, ...]:
+        return tuple(getattr(view, "cursor_ordering", self.cursor_ordering))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        return self.paginate_queryset_by_cursor(queryset, request, view=view)
+
+    def paginate_queryset_by_cursor(
+        self, queryset: QuerySet, request, view=None
+    ) -> List:
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_cursor_ordering(view)
+
+        position, reverse = self.decode_cursor(queryset, request)
+
+        if reverse:
+            ordering = [f"-{field}" for field in self.ordering]
+            lookup = "lt"
+        else:
+            ordering = list(self.ordering)
+            lookup = "gt"
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(_keyset_filter(self.ordering, position, lookup))
+
+        # fetch one extra row to find out if there is a following page
+        results = list(queryset[: page_size + 1])
+        has_following = len(results) > page_size
+        self.page = results[:page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        return self.page
+
+    def get_position(self, instance) -> list:
+        # the page holds model instances, or rows of values
+        if isinstance(instance, dict):
+            return [instance[field] for field in self.ordering]
+        return [getattr(instance, field) for field in self.ordering]
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        tokens = {"p": [str(value) for value in position]}
+        if reverse:
+            tokens["r"] = 1
+        payload = json.dumps(tokens, separators=(",", ":")).encode("utf-8")
+        cursor = base64.urlsafe_b64encode(payload).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, queryset: QuerySet, request) -> Tuple[Optional[list], bool]:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None, False
+
+        try:
+            tokens = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            raw_position = tokens["p"]
+            if len(raw_position) != len(self.ordering):
+                raise ValueError("Cursor position does not match the ordering")
+
+            opts = queryset.model._meta
+            position = [
+                opts.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, raw_position)
+            ]
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, bool(tokens.get("r"))
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        if not self.page:
+            return replace_query_param(self.base_url, self.cursor_query_param, "")
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.use_cursor:
+            return super().get_previous_link()
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return replace_query_param(self.base_url, self.cursor_query_param, "")
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_schema_fields(self, view):
+        fields = super().get_schema_fields(view)
+        return fields + [
+            coreapi.Field(
+                name=self.cursor_query_param,
+                required=False,
+                location="query",
+                schema=coreschema.String(
+                    title="Cursor", description=str(self.cursor_query_description)
+                ),
+            )
+        ]
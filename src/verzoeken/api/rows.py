@@ -0,0 +1,116 @@
+"""
+Render API resources from rows of column values, without model instances.
+
+Rendering a page with the serializers creates a model instance for every row
+(and for every related object) and resolves the URL of every hyperlinked field
+with ``reverse()``. The representation of a resource only depends on a few
+columns though: :class:`RowRepresentation` selects those with ``.values()`` -
+following the relations to the UUIDs of the related objects - and builds the
+URLs by putting the UUID in a URL template, resolved once per request.
+
+The row representation is derived from a serializer and renders the same data.
+Serializers with fields that don't map onto a single column (such as method
+fields or nested lists) have no row representation.
+"""
+import uuid
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple, Union
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+from rest_framework import serializers
+
+# stands in for the lookup value when resolving the URL template
+PLACEHOLDER = str(uuid.uuid4())
+
+
+def _get_url_template(field: serializers.HyperlinkedRelatedField) -> Callable:
+    url = field.to_representation(SimpleNamespace(**{field.lookup_field: PLACEHOLDER}))
+    prefix, suffix = str(url).split(PLACEHOLDER)
+    return lambda value: f"{prefix}{value}{suffix}"
+
+
+def _get_model_field(model, source: str) -> Optional[models.Field]:
+    try:
+        return model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+
+
+class RowRepresentation:
+    """
+    Render a row of values as the serializer would render the object.
+    """
+
+    def __init__(
+        self, items: List[Tuple[str, Union[str, "RowRepresentation"], Callable]]
+    ):
+        # (name, column or nested representation, convert)
+        self.items = items
+
+    @property
+    def columns(self) -> List[str]:
+        columns = []
+        for _name, column, _convert in self.items:
+            if isinstance(column, RowRepresentation):
+                columns += column.columns
+            else:
+                columns.append(column)
+        return columns
+
+    @classmethod
+    def from_serializer(
+        cls, serializer: serializers.Serializer, model=None
+    ) -> Optional["RowRepresentation"]:
+        model = model or serializer.Meta.model
+
+        items = []
+        for field in serializer._readable_fields:
+            if isinstance(field, serializers.HyperlinkedIdentityField):
+                column, convert = field.lookup_field, _get_url_template(field)
+            elif isinstance(field, serializers.HyperlinkedRelatedField):
+                model_field = _get_model_field(model, field.source)
+                if model_field is None or not (
+                    model_field.many_to_one or model_field.one_to_one
+                ):
+                    return None
+                column = f"{field.source}__{field.lookup_field}"
+                convert = _get_url_template(field)
+            elif isinstance(field, serializers.Serializer) and field.source == "*":
+                column = cls.from_serializer(field, model=model)
+                if column is None:
+                    return None
+                convert = column.render
+            elif isinstance(
+                field,
+                (
+                    serializers.BaseSerializer,
+                    serializers.RelatedField,
+                    serializers.ManyRelatedField,
+                    serializers.SerializerMethodField,
+                ),
+            ):
+                return None
+            else:
+                model_field = _get_model_field(model, field.source)
+                if model_field is None or not model_field.concrete:
+                    return None
+                if model_field.is_relation:
+                    return None
+                column, convert = field.source, field.to_representation
+
+            items.append((field.field_name, column, convert))
+        return cls(items)
+
+    def render(self, row: dict) -> OrderedDict:
+        data = OrderedDict()
+        for name, column, convert in self.items:
+            if isinstance(column, RowRepresentation):
+                data[name] = convert(row)
+                continue
+
+            value = row[column]
+            data[name] = None if value is None else convert(value)
+        return data
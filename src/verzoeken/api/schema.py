@@ -1,7 +1,9 @@
 from django.conf import settings
 
 from drf_yasg import openapi
+from vng_api_common.inspectors.view import AutoSchema as _AutoSchema
 from vng_api_common.notifications.utils import notification_documentation
+from vng_api_common.utils import underscore_to_camel
 
 from .kanalen import KANAAL_VERZOEKEN
 
@@ -45,3 +47,41 @@ info = openapi.Info(
         name="EUPL 1.2", url="https://opensource.org/licenses/EUPL-1.2"
     ),
 )
+
+
+class AutoSchema(_AutoSchema):
+    def get_query_parameters(self):
+        parameters = super().get_query_parameters()
+
+        actions = getattr(self.view, "sparse_fieldsets_actions", ())
+        if getattr(self.view, "action", None) in actions:
+            fields = self.view.get_serializer_class().Meta.fields
+            parameters.append(
+                openapi.Parameter(
+                    self.view.fields_query_param,
+                    openapi.IN_QUERY,
+                    description=(
+                        "Geef alleen deze velden terug, gescheiden door komma's. "
+                        "Mogelijke velden: "
+                        + ", ".join(f"`{underscore_to_camel(name)}`" for name in fields)
+                    ),
+                    type=openapi.TYPE_STRING,
+                )
+            )
+
+        actions = getattr(self.view, "expand_actions", ())
+        if getattr(self.view, "action", None) in actions:
+            relations = self.view.expandable_relations
+            parameters.append(
+                openapi.Parameter(
+                    self.view.expand_query_param,
+                    openapi.IN_QUERY,
+                    description=(
+                        "Neem deze relaties direct op in het antwoord, gescheiden "
+                        "door komma's. Mogelijke relaties: "
+                        + ", ".join(f"`{name}`" for name in relations)
+                    ),
+                    type=openapi.TYPE_STRING,
+                )
+            )
+        return parameters
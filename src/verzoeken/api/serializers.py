@@ -1,16 +1,21 @@
+import copy
 import logging
+from collections import OrderedDict
 
 from django.conf import settings
+from django.utils.functional import lazy
+from django.utils.text import format_lazy
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.fields import empty
 from rest_framework.settings import api_settings
 from rest_framework.validators import UniqueTogetherValidator
 from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import (
     IsImmutableValidator,
-    ResourceValidator,
     UniekeIdentificatieValidator,
     URLValidator,
 )
@@ -30,14 +35,135 @@ from verzoeken.datamodel.models import (
     VerzoekInformatieObject,
     VerzoekProduct,
 )
-from verzoeken.sync.signals import SyncError
+from verzoeken.sync.drc import SyncError
 
-from .validators import ObjectVerzoekCreateValidator
+from .validators import CachedResourceValidator, ObjectVerzoekCreateValidator
 
 logger = logging.getLogger(__name__)
 
 
-class VerzoekSerializer(serializers.HyperlinkedModelSerializer):
+def get_choices_help_text(model: str, field: str, choices) -> str:
+    """
+    Document the choices of a field after its help text, when it's rendered.
+    """
+    return format_lazy(
+        "{}\n\n{}",
+        get_help_text(model, field),
+        lazy(add_choice_values_help_text, str)(choices),
+    )
+
+
+class CachedFieldsMixin:
+    """
+    Build the fields of a model serializer once per serializer class.
+
+    ``ModelSerializer.get_fields`` introspects the model and instantiates the
+    fields on every instantiation, which is on every request. The fields are
+    built for the first instance and kept (unbound) on the class, every
+    instance binds its own shallow copies. Like with ``deepcopy``, the
+    validators are shared. Nested serializers have fields of their own and
+    are copied completely.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # not inherited, subclasses have fields of their own
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+
+        return OrderedDict(
+            (
+                name,
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field),
+            )
+            for name, field in fields.items()
+        )
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Validate and create a list of objects in one pass.
+
+    The unique together constraints of the child serializer are checked with a
+    single query for the whole list (and within the list itself), instead of a
+    query per object, and the objects are inserted with a single query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        validators = self.child.validators
+        self.unique_together_validators = [
+            validator
+            for validator in validators
+            if isinstance(validator, UniqueTogetherValidator)
+        ]
+        self.child.validators = [
+            validator
+            for validator in validators
+            if not isinstance(validator, UniqueTogetherValidator)
+        ]
+
+    def run_validation(self, data=empty):
+        try:
+            return super().run_validation(data)
+        except serializers.ValidationError as exc:
+            if not isinstance(exc.detail, list):
+                raise
+            # the error responses are keyed on field name, so key on the index
+            raise serializers.ValidationError(
+                {
+                    str(index): item_errors
+                    for index, item_errors in enumerate(exc.detail)
+                    if item_errors
+                }
+            ) from exc
+
+    def to_internal_value(self, data):
+        validated_data = super().to_internal_value(data)
+
+        errors = [{} for _item in validated_data]
+        for validator in self.unique_together_validators:
+            self._check_unique_together(validator, validated_data, errors)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return validated_data
+
+    @staticmethod
+    def _check_unique_together(validator, validated_data, errors) -> None:
+        fields = validator.fields
+        keys = [
+            tuple(getattr(attrs[field], "pk", attrs[field]) for field in fields)
+            for attrs in validated_data
+        ]
+        lookup = {
+            f"{field}__in": {key[index] for key in keys}
+            for index, field in enumerate(fields)
+        }
+        existing = set(validator.queryset.filter(**lookup).values_list(*fields))
+
+        message = validator.message.format(field_names=", ".join(fields))
+        seen = set()
+        for key, item_errors in zip(keys, errors):
+            if key in existing or key in seen:
+                item_errors.setdefault(api_settings.NON_FIELD_ERRORS_KEY, []).append(
+                    ErrorDetail(message, code="unique")
+                )
+            seen.add(key)
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objects = [model(**attrs) for attrs in validated_data]
+        for obj in objects:
+            obj.update_etag()
+        return model.objects.bulk_create(objects)
+
+
+class VerzoekSerializer(CachedFieldsMixin, serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Verzoek
         fields = (
@@ -57,6 +183,11 @@ class VerzoekSerializer(serializers.HyperlinkedModelSerializer):
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "identificatie": {"validators": [IsImmutableValidator()]},
+            "status": {
+                "help_text": get_choices_help_text(
+                    "datamodel.Verzoek", "status", VerzoekStatus
+                )
+            },
             "in_te_trekken_verzoek": {
                 "lookup_field": "uuid",
                 "min_length": 1,
@@ -97,14 +228,10 @@ class VerzoekSerializer(serializers.HyperlinkedModelSerializer):
         # Replace a default "unique together" constraint.
         validators = [UniekeIdentificatieValidator("bronorganisatie", "identificatie")]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(VerzoekStatus)
-        self.fields["status"].help_text += f"\n\n{value_display_mapping}"
-
 
-class ObjectVerzoekSerializer(serializers.HyperlinkedModelSerializer):
+class ObjectVerzoekSerializer(
+    CachedFieldsMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = ObjectVerzoek
         fields = ("url", "verzoek", "object", "object_type")
@@ -117,21 +244,19 @@ class ObjectVerzoekSerializer(serializers.HyperlinkedModelSerializer):
             "object": {
                 "validators": [IsImmutableValidator()],
             },
-            "object_type": {"validators": [IsImmutableValidator()]},
+            "object_type": {
+                "validators": [IsImmutableValidator()],
+                "help_text": get_choices_help_text(
+                    "datamodel.ObjectVerzoek", "object_type", ObjectTypes
+                ),
+            },
         }
         validators = [ObjectVerzoekCreateValidator()]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(ObjectTypes)
-        self.fields["object_type"].help_text += f"\n\n{value_display_mapping}"
-
-        if not hasattr(self, "initial_data"):
-            return
 
-
-class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class VerzoekInformatieObjectSerializer(
+    CachedFieldsMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = VerzoekInformatieObject
         fields = ("url", "informatieobject", "verzoek")
@@ -145,7 +270,7 @@ class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             "url": {"lookup_field": "uuid"},
             "informatieobject": {
                 "validators": [
-                    ResourceValidator(
+                    CachedResourceValidator(
                         "EnkelvoudigInformatieObject",
                         settings.DRC_API_SPEC,
                         get_auth=get_auth,
@@ -162,6 +287,7 @@ class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         try:
             return super().save(**kwargs)
         except SyncError as sync_error:
+            # only raised when synchronising during the request, see DRC_SYNC_OUTBOX.
             # delete the object again
             VerzoekInformatieObject.objects.filter(
                 informatieobject=self.validated_data["informatieobject"],
@@ -172,9 +298,12 @@ class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             ) from sync_error
 
 
-class VerzoekContactMomentSerializer(serializers.HyperlinkedModelSerializer):
+class VerzoekContactMomentSerializer(
+    CachedFieldsMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = VerzoekContactMoment
+        list_serializer_class = BulkCreateListSerializer
         fields = ("url", "contactmoment", "verzoek")
         validators = [
             UniqueTogetherValidator(
@@ -197,7 +326,9 @@ class ProductSerializer(serializers.Serializer):
     )
 
 
-class VerzoekProductSerializer(serializers.HyperlinkedModelSerializer):
+class VerzoekProductSerializer(
+    CachedFieldsMixin, serializers.HyperlinkedModelSerializer
+):
     product_identificatie = ProductSerializer(
         source="*",
         required=False,
@@ -211,6 +342,7 @@ class VerzoekProductSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = VerzoekProduct
+        list_serializer_class = BulkCreateListSerializer
         fields = ("url", "verzoek", "product", "product_identificatie")
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
@@ -242,9 +374,10 @@ class VerzoekProductSerializer(serializers.HyperlinkedModelSerializer):
         return validated_attrs
 
 
-class KlantVerzoekSerializer(serializers.HyperlinkedModelSerializer):
+class KlantVerzoekSerializer(CachedFieldsMixin, serializers.HyperlinkedModelSerializer):
     class Meta:
         model = KlantVerzoek
+        list_serializer_class = BulkCreateListSerializer
         fields = ("url", "klant", "verzoek", "rol", "indicatie_machtiging")
         validators = [
             UniqueTogetherValidator(
@@ -256,17 +389,16 @@ class KlantVerzoekSerializer(serializers.HyperlinkedModelSerializer):
             "url": {"lookup_field": "uuid"},
             "verzoek": {"lookup_field": "uuid", "validators": [IsImmutableValidator()]},
             "klant": {"validators": [IsImmutableValidator(), URLValidator()]},
+            "rol": {
+                "help_text": get_choices_help_text(
+                    "datamodel.KlantVerzoek", "rol", KlantRol
+                )
+            },
+            "indicatie_machtiging": {
+                "help_text": get_choices_help_text(
+                    "datamodel.KlantVerzoek",
+                    "indicatie_machtiging",
+                    IndicatieMachtiging,
+                )
+            },
         }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        rol_machtiging_display_mapping = add_choice_values_help_text(KlantRol)
-        self.fields["rol"].help_text += f"\n\n{rol_machtiging_display_mapping}"
-
-        indicatie_machtiging_display_mapping = add_choice_values_help_text(
-            IndicatieMachtiging
-        )
-        self.fields[
-            "indicatie_machtiging"
-        ].help_text += f"\n\n{indicatie_machtiging_display_mapping}"
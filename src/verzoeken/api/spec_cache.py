@@ -0,0 +1,79 @@
+"""
+Serve the OAS specs of the remote APIs from local files.
+
+:class:`vng_api_common.validators.ResourceValidator` fetches and parses the
+(YAML) spec given by its URL to check the shape of the remote resource. The
+specs we validate against are stored as compact JSON files, only holding the
+component schemas, and loaded into the schema fetcher cache on startup, so that
+validation doesn't depend on the network.
+
+The files are part of the source tree. Regenerate them with the
+``refresh_api_specs`` management command when the spec settings change.
+"""
+import json
+import logging
+import os
+
+from django.conf import settings
+
+import requests
+import yaml
+from vng_api_common.oas import fetcher
+
+logger = logging.getLogger(__name__)
+
+SPEC_SETTINGS = ("DRC_API_SPEC", "ZRC_API_SPEC")
+
+
+def get_path(setting: str) -> str:
+    return os.path.join(settings.API_SPECS_DIR, f"{setting.lower()}.json")
+
+
+def compile_spec(spec: dict) -> dict:
+    """
+    Strip the spec down to the parts used to validate the shape of a resource.
+    """
+    return {
+        "openapi": spec["openapi"],
+        "components": {"schemas": spec["components"]["schemas"]},
+    }
+
+
+def refresh_spec(setting: str) -> str:
+    url = getattr(settings, setting)
+    response = requests.get(url, timeout=settings.ZGW_CLIENT_READ_TIMEOUT)
+    response.raise_for_status()
+
+    spec = yaml.safe_load(response.content)
+    if not spec.get("openapi", "").startswith("3.0"):
+        raise ValueError(f"Unsupported spec version for {url}")
+
+    path = get_path(setting)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as outfile:
+        json.dump({"url": url, "spec": compile_spec(spec)}, outfile)
+    return path
+
+
+def load_specs() -> None:
+    for setting in SPEC_SETTINGS:
+        url = getattr(settings, setting)
+        path = get_path(setting)
+        if not os.path.exists(path):
+            logger.warning(
+                "No local spec for %s, it will be fetched from %s", setting, url
+            )
+            continue
+
+        with open(path) as infile:
+            data = json.load(infile)
+
+        if data["url"] != url:
+            logger.warning(
+                "The local spec for %s is outdated, it will be fetched from %s",
+                setting,
+                url,
+            )
+            continue
+
+        fetcher.cache[url] = data["spec"]
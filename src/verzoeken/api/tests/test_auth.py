@@ -17,8 +17,16 @@ class KlantScopeForbiddenTests(AuthCheckMixin, APITestCase):
         urls = [
             reverse("verzoek-list"),
             reverse(verzoek),
+            reverse("verzoek-export"),
         ]
 
         for url in urls:
             with self.subTest(url=url):
                 self.assertForbidden(url, method="get")
+
+    def test_cannot_head_without_correct_scope(self):
+        verzoek = VerzoekFactory.create()
+
+        for url in [reverse("verzoek-list"), reverse(verzoek)]:
+            with self.subTest(url=url):
+                self.assertForbidden(url, method="head")
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from verzoeken.datamodel.models import KlantVerzoek, Verzoek
+
+from ..benchmark import compare
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_benchmark(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.json")
+
+            call_command(
+                "benchmark",
+                verzoeken=3,
+                relations=2,
+                repeat=2,
+                serializer_objects=3,
+                output=path,
+            )
+
+            with open(path) as infile:
+                results = json.load(infile)
+
+        self.assertEqual(results["volumes"], {"verzoeken": 3, "relations": 2})
+        for name, result in results["results"].items():
+            with self.subTest(scenario=name):
+                self.assertLess(result.get("status", 200), 300)
+        self.assertEqual(results["results"]["verzoek.list"]["status"], 200)
+        self.assertEqual(results["results"]["klantverzoek.filter"]["status"], 200)
+        self.assertEqual(results["results"]["klantverzoek.create"]["status"], 201)
+        self.assertEqual(results["results"]["verzoekproduct.create"]["status"], 201)
+        self.assertEqual(
+            results["results"]["verzoekserializer.throughput"]["objects"], 3
+        )
+        self.assertEqual(results["results"]["serializers.setup"]["objects"], 600)
+        # the generated data is rolled back
+        self.assertFalse(Verzoek.objects.exists())
+        self.assertFalse(KlantVerzoek.objects.exists())
+
+    def test_compare_command_fails_on_regression(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as baseline:
+            json.dump(
+                {"results": {"verzoek.list": {"median_ms": 0.01, "queries": 0}}},
+                baseline,
+            )
+            baseline.flush()
+
+            with self.assertRaisesMessage(CommandError, "verzoek.list: queries"):
+                call_command(
+                    "benchmark",
+                    verzoeken=1,
+                    repeat=1,
+                    scenarios=["verzoek.list"],
+                    compare=baseline.name,
+                    stdout=StringIO(),
+                )
+
+
+class CompareTests(SimpleTestCase):
+    baseline = {
+        "results": {
+            "verzoek.list": {"median_ms": 10.0, "queries": 5},
+            "verzoekserializer.throughput": {"objects_per_second": 1000},
+        }
+    }
+
+    def test_no_regressions(self):
+        current = {
+            "results": {
+                "verzoek.list": {"median_ms": 11.0, "queries": 5},
+                "verzoek.retrieve": {"median_ms": 5.0, "queries": 4},
+                "verzoekserializer.throughput": {"objects_per_second": 900},
+            }
+        }
+
+        self.assertEqual(compare(self.baseline, current, threshold=0.2), [])
+
+    def test_regressions(self):
+        current = {
+            "results": {
+                "verzoek.list": {"median_ms": 15.0, "queries": 6},
+                "verzoekserializer.throughput": {"objects_per_second": 500},
+            }
+        }
+
+        self.assertEqual(
+            compare(self.baseline, current, threshold=0.2),
+            [
+                "verzoek.list: median 10.0ms -> 15.0ms",
+                "verzoek.list: queries 5 -> 6",
+                "verzoekserializer.throughput: 1000 -> 500 objects per second",
+            ],
+        )
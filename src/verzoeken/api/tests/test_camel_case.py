@@ -0,0 +1,159 @@
+import io
+import json
+from decimal import Decimal
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as _CamelCaseJSONParser,
+)
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as _CamelCaseJSONRenderer,
+)
+from djangorestframework_camel_case.util import (
+    camelize as _camelize,
+    underscoreize as _underscoreize,
+)
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.models import Verzoek, VerzoekProduct
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    VerzoekFactory,
+    VerzoekProductFactory,
+)
+
+from .. import camel_case
+from ..camel_case import (
+    CamelCaseJSONParser,
+    CamelCaseJSONRenderer,
+    camelize,
+    get_key_maps,
+    underscoreize,
+)
+
+DATA = {
+    "in_te_trekken_verzoek": None,
+    "product_identificatie": {"code": "P1", "field_2": [1, 2.5]},
+    _("lazy_key"): _("lazy value"),
+    "unknown_key_42": ({"nested_list": ["a_b", {"x_1": True}]},),
+    3: "number_key",
+    "key__double_": Decimal("1.5"),
+    "camelCase": "kept",
+}
+
+
+class CamelCaseTests(APITestCase):
+    def test_key_maps(self):
+        camelized, underscored = get_key_maps()
+
+        self.assertEqual(camelized["in_te_trekken_verzoek"], "inTeTrekkenVerzoek")
+        self.assertEqual(underscored["inTeTrekkenVerzoek"], "in_te_trekken_verzoek")
+        # fields of nested serializers
+        self.assertEqual(camelized["product_identificatie"], "productIdentificatie")
+
+    def test_camelize(self):
+        self.assertEqual(camelize(DATA), _camelize(DATA))
+        self.assertEqual(list(camelize(DATA)), list(_camelize(DATA)))
+
+    def test_camelize_values(self):
+        values = [_("lazy"), "a_b", ("x", None), {"a_b"}, 1.5, b"ab"]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(camelize(value), _camelize(value))
+
+        self.assertEqual(camelize(iter([{"a_b": 1}])), [{"aB": 1}])
+
+    def test_underscoreize(self):
+        data = json.loads(json.dumps(_camelize(DATA), default=str))
+        data["address2"] = [{"huisnummer12a": 1, "URL": "x"}]
+
+        self.assertEqual(underscoreize(data), _underscoreize(data))
+
+    def test_all_keys(self):
+        camelized, underscored = get_key_maps()
+        for name, camel in camelized.items():
+            with self.subTest(name=name):
+                self.assertEqual(camelize({name: 1}), _camelize({name: 1}))
+        for camel in underscored:
+            with self.subTest(camel=camel):
+                self.assertEqual(underscoreize({camel: 1}), _underscoreize({camel: 1}))
+
+    def test_parser(self):
+        content = b'{"inTeTrekkenVerzoek": "http://a_b", "productIdentificatie": {}}'
+
+        data = CamelCaseJSONParser().parse(io.BytesIO(content))
+
+        self.assertEqual(data, _CamelCaseJSONParser().parse(io.BytesIO(content)))
+        with self.assertRaises(ParseError):
+            CamelCaseJSONParser().parse(io.BytesIO(b"{"))
+
+    def test_renderer(self):
+        for media_type in (None, "application/json; indent=4"):
+            with self.subTest(media_type=media_type):
+                self.assertEqual(
+                    CamelCaseJSONRenderer().render(DATA, media_type),
+                    _CamelCaseJSONRenderer().render(DATA, media_type),
+                )
+
+    @skipIf(camel_case.orjson is None, "orjson is not installed")
+    @override_settings(JSON_BACKEND="orjson")
+    def test_renderer_orjson(self):
+        data = {"tekst_1": "  é", "uuid": Decimal("1.5")}
+
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(data),
+            _CamelCaseJSONRenderer().render(data),
+        )
+
+    @override_settings(JSON_BACKEND="orjson")
+    def test_renderer_orjson_not_installed(self):
+        with patch.object(camel_case, "orjson", None):
+            with self.assertRaises(ImproperlyConfigured):
+                CamelCaseJSONRenderer().render({})
+
+
+class CamelCaseAPITests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_same_responses(self):
+        verzoek = VerzoekFactory.create()
+        KlantVerzoekFactory.create(verzoek=verzoek)
+        VerzoekProductFactory.create(verzoek=verzoek)
+        urls = [
+            (reverse(Verzoek), {"expand": "klantverzoeken"}),
+            (reverse(verzoek), None),
+            (reverse(VerzoekProduct), None),
+        ]
+
+        for url, params in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url, params)
+                with patch("verzoeken.api.camel_case.camelize", side_effect=_camelize):
+                    expected = self.client.get(url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.content, expected.content)
+
+    def test_create(self):
+        in_te_trekken_verzoek = VerzoekFactory.create()
+        data = {
+            "bronorganisatie": "423182687",
+            "status": VerzoekStatus.ontvangen,
+            "tekst": "some text",
+            "inTeTrekkenVerzoek": reverse(in_te_trekken_verzoek),
+        }
+
+        response = self.client.post(reverse(Verzoek), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        verzoek = Verzoek.objects.get(bronorganisatie="423182687")
+        self.assertEqual(verzoek.in_te_trekken_verzoek, in_te_trekken_verzoek)
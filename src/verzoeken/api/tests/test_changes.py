@@ -0,0 +1,136 @@
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
+
+from verzoeken.datamodel.models import Tombstone
+from verzoeken.datamodel.tests.factories import KlantVerzoekFactory, VerzoekFactory
+
+from ..viewsets import WijzigingViewSet
+
+
+@override_settings(CHANGE_FEED_DELAY=0)
+class ChangeFeedTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("wijziging-list")
+
+    def test_changes(self):
+        verzoek = VerzoekFactory.create()
+        klantverzoek = KlantVerzoekFactory.create(verzoek=verzoek)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertTrue(data["token"])
+        self.assertEqual(
+            [(result["type"], result["url"]) for result in data["results"]],
+            [
+                ("verzoek", f"http://testserver{reverse(verzoek)}"),
+                ("klantverzoek", f"http://testserver{reverse(klantverzoek)}"),
+            ],
+        )
+        result = data["results"][1]
+        self.assertFalse(result["verwijderd"])
+        self.assertEqual(result["resource"]["klant"], klantverzoek.klant)
+        self.assertEqual(
+            result["resource"]["verzoek"], f"http://testserver{reverse(verzoek)}"
+        )
+
+    def test_changes_since_token(self):
+        verzoek1, verzoek2 = VerzoekFactory.create_batch(2)
+        token = self.client.get(self.url).json()["token"]
+
+        response = self.client.get(self.url, {"token": token})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [])
+        self.assertEqual(response.json()["token"], token)
+
+        verzoek1.tekst = "gewijzigd"
+        verzoek1.save()
+        response = self.client.get(self.url, {"token": token})
+
+        self.assertEqual(
+            [result["url"] for result in response.json()["results"]],
+            [f"http://testserver{reverse(verzoek1)}"],
+        )
+
+    @patch.object(WijzigingViewSet, "page_size", 2)
+    def test_pages(self):
+        verzoeken = VerzoekFactory.create_batch(3)
+
+        response = self.client.get(self.url)
+
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNotNone(data["next"])
+
+        response = self.client.get(data["next"])
+
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertEqual(
+            data["results"][0]["url"], f"http://testserver{reverse(verzoeken[2])}"
+        )
+
+    def test_deletions(self):
+        klantverzoek = KlantVerzoekFactory.create()
+        verzoek = klantverzoek.verzoek
+        token = self.client.get(self.url).json()["token"]
+
+        verzoek.delete()
+        response = self.client.get(self.url, {"token": token})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            {(result["type"], result["url"]) for result in results},
+            {
+                ("verzoek", f"http://testserver{reverse(verzoek)}"),
+                ("klantverzoek", f"http://testserver{reverse(klantverzoek)}"),
+            },
+        )
+        for result in results:
+            self.assertTrue(result["verwijderd"])
+            self.assertIsNone(result["resource"])
+
+    def test_query_count(self):
+        for verzoek in VerzoekFactory.create_batch(3):
+            KlantVerzoekFactory.create_batch(2, verzoek=verzoek)
+        Tombstone.objects.create(resource="objectverzoek", uuid=uuid.uuid4())
+
+        # 3 queries for the authorization, 1 per resource and 1 for the tombstones
+        with self.assertNumQueries(10):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 10)
+
+    @override_settings(CHANGE_FEED_DELAY=5)
+    def test_recent_changes_are_delayed(self):
+        VerzoekFactory.create()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json()["results"], [])
+
+        with freeze_time(timezone.now() + timedelta(seconds=10)):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_invalid_token(self):
+        response = self.client.get(self.url, {"token": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "token")
+        self.assertEqual(error["code"], "invalid-token")
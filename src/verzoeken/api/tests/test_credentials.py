@@ -0,0 +1,93 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase, override_settings
+
+from vng_api_common.models import APICredential
+
+from verzoeken.api.auth import clear_credentials_cache, get_auth, get_client_auth
+from verzoeken.api.utils import get_absolute_url
+
+ZAAK = "https://zrc.nl/api/v1/zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+
+
+class CredentialsCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        clear_credentials_cache()
+        self.addCleanup(clear_credentials_cache)
+
+    def test_longest_api_root_matches(self):
+        APICredential.objects.create(
+            api_root="https://zrc.nl/", client_id="zrc", secret="secret"
+        )
+        APICredential.objects.create(
+            api_root="https://zrc.nl/api/v1/", client_id="zrc-v1", secret="secret"
+        )
+
+        auth = get_client_auth(ZAAK)
+
+        self.assertEqual(auth.client_id, "zrc-v1")
+        self.assertIsNone(get_client_auth("https://drc.nl/api/v1/"))
+        self.assertEqual(get_auth("https://drc.nl/api/v1/"), {})
+
+    def test_lookups_are_cached(self):
+        APICredential.objects.create(
+            api_root="https://zrc.nl/api/v1/", client_id="zrc", secret="secret"
+        )
+        get_client_auth(ZAAK)
+
+        with self.assertNumQueries(0):
+            auth = get_client_auth(ZAAK)
+            get_auth(ZAAK)
+
+        self.assertEqual(auth.client_id, "zrc")
+
+    def test_changes_invalidate_cache(self):
+        credential = APICredential.objects.create(
+            api_root="https://zrc.nl/api/v1/", client_id="zrc", secret="secret"
+        )
+        get_client_auth(ZAAK)
+
+        credential.client_id = "other"
+        credential.save()
+        self.assertEqual(get_client_auth(ZAAK).client_id, "other")
+
+        credential.delete()
+        self.assertIsNone(get_client_auth(ZAAK))
+
+    @override_settings(API_CREDENTIALS_CACHE_TIMEOUT=0)
+    def test_cache_expires(self):
+        get_client_auth(ZAAK)
+
+        # bypasses the signals, as a change in another process would
+        APICredential.objects.bulk_create(
+            [APICredential(api_root="https://zrc.nl/", client_id="zrc", secret="s")]
+        )
+
+        self.assertEqual(get_client_auth(ZAAK).client_id, "zrc")
+
+
+class AbsoluteUrlTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        Site.objects.clear_cache()
+        self.addCleanup(Site.objects.clear_cache)
+
+    def test_site_is_cached(self):
+        get_absolute_url("verzoek-detail", uuid="4f8b4811-5d7e-4e9b-8201-b35f5101f891")
+
+        with self.assertNumQueries(0):
+            url = get_absolute_url(
+                "verzoek-detail", uuid="4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+            )
+
+        self.assertEqual(
+            url,
+            "https://example.com/api/v1/verzoeken/4f8b4811-5d7e-4e9b-8201-b35f5101f891",
+        )
+
+        Site.objects.update_or_create(pk=1, defaults={"domain": "verzoeken.nl"})
+        self.assertTrue(
+            get_absolute_url("verzoek-detail", uuid="1").startswith(
+                "https://verzoeken.nl/"
+            )
+        )
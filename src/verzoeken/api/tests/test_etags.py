@@ -0,0 +1,158 @@
+from unittest.mock import patch
+
+from django.utils.http import http_date
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import KlantVerzoek, Verzoek
+from verzoeken.datamodel.tests.factories import KlantVerzoekFactory, VerzoekFactory
+
+from ..serializers import VerzoekSerializer
+
+KLANT = "http://some.klanten.nl/api/v1/klanten/12345"
+
+
+class VerzoekETagTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_read_etag(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(reverse(verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"])
+        self.assertEqual(
+            response["Last-Modified"], http_date(verzoek.laatst_gewijzigd.timestamp())
+        )
+
+    def test_read_not_modified(self):
+        verzoek = VerzoekFactory.create()
+        etag = self.client.get(reverse(verzoek))["ETag"]
+
+        with patch.object(VerzoekSerializer, "to_representation") as m:
+            response = self.client.get(reverse(verzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        m.assert_not_called()
+
+    def test_etag_changes_with_verzoek(self):
+        verzoek = VerzoekFactory.create()
+        etag = self.client.get(reverse(verzoek))["ETag"]
+
+        verzoek.tekst = "gewijzigd"
+        verzoek.save()
+        response = self.client.get(reverse(verzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_changes_with_intrekkende_verzoek(self):
+        verzoek = VerzoekFactory.create()
+        etag = self.client.get(reverse(verzoek))["ETag"]
+
+        intrekkende_verzoek = VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        response = self.client.get(reverse(verzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_etag = response["ETag"]
+        self.assertNotEqual(new_etag, etag)
+
+        intrekkende_verzoek.delete()
+        response = self.client.get(reverse(verzoek), HTTP_IF_NONE_MATCH=new_etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_depends_on_query(self):
+        verzoek = VerzoekFactory.create()
+        etag = self.client.get(reverse(verzoek))["ETag"]
+
+        response = self.client.get(
+            reverse(verzoek), {"fields": "url"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_no_etag_when_expanding(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(reverse(verzoek), {"expand": "klantverzoeken"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_head(self):
+        verzoek = VerzoekFactory.create()
+        etag = self.client.get(reverse(verzoek))["ETag"]
+
+        with patch.object(VerzoekSerializer, "to_representation") as m:
+            response = self.client.head(reverse(verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        m.assert_not_called()
+
+    def test_list_not_modified(self):
+        VerzoekFactory.create_batch(2)
+        etag = self.client.get(reverse(Verzoek))["ETag"]
+
+        with patch.object(VerzoekSerializer, "to_representation") as m:
+            response = self.client.get(reverse(Verzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        m.assert_not_called()
+
+        VerzoekFactory.create()
+        response = self.client.get(reverse(Verzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_missing_etag_is_calculated(self):
+        Verzoek.objects.bulk_create([VerzoekFactory.build(identificatie="1")])
+        verzoek = Verzoek.objects.get()
+        self.assertEqual(verzoek._etag_value, "")
+
+        response = self.client.get(reverse(verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        verzoek.refresh_from_db()
+        self.assertNotEqual(verzoek._etag_value, "")
+        response = self.client.get(
+            reverse(verzoek), HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class KlantVerzoekETagTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_read_not_modified(self):
+        klantverzoek = KlantVerzoekFactory.create()
+        etag = self.client.get(reverse(klantverzoek))["ETag"]
+
+        response = self.client.get(reverse(klantverzoek), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_bulk_created_relations_have_etags(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+        klanten = [f"{KLANT}{index}" for index in range(2)]
+
+        with requests_mock.Mocker() as m:
+            for klant in klanten:
+                m.get(klant, json={})
+            response = self.client.post(
+                reverse(KlantVerzoek),
+                [{"verzoek": verzoek_url, "klant": klant} for klant in klanten],
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("", KlantVerzoek.objects.values_list("_etag_value", flat=True))
@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekProductFactory,
+)
+
+EXPORT_URL = "/api/v1/verzoeken/export"
+
+
+class VerzoekExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_content(self, response) -> str:
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_export_ndjson(self):
+        verzoek1, verzoek2 = VerzoekFactory.create_batch(2)
+
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        rows = [json.loads(line) for line in self.get_content(response).splitlines()]
+        self.assertEqual(
+            [row["url"] for row in rows],
+            [
+                f"http://testserver{reverse(verzoek1)}",
+                f"http://testserver{reverse(verzoek2)}",
+            ],
+        )
+        self.assertEqual(rows[0]["bronorganisatie"], verzoek1.bronorganisatie)
+        self.assertIn("externeIdentificatie", rows[0])
+        self.assertNotIn("klantverzoeken", rows[0])
+
+    def test_export_csv(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(EXPORT_URL, {"format": "csv"})
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["url"], f"http://testserver{reverse(verzoek)}")
+        self.assertEqual(rows[0]["status"], verzoek.status)
+
+    def test_export_with_filter(self):
+        VerzoekFactory.create(status=VerzoekStatus.afgehandeld)
+        verzoek = VerzoekFactory.create(status=VerzoekStatus.afgewezen)
+
+        response = self.client.get(EXPORT_URL, {"status": VerzoekStatus.afgewezen})
+
+        lines = self.get_content(response).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0])["url"], f"http://testserver{reverse(verzoek)}"
+        )
+
+    def test_export_with_relations(self):
+        verzoek1, verzoek2 = VerzoekFactory.create_batch(2)
+        klantverzoek = KlantVerzoekFactory.create(verzoek=verzoek1)
+        ObjectVerzoekFactory.create_batch(2, verzoek=verzoek1)
+        VerzoekProductFactory.create(verzoek=verzoek2)
+        VerzoekContactMomentFactory.create(verzoek=verzoek2)
+
+        # 3 for the authorization, 1 for the verzoeken and 1 per relation
+        with self.assertNumQueries(8):
+            response = self.client.get(EXPORT_URL, {"relaties": "true"})
+            content = self.get_content(response)
+
+        row1, row2 = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(
+            row1["klantverzoeken"][0]["url"],
+            f"http://testserver{reverse(klantverzoek)}",
+        )
+        self.assertEqual(row1["klantverzoeken"][0]["klant"], klantverzoek.klant)
+        self.assertIn("indicatieMachtiging", row1["klantverzoeken"][0])
+        self.assertEqual(len(row1["objectverzoeken"]), 2)
+        self.assertEqual(row1["verzoekproducten"], [])
+        self.assertEqual(len(row2["verzoekproducten"]), 1)
+        self.assertEqual(len(row2["verzoekcontactmomenten"]), 1)
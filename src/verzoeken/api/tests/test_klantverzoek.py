@@ -1,10 +1,14 @@
+from django.test import override_settings
+
 import requests_mock
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
 
 from verzoeken.datamodel.models import KlantVerzoek
 from verzoeken.datamodel.tests.factories import KlantVerzoekFactory, VerzoekFactory
+from verzoeken.sync.models import NotificationMessage
 
 KLANT = "http://some.klanten.nl/api/v1/klanten/12345"
 
@@ -49,6 +53,39 @@ class KlantVerzoekTests(JWTAuthMixin, APITestCase):
         data = response.json()
         self.assertEqual(len(data["results"]), 1)
 
+    def test_list_klantverzoek_cursor_pagination(self):
+        list_url = reverse(KlantVerzoek)
+        klantverzoek1, klantverzoek2 = KlantVerzoekFactory.create_batch(2)
+
+        response = self.client.get(list_url, {"cursor": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertNotIn("count", data)
+        self.assertIsNone(data["next"])
+        self.assertEqual(
+            [result["url"] for result in data["results"]],
+            [
+                f"http://testserver{reverse(klantverzoek1)}",
+                f"http://testserver{reverse(klantverzoek2)}",
+            ],
+        )
+
+    def test_list_filter_klantverzoek_sparse_fieldset(self):
+        klantverzoek = KlantVerzoekFactory.create()
+        KlantVerzoekFactory.create()
+        verzoek_url = f"http://testserver.com{reverse(klantverzoek.verzoek)}"
+
+        response = self.client.get(
+            reverse(KlantVerzoek),
+            {"verzoek": verzoek_url, "fields": "klant"},
+            HTTP_HOST="testserver.com",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [{"klant": klantverzoek.klant}])
+
     def test_read_klantverzoek(self):
         klantverzoek = KlantVerzoekFactory.create()
         verzoek_url = reverse(klantverzoek.verzoek)
@@ -140,3 +177,149 @@ class KlantVerzoekTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+
+class KlantVerzoekBulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_bulk_create_klantverzoeken(self):
+        verzoek = VerzoekFactory.create()
+        verzoek_url = reverse(verzoek)
+        klanten = [f"{KLANT}{index}" for index in range(3)]
+        data = [{"verzoek": verzoek_url, "klant": klant} for klant in klanten]
+
+        with requests_mock.Mocker() as m:
+            for klant in klanten:
+                m.get(klant, json={})
+            response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+        self.assertEqual(len(response.json()), 3)
+        self.assertEqual(
+            set(KlantVerzoek.objects.values_list("klant", flat=True)), set(klanten)
+        )
+        self.assertEqual(
+            set(AuditTrail.objects.values_list("resource_url", flat=True)),
+            {klantverzoek["url"] for klantverzoek in response.json()},
+        )
+
+    def test_bulk_create_is_all_or_nothing(self):
+        klantverzoek = KlantVerzoekFactory.create(klant=KLANT)
+        verzoek_url = reverse(klantverzoek.verzoek)
+        data = [
+            {"verzoek": verzoek_url, "klant": f"{KLANT}0"},
+            {"verzoek": verzoek_url, "klant": KLANT},
+        ]
+
+        with requests_mock.Mocker() as m:
+            m.get(KLANT, json={})
+            m.get(f"{KLANT}0", json={})
+            response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.content
+        )
+        self.assertEqual(KlantVerzoek.objects.count(), 1)
+
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "unique")
+
+    def test_bulk_create_duplicates_in_payload(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+        data = [{"verzoek": verzoek_url, "klant": KLANT}] * 2
+
+        with requests_mock.Mocker() as m:
+            m.get(KLANT, json={})
+            response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.content
+        )
+        self.assertEqual(KlantVerzoek.objects.count(), 0)
+        self.assertIsNone(get_validation_errors(response, "0.nonFieldErrors"))
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "unique")
+
+    def test_bulk_create_invalid_item(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+        data = [
+            {"verzoek": verzoek_url, "klant": KLANT},
+            {"verzoek": verzoek_url, "klant": f"{KLANT}0"},
+        ]
+
+        with requests_mock.Mocker() as m:
+            m.get(KLANT, json={})
+            m.get(f"{KLANT}0", status_code=404)
+            response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.content
+        )
+        self.assertEqual(KlantVerzoek.objects.count(), 0)
+
+        error = get_validation_errors(response, "1.klant")
+        self.assertEqual(error["code"], "bad-url")
+
+    @override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_QUEUE=True)
+    def test_bulk_create_queues_notification_per_klantverzoek(self):
+        verzoek1, verzoek2 = VerzoekFactory.create_batch(2)
+        data = [
+            {"verzoek": reverse(verzoek1), "klant": f"{KLANT}0"},
+            {"verzoek": reverse(verzoek1), "klant": f"{KLANT}1"},
+            {"verzoek": reverse(verzoek2), "klant": f"{KLANT}0"},
+        ]
+
+        with requests_mock.Mocker() as m:
+            m.get(f"{KLANT}0", json={})
+            m.get(f"{KLANT}1", json={})
+            response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+
+        messages = [
+            message.message for message in NotificationMessage.objects.order_by("pk")
+        ]
+        self.assertEqual(
+            [message["resourceUrl"] for message in messages],
+            [klantverzoek["url"] for klantverzoek in response.json()],
+        )
+        self.assertEqual(
+            [message["hoofdObject"] for message in messages],
+            [
+                f"http://testserver{reverse(verzoek)}"
+                for verzoek in (verzoek1, verzoek1, verzoek2)
+            ],
+        )
+        for message in messages:
+            self.assertEqual(message["resource"], "klantverzoek")
+            self.assertEqual(message["actie"], "create")
+
+    def test_bulk_create_audittrails_match_single_create(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+
+        with requests_mock.Mocker() as m:
+            m.get(KLANT, json={})
+            m.get(f"{KLANT}0", json={})
+            self.client.post(
+                reverse(KlantVerzoek), {"verzoek": verzoek_url, "klant": KLANT}
+            )
+            self.client.post(
+                reverse(KlantVerzoek), [{"verzoek": verzoek_url, "klant": f"{KLANT}0"}]
+            )
+
+        fields = [
+            "bron",
+            "applicatie_id",
+            "applicatie_weergave",
+            "actie",
+            "actie_weergave",
+            "resultaat",
+            "hoofd_object",
+            "resource",
+        ]
+        single, bulk = AuditTrail.objects.order_by("pk").values(*fields)
+        self.assertEqual(single, bulk)
@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+)
+
+from ..mixins import RowListMixin
+from ..pagination import CursorPageNumberPagination
+from ..rows import RowRepresentation
+
+
+# the relations with informatieobjecten are synchronised afterwards
+@override_settings(DRC_SYNC_OUTBOX=True)
+class RowListTests(JWTAuthMixin, APITestCase):
+    """
+    Cross-check the lists rendered from rows with the serializers.
+    """
+
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        verzoek = VerzoekFactory.create(externe_identificatie="EXT-1")
+        VerzoekFactory.create(in_te_trekken_verzoek=verzoek, tekst="")
+        VerzoekFactory.create(aangevulde_verzoek=verzoek, voorkeurskanaal="email")
+
+        KlantVerzoekFactory.create_batch(2, verzoek=verzoek)
+        ObjectVerzoekFactory.create_batch(2, verzoek=verzoek)
+        VerzoekContactMomentFactory.create_batch(2, verzoek=verzoek)
+        VerzoekInformatieObjectFactory.create_batch(2, verzoek=verzoek)
+        VerzoekProductFactory.create(verzoek=verzoek, product="", product_code="P1")
+        VerzoekProductFactory.create(verzoek=verzoek)
+
+    def assertSameResponses(self, url, params=None, **extra):
+        response = self.client.get(url, params, **extra)
+        with patch.object(RowListMixin, "get_row_representation", return_value=None):
+            expected = self.client.get(url, params, **extra)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response["ETag"], expected["ETag"])
+        return response
+
+    def test_lists(self):
+        models = (
+            Verzoek,
+            KlantVerzoek,
+            ObjectVerzoek,
+            VerzoekContactMoment,
+            VerzoekInformatieObject,
+            VerzoekProduct,
+        )
+        for model in models:
+            with self.subTest(model=model.__name__):
+                with patch.object(
+                    RowRepresentation, "render", autospec=True
+                ) as mock_render:
+                    self.client.get(reverse(model))
+                mock_render.assert_called()
+
+                self.assertSameResponses(reverse(model))
+
+    def test_filtered(self):
+        verzoek = Verzoek.objects.get(externe_identificatie="EXT-1")
+
+        response = self.assertSameResponses(
+            reverse(VerzoekProduct),
+            {"verzoek": f"http://testserver.com{reverse(verzoek)}"},
+            HTTP_HOST="testserver.com",
+        )
+
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_sparse_fieldset(self):
+        self.assertSameResponses(
+            reverse(Verzoek), {"fields": "url,registratiedatum,intrekkendeVerzoek"}
+        )
+
+    @patch.object(CursorPageNumberPagination, "page_size", 1)
+    def test_cursor(self):
+        models = (
+            Verzoek,
+            KlantVerzoek,
+            ObjectVerzoek,
+            VerzoekContactMoment,
+            VerzoekInformatieObject,
+            VerzoekProduct,
+        )
+        for model in models:
+            with self.subTest(model=model.__name__):
+                response = self.assertSameResponses(reverse(model), {"cursor": ""})
+                next_url = response.json()["next"]
+
+                self.assertIsNotNone(next_url)
+                response = self.assertSameResponses(next_url)
+                self.assertIsNotNone(response.json()["previous"])
+
+    def test_missing_etag(self):
+        Verzoek.objects.update(_etag_value="")
+
+        self.assertSameResponses(reverse(Verzoek))
+        self.assertFalse(Verzoek.objects.filter(_etag_value="").exists())
+
+    def test_expand(self):
+        with patch.object(RowRepresentation, "render") as mock_render:
+            response = self.client.get(reverse(Verzoek), {"expand": "klantverzoeken"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_render.assert_not_called()
+
+    def test_list_query_count(self):
+        # 3 queries for the authorization, 1 for the count and 1 for the page
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
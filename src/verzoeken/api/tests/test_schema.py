@@ -0,0 +1,127 @@
+import gzip
+import json
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from ..views import load_schema, render_schema
+
+
+class SchemaViewTests(APITestCase):
+    url = reverse("schema-json", kwargs={"format": ".json"})
+
+    def setUp(self):
+        super().setUp()
+
+        load_schema.cache_clear()
+        render_schema.cache_clear()
+
+    def test_refs_resolve(self):
+        schema = self.client.get(self.url).json()
+
+        def get_refs(obj):
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    if key == "$ref":
+                        yield value
+                    else:
+                        yield from get_refs(value)
+            elif isinstance(obj, list):
+                for item in obj:
+                    yield from get_refs(item)
+
+        refs = set(get_refs(schema))
+        self.assertTrue(refs)
+        for ref in refs:
+            with self.subTest(ref=ref):
+                self.assertTrue(ref.startswith("#/"))
+                target = schema
+                for part in ref[2:].split("/"):
+                    self.assertIn(part, target)
+                    target = target[part]
+
+    def test_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json; charset=utf-8")
+        self.assertIn("ETag", response)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        schema = response.json()
+        self.assertEqual(response["X-OAS-Version"], schema["openapi"])
+        self.assertEqual(schema["servers"], [{"url": "http://testserver/api/v1"}])
+
+    def test_yaml(self):
+        url = reverse("schema-json", kwargs={"format": ".yaml"})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/yaml; charset=utf-8")
+        self.assertIn(b"url: http://testserver/api/v1", response.content)
+
+    def test_rendered_once(self):
+        with patch(
+            "verzoeken.api.views.yaml_sane_load",
+            return_value={"openapi": "3.0.1", "servers": [{"url": "/api/v1"}]},
+        ) as mock_load:
+            first = self.client.get(self.url)
+            second = self.client.get(self.url)
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_servers_per_host(self):
+        response = self.client.get(self.url, HTTP_HOST="testserver.com")
+
+        self.assertEqual(
+            response.json()["servers"], [{"url": "http://testserver.com/api/v1"}]
+        )
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_gzip(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        schema = json.loads(gzip.decompress(response.content))
+        self.assertIn("openapi", schema)
+
+    def test_gzip_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response["ETag"], f'{etag[:-1]}-gzip"')
+
+    def test_gzip_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        gzip_etag = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=gzip_etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], gzip_etag)
+
+        # a cached uncompressed copy doesn't validate the gzip variant
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+
+from ..serializers import KlantVerzoekSerializer, VerzoekProductSerializer
+
+
+class CachedFieldsTests(SimpleTestCase):
+    def test_instances_bind_own_fields(self):
+        first, second = KlantVerzoekSerializer(), KlantVerzoekSerializer()
+
+        self.assertEqual(list(first.fields), list(second.fields))
+        for name in first.fields:
+            with self.subTest(field=name):
+                self.assertIsNot(first.fields[name], second.fields[name])
+                self.assertIs(first.fields[name].parent, first)
+                self.assertIs(second.fields[name].parent, second)
+
+    def test_removed_field_is_kept_for_other_instances(self):
+        KlantVerzoekSerializer().fields.pop("rol")
+
+        self.assertIn("rol", KlantVerzoekSerializer().fields)
+
+    def test_nested_serializer(self):
+        first, second = VerzoekProductSerializer(), VerzoekProductSerializer()
+
+        nested = first.fields["product_identificatie"]
+        self.assertIsNot(nested, second.fields["product_identificatie"])
+        self.assertIs(nested.fields["code"].parent, nested)
+
+    def test_choices_help_text(self):
+        help_text = str(KlantVerzoekSerializer().fields["rol"].help_text)
+
+        self.assertTrue(help_text.startswith("Rol van de KLANT bij het VERZOEK.\n\n"))
+        self.assertIn("* `belanghebbende` - Belanghebbende", help_text)
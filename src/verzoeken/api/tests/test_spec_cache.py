@@ -0,0 +1,99 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+import yaml
+from vng_api_common.oas import fetcher
+
+from verzoeken.api.spec_cache import SPEC_SETTINGS, get_path, load_specs
+
+DRC_API_SPEC = "https://drc.nl/schema/openapi.yaml"
+ZRC_API_SPEC = "https://zrc.nl/schema/openapi.yaml"
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test", "version": "1"},
+    "paths": {"/zaken": {"get": {"operationId": "zaak_list"}}},
+    "components": {
+        "schemas": {
+            "Zaak": {
+                "required": ["url"],
+                "properties": {"url": {"type": "string"}},
+            }
+        }
+    },
+}
+
+
+@override_settings(DRC_API_SPEC=DRC_API_SPEC, ZRC_API_SPEC=ZRC_API_SPEC)
+class SpecCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        settings_override = override_settings(API_SPECS_DIR=tmpdir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        for url in (DRC_API_SPEC, ZRC_API_SPEC):
+            self.addCleanup(fetcher.cache.pop, url, None)
+
+    def refresh_specs(self):
+        with requests_mock.Mocker() as m:
+            m.get(DRC_API_SPEC, text=yaml.dump(SPEC))
+            m.get(ZRC_API_SPEC, text=yaml.dump(SPEC))
+
+            call_command("refresh_api_specs", stdout=StringIO())
+
+    def test_refresh_stores_compiled_specs(self):
+        self.refresh_specs()
+
+        with open(get_path("ZRC_API_SPEC")) as infile:
+            data = json.load(infile)
+
+        self.assertEqual(data["url"], ZRC_API_SPEC)
+        self.assertEqual(
+            data["spec"],
+            {"openapi": "3.0.0", "components": SPEC["components"]},
+        )
+
+    def test_load_specs(self):
+        self.refresh_specs()
+
+        load_specs()
+
+        with requests_mock.Mocker():
+            # no request is made
+            spec = fetcher.fetch(ZRC_API_SPEC)
+        self.assertEqual(spec["components"], SPEC["components"])
+
+    def test_outdated_spec_is_not_loaded(self):
+        self.refresh_specs()
+
+        with override_settings(ZRC_API_SPEC="https://zrc.nl/v2/schema/openapi.yaml"):
+            load_specs()
+
+        self.assertIn(DRC_API_SPEC, fetcher.cache)
+        self.assertNotIn(ZRC_API_SPEC, fetcher.cache)
+        self.assertNotIn("https://zrc.nl/v2/schema/openapi.yaml", fetcher.cache)
+
+    def test_missing_spec(self):
+        load_specs()
+
+        self.assertNotIn(ZRC_API_SPEC, fetcher.cache)
+
+
+class StoredSpecsTests(SimpleTestCase):
+    def test_specs_are_up_to_date(self):
+        for setting in SPEC_SETTINGS:
+            with self.subTest(setting=setting):
+                with open(get_path(setting)) as infile:
+                    data = json.load(infile)
+
+                self.assertEqual(data["url"], getattr(settings, setting))
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+from rest_framework import serializers
+
+from verzoeken.api.validators import CachedResourceValidator
+
+ZAAK = "https://zrc.nl/api/v1/zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+ZRC_API_SPEC = "https://zrc.nl/schema/openapi.yaml"
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "resource_validation": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+        },
+    }
+)
+@patch("vng_api_common.validators.fetcher.fetch", return_value={})
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+class CachedResourceValidatorTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(caches["resource_validation"].clear)
+
+        patcher = patch.dict(CachedResourceValidator.stats, {"hits": 0, "misses": 0})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.validator = CachedResourceValidator("Zaak", ZRC_API_SPEC)
+
+    def test_valid_resource_is_cached(self, *mocks):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, json={"url": ZAAK})
+
+            self.validator(ZAAK)
+            self.validator(ZAAK)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(
+            CachedResourceValidator.get_stats(),
+            {"hits": 1, "misses": 1, "hit_ratio": 0.5},
+        )
+
+    def test_cache_key_includes_resource(self, *mocks):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, json={"url": ZAAK})
+
+            self.validator(ZAAK)
+            CachedResourceValidator("Besluit", ZRC_API_SPEC)(ZAAK)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_not_found_is_cached(self, *mocks):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, status_code=404)
+
+            for _ in range(2):
+                with self.assertRaises(serializers.ValidationError) as cm:
+                    self.validator(ZAAK)
+                self.assertEqual(cm.exception.detail[0].code, "bad-url")
+
+        self.assertEqual(m.call_count, 1)
+
+    def test_other_errors_are_not_cached(self, *mocks):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, [{"status_code": 503}, {"json": {"url": ZAAK}}])
+
+            with self.assertRaises(serializers.ValidationError):
+                self.validator(ZAAK)
+            self.validator(ZAAK)
+
+        self.assertEqual(m.call_count, 2)
@@ -1,14 +1,25 @@
 from datetime import datetime
+from unittest.mock import patch
 
+from django.test import override_settings
 from django.utils.timezone import make_aware
 
 from rest_framework import status
 from rest_framework.test import APITestCase
-from vng_api_common.tests import JWTAuthMixin, reverse
+from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
 
 from verzoeken.datamodel.constants import VerzoekStatus
 from verzoeken.datamodel.models import Verzoek
-from verzoeken.datamodel.tests.factories import VerzoekFactory
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+)
+
+from ..pagination import CursorPageNumberPagination
 
 
 class VerzoekTests(JWTAuthMixin, APITestCase):
@@ -60,6 +71,35 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
             },
         )
 
+    def test_list_verzoeken_query_count(self):
+        for verzoek in VerzoekFactory.create_batch(5):
+            VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+            VerzoekFactory.create(aangevulde_verzoek=verzoek)
+        list_url = reverse(Verzoek)
+
+        # 3 queries for the authorization, 1 for the count and 1 for the page
+        with self.assertNumQueries(5):
+            response = self.client.get(list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 15)
+
+    def test_read_verzoek_query_count(self):
+        in_te_trekken_verzoek, aangevulde_verzoek = VerzoekFactory.create_batch(2)
+        verzoek = VerzoekFactory.create(
+            in_te_trekken_verzoek=in_te_trekken_verzoek,
+            aangevulde_verzoek=aangevulde_verzoek,
+        )
+        VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        VerzoekFactory.create(aangevulde_verzoek=verzoek)
+        detail_url = reverse(verzoek)
+
+        # 5 queries for the (object) authorization and 1 for the verzoek
+        with self.assertNumQueries(6):
+            response = self.client.get(detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_create_verzoek(self):
         in_te_trekken_verzoek, aangevulde_verzoek = VerzoekFactory.create_batch(2)
         list_url = reverse(Verzoek)
@@ -127,6 +167,237 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
 
+    @patch.object(CursorPageNumberPagination, "page_size", 2)
+    def test_pagination_cursor(self):
+        verzoek1 = VerzoekFactory.create(
+            registratiedatum=make_aware(datetime(2020, 1, 1))
+        )
+        verzoek2 = VerzoekFactory.create(
+            registratiedatum=make_aware(datetime(2019, 1, 1))
+        )
+        verzoek3 = VerzoekFactory.create(
+            registratiedatum=make_aware(datetime(2019, 1, 1))
+        )
+        url = reverse(Verzoek)
+
+        response = self.client.get(url, {"cursor": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertNotIn("count", response_data)
+        self.assertIsNone(response_data["previous"])
+        self.assertIsNotNone(response_data["next"])
+        self.assertEqual(
+            [result["url"] for result in response_data["results"]],
+            [
+                f"http://testserver{reverse(verzoek2)}",
+                f"http://testserver{reverse(verzoek3)}",
+            ],
+        )
+
+        response = self.client.get(response_data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertIsNone(response_data["next"])
+        self.assertIsNotNone(response_data["previous"])
+        self.assertEqual(
+            [result["url"] for result in response_data["results"]],
+            [f"http://testserver{reverse(verzoek1)}"],
+        )
+
+        response = self.client.get(response_data["previous"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertIsNone(response_data["previous"])
+        self.assertIsNotNone(response_data["next"])
+        self.assertEqual(
+            [result["url"] for result in response_data["results"]],
+            [
+                f"http://testserver{reverse(verzoek2)}",
+                f"http://testserver{reverse(verzoek3)}",
+            ],
+        )
+
+    def test_pagination_cursor_with_filter(self):
+        VerzoekFactory.create(status=VerzoekStatus.afgehandeld)
+        VerzoekFactory.create(status=VerzoekStatus.afgewezen)
+        url = reverse(Verzoek)
+
+        response = self.client.get(
+            url, {"cursor": "", "status": VerzoekStatus.afgewezen}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(len(response_data["results"]), 1)
+        self.assertEqual(response_data["results"][0]["status"], VerzoekStatus.afgewezen)
+
+    def test_pagination_invalid_cursor(self):
+        url = reverse(Verzoek)
+
+        response = self.client.get(url, {"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_sparse_fieldset(self):
+        verzoek = VerzoekFactory.create(status=VerzoekStatus.ontvangen)
+
+        response = self.client.get(
+            reverse(Verzoek), {"fields": "url,identificatie,status"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "url": f"http://testserver{reverse(verzoek)}",
+                    "identificatie": verzoek.identificatie,
+                    "status": VerzoekStatus.ontvangen,
+                }
+            ],
+        )
+
+    def test_list_sparse_fieldset_query_count(self):
+        for verzoek in VerzoekFactory.create_batch(5):
+            VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+
+        # 3 queries for the authorization, 1 for the count and 1 for the page
+        with self.assertNumQueries(5) as context:
+            response = self.client.get(reverse(Verzoek), {"fields": "url,status"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = context.captured_queries[-1]["sql"]
+        self.assertNotIn('"tekst"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_read_sparse_fieldset(self):
+        verzoek = VerzoekFactory.create()
+
+        response = self.client.get(
+            reverse(verzoek), {"fields": "url,inTeTrekkenVerzoek"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {"url": f"http://testserver{reverse(verzoek)}", "inTeTrekkenVerzoek": None},
+        )
+
+    @patch.object(CursorPageNumberPagination, "page_size", 1)
+    def test_pagination_cursor_sparse_fieldset(self):
+        VerzoekFactory.create_batch(2)
+
+        response = self.client.get(reverse(Verzoek), {"cursor": "", "fields": "url"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(list(response_data["results"][0]), ["url"])
+
+        response = self.client.get(response_data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.json()["results"][0]), ["url"])
+
+    def test_sparse_fieldset_unknown_field(self):
+        response = self.client.get(reverse(Verzoek), {"fields": "url,onbekend"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "fields")
+        self.assertEqual(error["code"], "unknown-fields")
+
+    def test_read_expand(self):
+        verzoek = VerzoekFactory.create()
+        klantverzoek = KlantVerzoekFactory.create(verzoek=verzoek)
+        verzoekproduct = VerzoekProductFactory.create(verzoek=verzoek)
+        KlantVerzoekFactory.create()
+        verzoek_url = f"http://testserver{reverse(verzoek)}"
+
+        response = self.client.get(
+            reverse(verzoek), {"expand": "klantverzoeken,verzoekproducten"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            data["klantverzoeken"],
+            [
+                {
+                    "url": f"http://testserver{reverse(klantverzoek)}",
+                    "klant": klantverzoek.klant,
+                    "verzoek": verzoek_url,
+                    "rol": klantverzoek.rol,
+                    "indicatieMachtiging": klantverzoek.indicatie_machtiging,
+                }
+            ],
+        )
+        self.assertEqual(
+            data["verzoekproducten"],
+            [
+                {
+                    "url": f"http://testserver{reverse(verzoekproduct)}",
+                    "verzoek": verzoek_url,
+                    "product": verzoekproduct.product,
+                    "productIdentificatie": {
+                        "code": verzoekproduct.product_code,
+                    },
+                }
+            ],
+        )
+        self.assertNotIn("objectverzoeken", data)
+
+    @override_settings(DRC_SYNC_OUTBOX=True)
+    def test_list_expand_query_count(self):
+        for verzoek in VerzoekFactory.create_batch(3):
+            KlantVerzoekFactory.create_batch(2, verzoek=verzoek)
+            ObjectVerzoekFactory.create(verzoek=verzoek)
+            VerzoekContactMomentFactory.create(verzoek=verzoek)
+            VerzoekInformatieObjectFactory.create(verzoek=verzoek)
+            VerzoekProductFactory.create(verzoek=verzoek)
+        expand = (
+            "klantverzoeken,objectverzoeken,verzoekcontactmomenten,"
+            "verzoekinformatieobjecten,verzoekproducten"
+        )
+
+        # 3 queries for the authorization, 1 for the count, 1 for the page and
+        # 1 per relation
+        with self.assertNumQueries(10):
+            response = self.client.get(reverse(Verzoek), {"expand": expand})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for result in response.json()["results"]:
+            self.assertEqual(len(result["klantverzoeken"]), 2)
+            self.assertEqual(len(result["objectverzoeken"]), 1)
+            self.assertEqual(len(result["verzoekcontactmomenten"]), 1)
+            self.assertEqual(len(result["verzoekinformatieobjecten"]), 1)
+            self.assertEqual(len(result["verzoekproducten"]), 1)
+
+    def test_expand_sparse_fieldset(self):
+        verzoek = VerzoekFactory.create()
+        KlantVerzoekFactory.create(verzoek=verzoek)
+
+        # the verzoek is loaded with the prefetched klantverzoeken
+        with self.assertNumQueries(7):
+            response = self.client.get(
+                reverse(verzoek), {"fields": "status", "expand": "klantverzoeken"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(list(data), ["status", "klantverzoeken"])
+        self.assertEqual(
+            data["klantverzoeken"][0]["verzoek"], f"http://testserver{reverse(verzoek)}"
+        )
+
+    def test_expand_unknown_relation(self):
+        response = self.client.get(reverse(Verzoek), {"expand": "klanten"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "expand")
+        self.assertEqual(error["code"], "unknown-expand")
+
 
 class VerzoekFilterTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
@@ -280,6 +551,51 @@ class VerzoekFilterTests(JWTAuthMixin, APITestCase):
         result = response_data["results"][0]
         self.assertEqual(result["tekst"], "sometext2")
 
+    def test_filter_zoek(self):
+        VerzoekFactory.create(tekst="Graag een nieuwe parkeervergunning")
+        VerzoekFactory.create(tekst="Mijn vuilnisbak is niet geleegd")
+        url = reverse(Verzoek)
+
+        # the words are matched regardless of inflection
+        response = self.client.get(url, {"zoek": "parkeervergunningen"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 1)
+        self.assertEqual(
+            response_data["results"][0]["tekst"], "Graag een nieuwe parkeervergunning"
+        )
+
+    def test_filter_zoek_ranked(self):
+        VerzoekFactory.create(tekst="Een vraag over de parkeervergunning")
+        VerzoekFactory.create(
+            tekst="Parkeervergunning verlopen, graag een nieuwe parkeervergunning"
+        )
+        VerzoekFactory.create(tekst="Een vraag over afval")
+        url = reverse(Verzoek)
+
+        response = self.client.get(url, {"zoek": "parkeervergunning"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["tekst"] for result in response.json()["results"]],
+            [
+                "Parkeervergunning verlopen, graag een nieuwe parkeervergunning",
+                "Een vraag over de parkeervergunning",
+            ],
+        )
+
+    def test_filter_zoek_updated_tekst(self):
+        verzoek = VerzoekFactory.create(tekst="Een vraag over afval")
+        verzoek.tekst = "Een vraag over de parkeervergunning"
+        verzoek.save()
+        url = reverse(Verzoek)
+
+        response = self.client.get(url, {"zoek": "parkeervergunning"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
     def test_filter_status(self):
         VerzoekFactory.create(status=VerzoekStatus.afgehandeld)
         VerzoekFactory.create(status=VerzoekStatus.afgewezen)
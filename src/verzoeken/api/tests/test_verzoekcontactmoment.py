@@ -141,3 +141,23 @@ class VerzoekContactMomentTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+    def test_bulk_create_verzoekcontactmomenten(self):
+        verzoek1, verzoek2 = VerzoekFactory.create_batch(2)
+        VerzoekContactMomentFactory.create(
+            verzoek=verzoek2, contactmoment=CONTACTMOMENT
+        )
+        data = [
+            {"verzoek": reverse(verzoek1), "contactmoment": CONTACTMOMENT},
+            {"verzoek": reverse(verzoek2), "contactmoment": f"{CONTACTMOMENT}0"},
+        ]
+
+        with requests_mock.Mocker() as m:
+            m.get(CONTACTMOMENT, json={})
+            m.get(f"{CONTACTMOMENT}0", json={})
+            response = self.client.post(reverse(VerzoekContactMoment), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+        self.assertEqual(VerzoekContactMoment.objects.count(), 3)
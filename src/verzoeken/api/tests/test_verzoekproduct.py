@@ -178,3 +178,38 @@ class VerzoekProductTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+    def test_bulk_create_verzoekproducten(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+        data = [
+            {"verzoek": verzoek_url, "productIdentificatie": {"code": "a"}},
+            {"verzoek": verzoek_url, "productIdentificatie": {"code": "b"}},
+        ]
+
+        with self.assertNumQueries(10):
+            response = self.client.post(reverse(VerzoekProduct), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+        self.assertEqual(
+            sorted(VerzoekProduct.objects.values_list("product_code", flat=True)),
+            ["a", "b"],
+        )
+
+    def test_bulk_create_verzoekproducten_without_product(self):
+        verzoek_url = reverse(VerzoekFactory.create())
+        data = [
+            {"verzoek": verzoek_url, "productIdentificatie": {"code": "a"}},
+            {"verzoek": verzoek_url},
+        ]
+
+        response = self.client.post(reverse(VerzoekProduct), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.content
+        )
+        self.assertEqual(VerzoekProduct.objects.count(), 0)
+
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-product")
@@ -2,8 +2,8 @@ from django.conf.urls import url
 from django.urls import include, path
 
 from vng_api_common import routers
-from vng_api_common.schema import SchemaView
 
+from .views import SchemaView
 from .viewsets import (
     KlantVerzoekViewSet,
     ObjectVerzoekViewSet,
@@ -12,6 +12,7 @@ from .viewsets import (
     VerzoekInformatieObjectViewSet,
     VerzoekProductViewSet,
     VerzoekViewSet,
+    WijzigingViewSet,
 )
 
 router = routers.DefaultRouter()
@@ -25,6 +26,7 @@ router.register("objectverzoeken", ObjectVerzoekViewSet)
 router.register("verzoekinformatieobjecten", VerzoekInformatieObjectViewSet)
 router.register("verzoekcontactmomenten", VerzoekContactMomentViewSet)
 router.register("verzoekproducten", VerzoekProductViewSet)
+router.register("wijzigingen", WijzigingViewSet, base_name="wijziging")
 
 # TODO: the EndpointEnumerator seems to choke on path and re_path
 
@@ -36,7 +38,8 @@ urlpatterns = [
                 # API documentation
                 url(
                     r"^schema/openapi(?P<format>\.json|\.yaml)$",
-                    SchemaView.without_ui(cache_timeout=None),
+                    # served from memory with an ETag, see SchemaView
+                    SchemaView.without_ui(cache_timeout=0),
                     name="schema-json",
                 ),
                 url(
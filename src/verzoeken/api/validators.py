@@ -1,20 +1,78 @@
+import hashlib
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.cache import caches
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import exceptions, serializers
-from vng_api_common.models import APICredential
-from vng_api_common.validators import ResourceValidator
+from vng_api_common.validators import ResourceValidator, URLValidator
 from zds_client import ClientError
 
 from verzoeken.datamodel.models import ObjectVerzoek
+from verzoeken.utils.metrics import observe_cache_lookup
 
-from .auth import get_auth
+from .auth import get_auth, get_client_auth
 from .utils import get_absolute_url
 
 
+class CachedResourceValidator(ResourceValidator):
+    """
+    Cache the outcome of the remote resource validation for a short while.
+
+    Valid resources are cached for ``RESOURCE_VALIDATION_CACHE_TIMEOUT`` seconds,
+    resources that don't exist (HTTP 404) for
+    ``RESOURCE_VALIDATION_CACHE_NEGATIVE_TIMEOUT`` seconds. Other failures are
+    not cached, since they are likely temporary.
+    """
+
+    cache_alias = "resource_validation"
+    stats = {"hits": 0, "misses": 0}
+
+    def get_cache_key(self, url: str) -> str:
+        key = f"{self.oas_schema}:{self.resource}:{url}".encode("utf-8")
+        return f"resource-validation:{hashlib.sha1(key).hexdigest()}"
+
+    def __call__(self, url: str):
+        cache = caches[self.cache_alias]
+        cache_key = self.get_cache_key(url)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            observe_cache_lookup(self.cache_alias, hit=True)
+            if cached is True:
+                return
+            message, code = cached
+            raise serializers.ValidationError(message, code=code)
+
+        self.stats["misses"] += 1
+        observe_cache_lookup(self.cache_alias, hit=False)
+        try:
+            super().__call__(url)
+        except serializers.ValidationError as exc:
+            error = exc.detail[0]
+            not_found = URLValidator.message.format(status_code=404, url=url)
+            if error == not_found:
+                cache.set(
+                    cache_key,
+                    (str(error), error.code),
+                    settings.RESOURCE_VALIDATION_CACHE_NEGATIVE_TIMEOUT,
+                )
+            raise
+
+        cache.set(cache_key, True, settings.RESOURCE_VALIDATION_CACHE_TIMEOUT)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        lookups = cls.stats["hits"] + cls.stats["misses"]
+        return {
+            **cls.stats,
+            "hit_ratio": cls.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+
 class ObjectVerzoekDestroyValidator:
     message = _(
         "The canonical remote relation still exists, this relation cannot be deleted."
@@ -31,7 +89,7 @@ class ObjectVerzoekDestroyValidator:
 
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_client_auth(object_url)
 
         resource = f"{objectklantinteractie.object_type}{self.resource_name}"
 
@@ -71,13 +129,13 @@ class ObjectVerzoekCreateValidator:
         # dynamic so that it can be mocked in tests easily
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_client_auth(object_url)
 
         resource = f"{object_type}{self.resource_name}"
         oas_schema = settings.ZRC_API_SPEC
 
         try:
-            ResourceValidator(
+            CachedResourceValidator(
                 object_type.capitalize(),
                 oas_schema,
                 get_auth=get_auth,
@@ -0,0 +1,122 @@
+"""
+Serve the OpenAPI schema.
+
+The schema view is kept apart from :mod:`verzoeken.api.schema`, which is
+imported by the drf-yasg settings the vng-api-common schema view is built with.
+"""
+import gzip
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from django.http import HttpResponse
+from django.urls import get_script_prefix
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import quote_etag
+
+from drf_yasg.codecs import yaml_sane_load
+from vng_api_common.schema import SPEC_RENDERERS, SchemaView as _SchemaView
+
+accepts_gzip = re.compile(r"\bgzip\b")
+
+
+class RenderedSchema(NamedTuple):
+    content: bytes
+    gzipped: bytes
+    etag: str
+    gzip_etag: str
+    version: str
+
+
+@lru_cache(maxsize=4)
+def load_schema(path: str, mtime: float) -> dict:
+    with open(path, "r") as infile:
+        return yaml_sane_load(infile)
+
+
+@lru_cache(maxsize=32)
+def render_schema(
+    path: str, mtime: float, renderer_format: str, origin: str, prefix: str
+) -> RenderedSchema:
+    """
+    Render the v3 schema with absolute server URLs, once per process.
+    """
+    schema = load_schema(path, mtime)
+    servers = []
+    for server in schema["servers"]:
+        if not urlsplit(server["url"]).netloc:
+            server = {**server, "url": f"{origin}{prefix}{server['url']}"}
+        servers.append(server)
+    schema = {**schema, "servers": servers}
+
+    renderer = next(
+        renderer() for renderer in SPEC_RENDERERS if renderer.format == renderer_format
+    )
+    content = renderer.render(schema).encode(renderer.charset)
+    digest = hashlib.md5(content).hexdigest()
+    return RenderedSchema(
+        content=content,
+        gzipped=gzip.compress(content),
+        etag=quote_etag(digest),
+        # the compressed body is a different representation
+        gzip_etag=quote_etag(f"{digest}-gzip"),
+        version=schema["openapi"],
+    )
+
+
+class SchemaView(_SchemaView):
+    """
+    Serve the v3 schema from memory.
+
+    The schema kept in version control is parsed and rendered once per
+    process (and again when the file changes), instead of on every request.
+    The response carries an ETag, so clients can revalidate their copy, and
+    is compressed for clients accepting gzip. The v2 schema is still
+    generated on request.
+    """
+
+    def get(self, request, version="", *args, **kwargs):
+        if self._is_openapi_v2:
+            return super().get(request, version, *args, **kwargs)
+
+        path = self.get_schema_path()
+        prefix = get_script_prefix()
+        if prefix.endswith("/"):
+            prefix = prefix[:-1]
+        renderer = request.accepted_renderer
+        rendered = render_schema(
+            path,
+            # pick up a changed schema file without a restart
+            os.stat(path).st_mtime,
+            renderer.format,
+            request.build_absolute_uri("/")[:-1],
+            prefix,
+        )
+
+        use_gzip = accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        etag = rendered.gzip_etag if use_gzip else rendered.etag
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if use_gzip:
+                response = HttpResponse(rendered.gzipped)
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(rendered.content)
+            response[
+                "Content-Type"
+            ] = f"{renderer.media_type}; charset={renderer.charset}"
+
+        response["ETag"] = etag
+        response["X-OAS-Version"] = rendered.version
+        # cached copies are revalidated with the ETag
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
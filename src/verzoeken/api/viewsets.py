@@ -1,9 +1,13 @@
 import logging
 
-from django.core.cache import caches
+from django.conf import settings
+from django.http import StreamingHttpResponse
 
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
 from vng_api_common.audittrails.viewsets import (
@@ -12,13 +16,7 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.notifications.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from vng_api_common.permissions import AuthScopesRequired
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from verzoeken.datamodel.models import (
     KlantVerzoek,
@@ -28,8 +26,11 @@ from verzoeken.datamodel.models import (
     VerzoekInformatieObject,
     VerzoekProduct,
 )
+from verzoeken.sync.marks import get_marked_for_delete
 
 from .audits import AUDIT_VERZOEKEN
+from .changes import TOKEN_QUERY_PARAM, ChangeFeedSerializer, get_change_feed
+from .export import CSVRenderer, NDJSONRenderer, buffered, export_verzoeken, get_columns
 from .filters import (
     KlantVerzoekFilter,
     ObjectVerzoekFilter,
@@ -39,6 +40,18 @@ from .filters import (
     VerzoekProductFilter,
 )
 from .kanalen import KANAAL_VERZOEKEN
+from .mixins import (
+    BulkCreateMixin,
+    CheckQueryParamsMixin,
+    ConditionalGetMixin,
+    ExpandMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+    RowListMixin,
+    SparseFieldsetsMixin,
+)
+from .pagination import CursorPageNumberPagination
 from .scopes import (
     SCOPE_VERZOEKEN_AANMAKEN,
     SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -59,7 +72,13 @@ logger = logging.getLogger(__name__)
 
 
 class VerzoekViewSet(
-    NotificationViewSetMixin, AuditTrailViewsetMixin, viewsets.ModelViewSet
+    ExpandMixin,
+    SparseFieldsetsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
+    NotificationViewSetMixin,
+    AuditTrailViewsetMixin,
+    viewsets.ModelViewSet,
 ):
     """
     Opvragen en bewerken van VERZOEKen.
@@ -72,12 +91,14 @@ class VerzoekViewSet(
     list:
     Alle VERZOEKen opvragen.
 
-    Alle VERZOEKen opvragen.
+    Alle VERZOEKen opvragen. Met `expand` worden de gevraagde relaties van elk
+    VERZOEK direct opgenomen.
 
     retrieve:
     Een specifiek VERZOEK opvragen.
 
-    Een specifiek VERZOEK opvragen.
+    Een specifiek VERZOEK opvragen. Met `expand` worden de gevraagde relaties
+    van het VERZOEK direct opgenomen.
 
     update:
     Werk een VERZOEK in zijn geheel bij.
@@ -93,14 +114,41 @@ class VerzoekViewSet(
     Verwijder een VERZOEK.
 
     Verwijder een VERZOEK.
+
+    export:
+    Alle VERZOEKen exporteren.
+
+    Exporteer alle (gefilterde) VERZOEKen in een enkel antwoord, als
+    newline-delimited JSON (`application/x-ndjson`) of CSV (`text/csv`).
+    Met `relaties=true` worden de KLANT-VERZOEK, OBJECT-VERZOEK,
+    VERZOEK-PRODUCT en VERZOEK-CONTACTMOMENT relaties per VERZOEK opgenomen.
     """
 
-    queryset = Verzoek.objects.all()
+    queryset = Verzoek.objects.select_related(
+        "in_te_trekken_verzoek",
+        "intrekkende_verzoek",
+        "aangevulde_verzoek",
+        "aanvullende_verzoek",
+    ).defer("zoekvector")
     serializer_class = VerzoekSerializer
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
     filterset_class = VerzoekFilter
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
+    cursor_ordering = ("registratiedatum", "id")
+    expandable_relations = {
+        "klantverzoeken": ("klantverzoek_set", KlantVerzoekSerializer),
+        "objectverzoeken": ("objectverzoek_set", ObjectVerzoekSerializer),
+        "verzoekcontactmomenten": (
+            "verzoekcontactmoment_set",
+            VerzoekContactMomentSerializer,
+        ),
+        "verzoekinformatieobjecten": (
+            "verzoekinformatieobject_set",
+            VerzoekInformatieObjectSerializer,
+        ),
+        "verzoekproducten": ("verzoekproduct_set", VerzoekProductSerializer),
+    }
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -108,13 +156,59 @@ class VerzoekViewSet(
         "update": SCOPE_VERZOEKEN_BIJWERKEN,
         "partial_update": SCOPE_VERZOEKEN_BIJWERKEN,
         "destroy": SCOPE_VERZOEKEN_ALLES_VERWIJDEREN,
+        "export": SCOPE_VERZOEKEN_ALLES_LEZEN,
     }
     notifications_kanaal = KANAAL_VERZOEKEN
     audit = AUDIT_VERZOEKEN
 
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "relaties",
+                openapi.IN_QUERY,
+                description="Neem de relaties van elk VERZOEK op in de export.",
+                type=openapi.TYPE_BOOLEAN,
+            )
+        ],
+        responses={200: openapi.Response("De VERZOEKen, een per regel.")},
+    )
+    @action(
+        detail=False,
+        pagination_class=None,
+        renderer_classes=(NDJSONRenderer, CSVRenderer),
+    )
+    def export(self, request, *args, **kwargs):
+        include_relations = request.query_params.get("relaties") in ("true", "1")
+
+        # the format is already negotiated, keep it out of the URLs in the export
+        request._request.GET = request._request.GET.copy()
+        request._request.GET.pop(api_settings.URL_FORMAT_OVERRIDE, None)
+
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            *self.cursor_ordering
+        )
+        rows = export_verzoeken(queryset, request, include_relations=include_relations)
+
+        renderer = request.accepted_renderer
+        if renderer.format == CSVRenderer.format:
+            stream = CSVRenderer.stream(rows, columns=get_columns(include_relations))
+        else:
+            stream = NDJSONRenderer.stream(rows)
+
+        response = StreamingHttpResponse(
+            buffered(stream), content_type=f"{renderer.media_type}; charset=utf-8"
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="verzoeken.{renderer.format}"'
+        return response
+
 
 class ObjectVerzoekViewSet(
+    SparseFieldsetsMixin,
     CheckQueryParamsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -156,12 +250,12 @@ class ObjectVerzoekViewSet(
     endpoint bij het synchroniseren van relaties.
     """
 
-    queryset = ObjectVerzoek.objects.all()
+    queryset = ObjectVerzoek.objects.select_related("verzoek")
     serializer_class = ObjectVerzoekSerializer
     filterset_class = ObjectVerzoekFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -188,7 +282,10 @@ class VerzoekInformatieObjectViewSet(
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
+    SparseFieldsetsMixin,
     CheckQueryParamsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -245,12 +342,12 @@ class VerzoekInformatieObjectViewSet(
     Verwijder een VERZOEK-INFORMATIEOBJECT relatie.
     """
 
-    queryset = VerzoekInformatieObject.objects.all()
+    queryset = VerzoekInformatieObject.objects.select_related("verzoek")
     serializer_class = VerzoekInformatieObjectSerializer
     filterset_class = VerzoekInformatieObjectFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -265,22 +362,27 @@ class VerzoekInformatieObjectViewSet(
     def get_queryset(self):
         qs = super().get_queryset()
 
-        # Do not display VerzoekInformatieObjecten that are marked to be deleted
-        cache = caches["drc_sync"]
+        # relations are only marked when synchronising during the request
+        if settings.DRC_SYNC_OUTBOX:
+            return qs
 
-        # TODO: Store cachekeys somewhere central.
-        marked_vios = cache.get("vios_marked_for_delete")
+        # Do not display VerzoekInformatieObjecten that are marked to be deleted
+        marked_vios = get_marked_for_delete()
         if marked_vios:
             return qs.exclude(uuid__in=marked_vios)
         return qs
 
 
 class VerzoekContactMomentViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
+    SparseFieldsetsMixin,
     CheckQueryParamsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -299,6 +401,10 @@ class VerzoekContactMomentViewSet(
     - geldigheid `contactmoment` URL
     - de combinatie `contactmoment` en `verzoek` moet uniek zijn
 
+    Er kan ook een lijst van relaties in een keer aangemaakt worden. Alle
+    relaties worden dan samen gevalideerd en ofwel allemaal, ofwel geen van
+    allen aangemaakt.
+
     list:
     Alle VERZOEK-CONTACTMOMENT relaties opvragen.
 
@@ -333,12 +439,12 @@ class VerzoekContactMomentViewSet(
     Verwijder een VERZOEK-CONTACTMOMENT relatie.
     """
 
-    queryset = VerzoekContactMoment.objects.all()
+    queryset = VerzoekContactMoment.objects.select_related("verzoek")
     serializer_class = VerzoekContactMomentSerializer
     filterset_class = VerzoekContactMomentFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -352,11 +458,15 @@ class VerzoekContactMomentViewSet(
 
 
 class VerzoekProductViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
+    SparseFieldsetsMixin,
     CheckQueryParamsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -374,6 +484,10 @@ class VerzoekProductViewSet(
     - geldigheid `verzoek` URL
     - geldigheid `product` URL
 
+    Er kan ook een lijst van relaties in een keer aangemaakt worden. Alle
+    relaties worden dan samen gevalideerd en ofwel allemaal, ofwel geen van
+    allen aangemaakt.
+
     list:
     Alle VERZOEK-PRODUCT relaties opvragen.
 
@@ -390,12 +504,12 @@ class VerzoekProductViewSet(
     Verwijder een VERZOEK-PRODUCT relatie.
     """
 
-    queryset = VerzoekProduct.objects.all()
+    queryset = VerzoekProduct.objects.select_related("verzoek")
     serializer_class = VerzoekProductSerializer
     filterset_class = VerzoekProductFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -409,11 +523,15 @@ class VerzoekProductViewSet(
 
 
 class KlantVerzoekViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
+    SparseFieldsetsMixin,
     CheckQueryParamsMixin,
+    RowListMixin,
+    ConditionalGetMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -424,6 +542,10 @@ class KlantVerzoekViewSet(
     create:
     Maak een KLANT-VERZOEK relatie aan.
 
+    Er kan ook een lijst van relaties in een keer aangemaakt worden. Alle
+    relaties worden dan samen gevalideerd en ofwel allemaal, ofwel geen van
+    allen aangemaakt.
+
     list:
     Alle KLANT-VERZOEK relaties opvragen.
 
@@ -440,12 +562,12 @@ class KlantVerzoekViewSet(
     Verwijder een KLANT-VERZOEK relatie.
     """
 
-    queryset = KlantVerzoek.objects.all()
+    queryset = KlantVerzoek.objects.select_related("verzoek")
     serializer_class = KlantVerzoekSerializer
     filterset_class = KlantVerzoekFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     required_scopes = {
         "list": SCOPE_VERZOEKEN_ALLES_LEZEN,
         "retrieve": SCOPE_VERZOEKEN_ALLES_LEZEN,
@@ -474,3 +596,40 @@ class VerzoekAuditTrailViewSet(AuditTrailViewSet):
     """
 
     main_resource_lookup_field = "verzoek_uuid"
+
+
+class WijzigingViewSet(viewsets.ViewSet):
+    """
+    Opvragen van de wijzigingen in VERZOEKen en hun relaties.
+
+    list:
+    Alle wijzigingen sinds een token opvragen.
+
+    De aangemaakte, gewijzigde en verwijderde VERZOEKen, KLANT-VERZOEKen,
+    OBJECT-VERZOEKen, VERZOEK-INFORMATIEOBJECTen, VERZOEK-CONTACTMOMENTen en
+    VERZOEK-PRODUCTen, in de volgorde waarin ze gewijzigd zijn. Een resource
+    die opnieuw gewijzigd wordt, verschuift naar het einde van de lijst.
+
+    Zonder token worden alle wijzigingen vanaf het begin opgevraagd. Het token
+    in het antwoord geeft de wijzigingen na deze pagina; de link `next` is
+    gevuld zolang er meer wijzigingen zijn. Wijzigingen worden pas na enkele
+    seconden opgenomen.
+    """
+
+    permission_classes = (AuthScopesRequired,)
+    required_scopes = {"list": SCOPE_VERZOEKEN_ALLES_LEZEN}
+    page_size = api_settings.PAGE_SIZE
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                TOKEN_QUERY_PARAM,
+                openapi.IN_QUERY,
+                description="Het token uit een eerder antwoord.",
+                type=openapi.TYPE_STRING,
+            )
+        ],
+        responses={200: ChangeFeedSerializer},
+    )
+    def list(self, request, *args, **kwargs):
+        return Response(get_change_feed(request, page_size=self.page_size))
@@ -6,6 +6,12 @@ API_VERSION = "1.0.0-beta"
 
 REST_FRAMEWORK = BASE_REST_FRAMEWORK.copy()
 REST_FRAMEWORK["PAGE_SIZE"] = 100
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+    "verzoeken.api.camel_case.CamelCaseJSONRenderer",
+)
+REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+    "verzoeken.api.camel_case.CamelCaseJSONParser",
+)
 
 SECURITY_DEFINITION_NAME = "JWT-Claims"
 
@@ -14,6 +20,7 @@ SWAGGER_SETTINGS = BASE_SWAGGER_SETTINGS.copy()
 SWAGGER_SETTINGS.update(
     {
         "DEFAULT_INFO": "verzoeken.api.schema.info",
+        "DEFAULT_AUTO_SCHEMA_CLASS": "verzoeken.api.schema.AutoSchema",
         "SECURITY_DEFINITIONS": {
             SECURITY_DEFINITION_NAME: {
                 # OAS 3.0
@@ -38,6 +45,10 @@ SWAGGER_SETTINGS.update(
 
 GEMMA_URL_INFORMATIEMODEL_VERSIE = "1.0"
 
+# re-use the connections to other APIs, see verzoeken.utils.clients
+ZDS_CLIENT_CLASS = "verzoeken.utils.clients.PooledClient"
+LINK_FETCHER = "verzoeken.utils.clients.fetch"
+
 
 drc_repo = "vng-realisatie/gemma-documentregistratiecomponent"
 drc_commit = "a1602ccf397527add6bc2b4b12e997accf287339"
@@ -71,6 +71,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "verzoeken.utils.performance.PerformanceMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
@@ -230,6 +231,11 @@ LOGGING = {
     },
     "loggers": {
         "verzoeken": {"handlers": ["project"], "level": "INFO", "propagate": True},
+        "performance": {
+            "handlers": ["performance"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {"handlers": ["django"], "level": "ERROR", "propagate": True},
         "django.template": {
             "handlers": ["console"],
@@ -308,3 +314,74 @@ IS_HTTPS = os.getenv("IS_HTTPS", "1").lower() in ["true", "1", "yes"]
 
 # settings for sending notifications
 NOTIFICATIONS_KANAAL = "verzoeken"
+# When enabled, notifications are sent by the `process_notifications` management
+# command instead of during the request. Requires a running worker.
+NOTIFICATIONS_QUEUE = os.getenv("NOTIFICATIONS_QUEUE", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+NOTIFICATIONS_MAX_ATTEMPTS = int(os.getenv("NOTIFICATIONS_MAX_ATTEMPTS", 10))
+# delay in seconds before the first retry, doubled for every next attempt
+NOTIFICATIONS_RETRY_BACKOFF = int(os.getenv("NOTIFICATIONS_RETRY_BACKOFF", 5))
+NOTIFICATIONS_RETRY_BACKOFF_MAX = int(
+    os.getenv("NOTIFICATIONS_RETRY_BACKOFF_MAX", 60 * 60)
+)
+# seconds a worker holds the messages it claimed, before other workers may retry them
+NOTIFICATIONS_CLAIM_TIMEOUT = int(os.getenv("NOTIFICATIONS_CLAIM_TIMEOUT", 5 * 60))
+
+# numbers reserved at once by a process for the generated identificaties of
+# VERZOEKen, see verzoeken.datamodel.identificatie
+VERZOEK_IDENTIFICATIE_BLOCK_SIZE = int(os.getenv("VERZOEK_IDENTIFICATIE_BLOCK_SIZE", 1))
+
+# seconds before a change is listed in the change feed, longer than the duration of
+# (almost) all transactions, see verzoeken.api.changes
+CHANGE_FEED_DELAY = int(os.getenv("CHANGE_FEED_DELAY", 5))
+
+# log the timings of one in this many requests to performance.log, 0 to disable
+PERFORMANCE_LOG_SAMPLE_RATE = int(os.getenv("PERFORMANCE_LOG_SAMPLE_RATE", 100))
+# comma separated IP addresses and networks (e.g. 10.0.0.0/8) allowed to scrape
+# /metrics, see verzoeken.utils.metrics
+METRICS_ALLOWED_IPS = [
+    ip.strip()
+    for ip in os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",")
+    if ip.strip()
+]
+
+# settings for the connections to other APIs
+ZGW_CLIENT_POOL_SIZE = int(os.getenv("ZGW_CLIENT_POOL_SIZE", 10))
+# timeouts in seconds
+ZGW_CLIENT_CONNECT_TIMEOUT = float(os.getenv("ZGW_CLIENT_CONNECT_TIMEOUT", 5))
+ZGW_CLIENT_READ_TIMEOUT = float(os.getenv("ZGW_CLIENT_READ_TIMEOUT", 30))
+
+# seconds to keep the external API credentials in memory, changes made in the same
+# process are picked up immediately
+API_CREDENTIALS_CACHE_TIMEOUT = int(os.getenv("API_CREDENTIALS_CACHE_TIMEOUT", 60))
+
+# seconds to cache the validation of remote resources, see
+# verzoeken.api.validators.CachedResourceValidator
+RESOURCE_VALIDATION_CACHE_TIMEOUT = int(
+    os.getenv("RESOURCE_VALIDATION_CACHE_TIMEOUT", 60)
+)
+RESOURCE_VALIDATION_CACHE_NEGATIVE_TIMEOUT = int(
+    os.getenv("RESOURCE_VALIDATION_CACHE_NEGATIVE_TIMEOUT", 10)
+)
+
+# local copies of the OAS specs to validate remote resources against, generated with
+# the `refresh_api_specs` management command
+API_SPECS_DIR = os.path.join(DJANGO_PROJECT_DIR, "api", "specs")
+
+# settings for the synchronisation of relations with the Documenten API
+# When enabled, changes are delivered by the `process_drc_sync` management command
+# instead of during the request. Requires a running worker.
+DRC_SYNC_OUTBOX = os.getenv("DRC_SYNC_OUTBOX", "0").lower() in ["true", "1", "yes"]
+DRC_SYNC_MAX_ATTEMPTS = int(os.getenv("DRC_SYNC_MAX_ATTEMPTS", 10))
+# delay in seconds before the first retry, doubled for every next attempt
+DRC_SYNC_RETRY_BACKOFF = int(os.getenv("DRC_SYNC_RETRY_BACKOFF", 5))
+DRC_SYNC_RETRY_BACKOFF_MAX = int(os.getenv("DRC_SYNC_RETRY_BACKOFF_MAX", 60 * 60))
+# seconds a worker holds the messages it claimed, before other workers may retry them
+DRC_SYNC_CLAIM_TIMEOUT = int(os.getenv("DRC_SYNC_CLAIM_TIMEOUT", 5 * 60))
+
+# encoder of the JSON responses, "json" or "orjson" (requires the orjson package),
+# see verzoeken.api.camel_case
+JSON_BACKEND = os.getenv("JSON_BACKEND", "json")
@@ -11,6 +11,7 @@ ADMINS = ()
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "drc_sync": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "resource_validation": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
@@ -29,3 +30,5 @@ LOGGING["loggers"].update(
 ENVIRONMENT = "ci"
 
 NOTIFICATIONS_DISABLED = True
+
+PERFORMANCE_LOG_SAMPLE_RATE = 0
@@ -24,6 +24,7 @@ MANAGERS = ADMINS
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "drc_sync": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "resource_validation": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
@@ -40,6 +40,14 @@ CACHES = {
             "IGNORE_EXCEPTIONS": True,
         },
     },
+    "resource_validation": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{getenv('REDIS_CACHE')}",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
@@ -0,0 +1 @@
+default_app_config = "verzoeken.datamodel.apps.DatamodelConfig"
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from .models import (
+    IdentificatieCounter,
     KlantVerzoek,
     ObjectVerzoek,
     Verzoek,
@@ -38,3 +39,9 @@ class VerzoekProductAdmin(admin.ModelAdmin):
 @admin.register(KlantVerzoek)
 class KlantVerzoekAdmin(admin.ModelAdmin):
     list_display = ["verzoek", "klant"]
+
+
+@admin.register(IdentificatieCounter)
+class IdentificatieCounterAdmin(admin.ModelAdmin):
+    list_display = ["bronorganisatie", "year", "value"]
+    list_filter = ["year"]
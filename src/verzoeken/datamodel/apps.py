@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class DatamodelConfig(AppConfig):
+    name = "verzoeken.datamodel"
+
+    def ready(self):
+        from . import signals  # noqa
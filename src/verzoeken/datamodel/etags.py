@@ -0,0 +1,103 @@
+"""
+Keep a validator of the current version of the API resources in the database.
+
+:class:`vng_api_common.caching.ETagMixin` calculates the ETag by rendering the
+resource, which requires the serializers (and a request) whenever an object
+is saved. Instead, the ETag is calculated from the values of the columns of
+the object, which are hashed on save. Together with the time of the last
+change, this allows the API to answer conditional requests without rendering
+the resource.
+
+Objects inserted without :meth:`~django.db.models.Model.save` (such as with
+``bulk_create``) get their ETag when it's first asked for. The column is not
+named ``_etag``, which would make the signal handlers of
+:mod:`vng_api_common.caching.signals` clear it on every save.
+"""
+import hashlib
+import json
+from typing import Tuple
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+# the columns describing the version itself
+VERSION_FIELDS = ("_etag_value", "laatst_gewijzigd")
+
+
+def calculate_etag(instance: models.Model) -> str:
+    """
+    Calculate the MD5 hash of the values of the object.
+    """
+    ignored = {*VERSION_FIELDS, *instance.etag_ignored_fields}
+    values = [
+        (field.attname, field.value_to_string(instance))
+        for field in instance._meta.concrete_fields
+        # the primary key is only known after the insert
+        if not field.primary_key and field.name not in ignored
+    ]
+    values.append(("dependencies", instance.get_etag_dependencies()))
+    rendered = json.dumps(values, default=str).encode("utf-8")
+    return hashlib.md5(rendered).hexdigest()
+
+
+class ETagMixin(models.Model):
+    """
+    Recalculate the ETag value and modification time on save.
+    """
+
+    _etag_value = models.CharField(
+        _("etag value"),
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text=_("MD5 hash of the values of the object in its current version."),
+    )
+    laatst_gewijzigd = models.DateTimeField(
+        _("laatst gewijzigd"),
+        default=timezone.now,
+        editable=False,
+        help_text=_("Het tijdstip waarop het object voor het laatst is gewijzigd."),
+    )
+
+    # columns derived from other columns by the database, not part of the resource
+    etag_ignored_fields: Tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    def get_etag_dependencies(self) -> list:
+        """
+        Return the values outside of the object that are part of its resource.
+        """
+        return []
+
+    def update_etag(self) -> None:
+        self._etag_value = calculate_etag(self)
+
+    def save(self, *args, **kwargs):
+        self.update_etag()
+        self.laatst_gewijzigd = timezone.now()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *VERSION_FIELDS}
+
+        super().save(*args, **kwargs)
+
+    def get_etag(self) -> str:
+        """
+        Return the ETag value, calculating and storing it if it's missing.
+        """
+        if not self._etag_value:
+            deferred = self.get_deferred_fields() - {
+                *VERSION_FIELDS,
+                *self.etag_ignored_fields,
+            }
+            if deferred:
+                self.refresh_from_db(fields=deferred)
+            self.update_etag()
+            type(self)._default_manager.filter(pk=self.pk).update(
+                _etag_value=self._etag_value
+            )
+        return self._etag_value
@@ -0,0 +1,141 @@
+"""
+Allocate the numbers of generated identificaties from a counter.
+
+:func:`vng_api_common.utils.generate_unique_identification` determines the
+next number by scanning the identificaties issued in the year, which gets
+slower as the table grows and hands out the same number to concurrent
+requests. Instead, the last allocated number is kept per bronorganisatie and
+year in :class:`IdentificatieCounter`, and incremented with a single upsert.
+
+The counter row stays locked until the transaction is committed, serializing
+concurrent creates for the same bronorganisatie. With
+``VERZOEK_IDENTIFICATIE_BLOCK_SIZE`` larger than 1, a process reserves a
+block of numbers at once and hands them out from memory, at the cost of gaps
+and numbers not being issued in chronological order across processes.
+
+Clients may provide an identificatie in the generated format themselves. The
+counter is raised to its number (see :func:`register_identificatie`), so it is
+not generated again. Blocks reserved by other processes before can still
+contain the number though, so use a block size of 1 when clients do this.
+"""
+import re
+import threading
+from typing import Dict, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+
+# (bronorganisatie, year) -> (next number, last number) of the reserved block
+_blocks: Dict[Tuple[str, int], Tuple[int, int]] = {}
+_lock = threading.Lock()
+
+IDENTIFICATIE_RE = re.compile(r"^(?P<prefix>.+)-(?P<year>\d{4})-(?P<number>\d{10})$")
+
+# the largest value of the counter column
+MAX_NUMBER = 2147483647
+
+
+def _get_table() -> str:
+    return apps.get_model("datamodel", "IdentificatieCounter")._meta.db_table
+
+
+def _reserve(bronorganisatie: str, year: int, size: int) -> int:
+    """
+    Increment the counter by ``size`` and return the last reserved number.
+    """
+    table = _get_table()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (bronorganisatie, year, value)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (bronorganisatie, year)
+            DO UPDATE SET value = {table}.value + EXCLUDED.value
+            RETURNING value
+            """,
+            [bronorganisatie, year, size],
+        )
+        return cursor.fetchone()[0]
+
+
+def _raise_counter(bronorganisatie: str, year: int, number: int) -> None:
+    """
+    Raise the counter to at least ``number``.
+    """
+    table = _get_table()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (bronorganisatie, year, value)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (bronorganisatie, year)
+            DO UPDATE SET value = GREATEST({table}.value, EXCLUDED.value)
+            """,
+            [bronorganisatie, year, number],
+        )
+
+
+def _keep_block(key: Tuple[str, int], block: Tuple[int, int]) -> None:
+    with _lock:
+        _blocks[key] = block
+
+
+def allocate_number(bronorganisatie: str, year: int) -> int:
+    key = (bronorganisatie, year)
+    with _lock:
+        start, end = _blocks.get(key, (1, 0))
+        if start <= end:
+            _blocks[key] = (start + 1, end)
+            return start
+
+    size = max(settings.VERZOEK_IDENTIFICATIE_BLOCK_SIZE, 1)
+    end = _reserve(bronorganisatie, year, size)
+    start = end - size + 1
+    if size > 1:
+        # the reservation is only final once committed - on a rollback the
+        # numbers will be reserved again
+        transaction.on_commit(lambda: _keep_block(key, (start + 1, end)))
+    return start
+
+
+def clear_blocks() -> None:
+    with _lock:
+        _blocks.clear()
+
+
+def _get_prefix(model) -> str:
+    return getattr(model, "IDENTIFICATIE_PREFIX", model._meta.model_name.upper())
+
+
+def generate_identificatie(instance, date_field_name: str) -> str:
+    """
+    Counter based equivalent of ``generate_unique_identification``.
+    """
+    model_name = _get_prefix(type(instance))
+    year = getattr(instance, date_field_name).year
+
+    number = allocate_number(instance.bronorganisatie, year)
+    return f"{model_name}-{year}-{str(number).zfill(10)}"
+
+
+def register_identificatie(instance) -> None:
+    """
+    Keep the counter ahead of a provided identificatie in the generated format.
+    """
+    match = IDENTIFICATIE_RE.match(instance.identificatie)
+    if not match or match.group("prefix") != _get_prefix(type(instance)):
+        return
+
+    year, number = int(match.group("year")), int(match.group("number"))
+    if number > MAX_NUMBER:
+        # beyond the numbers the counter can reach
+        return
+
+    _raise_counter(instance.bronorganisatie, year, number)
+
+    key = (instance.bronorganisatie, year)
+    with _lock:
+        start, end = _blocks.get(key, (1, 0))
+        if start <= number <= end:
+            _blocks[key] = (number + 1, end)
@@ -0,0 +1,96 @@
+# Generated by Django 2.2.14 on 2026-10-18 19:49
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from verzoeken.utils.migrations import add_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # the indexes are built concurrently, without blocking writes
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0005_auto_20200528_1628"),
+    ]
+
+    operations = [
+        add_index_concurrently(
+            "klantverzoek",
+            django.contrib.postgres.indexes.HashIndex(
+                fields=["klant"], name="klantverzoek_klant_hash_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "klantverzoek_klant_hash_idx" '
+            'ON "datamodel_klantverzoek" USING hash ("klant");',
+        ),
+        add_index_concurrently(
+            "objectverzoek",
+            django.contrib.postgres.indexes.HashIndex(
+                fields=["object"], name="objectverzoek_object_hash_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "objectverzoek_object_hash_idx" '
+            'ON "datamodel_objectverzoek" USING hash ("object");',
+        ),
+        add_index_concurrently(
+            "verzoek",
+            models.Index(
+                fields=["status", "registratiedatum"],
+                name="verzoek_status_regdatum_idx",
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_status_regdatum_idx" '
+            'ON "datamodel_verzoek" ("status", "registratiedatum");',
+        ),
+        add_index_concurrently(
+            "verzoek",
+            models.Index(
+                fields=["bronorganisatie", "registratiedatum"],
+                name="verzoek_bronorg_regdatum_idx",
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_bronorg_regdatum_idx" '
+            'ON "datamodel_verzoek" ("bronorganisatie", "registratiedatum");',
+        ),
+        add_index_concurrently(
+            "verzoek",
+            models.Index(
+                fields=["registratiedatum", "id"], name="verzoek_regdatum_id_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_regdatum_id_idx" '
+            'ON "datamodel_verzoek" ("registratiedatum", "id");',
+        ),
+        add_index_concurrently(
+            "verzoek",
+            models.Index(
+                condition=models.Q(_negated=True, externe_identificatie=""),
+                fields=["externe_identificatie"],
+                name="verzoek_externe_id_idx",
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_externe_id_idx" '
+            'ON "datamodel_verzoek" ("externe_identificatie") '
+            "WHERE NOT (\"externe_identificatie\" = '');",
+        ),
+        add_index_concurrently(
+            "verzoekcontactmoment",
+            django.contrib.postgres.indexes.HashIndex(
+                fields=["contactmoment"], name="vcm_contactmoment_hash_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "vcm_contactmoment_hash_idx" '
+            'ON "datamodel_verzoekcontactmoment" USING hash ("contactmoment");',
+        ),
+        add_index_concurrently(
+            "verzoekinformatieobject",
+            django.contrib.postgres.indexes.HashIndex(
+                fields=["informatieobject"], name="vio_informatieobject_hash_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "vio_informatieobject_hash_idx" '
+            'ON "datamodel_verzoekinformatieobject" USING hash ("informatieobject");',
+        ),
+        add_index_concurrently(
+            "verzoekproduct",
+            django.contrib.postgres.indexes.HashIndex(
+                fields=["product"], name="verzoekproduct_prod_hash_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoekproduct_prod_hash_idx" '
+            'ON "datamodel_verzoekproduct" USING hash ("product");',
+        ),
+    ]
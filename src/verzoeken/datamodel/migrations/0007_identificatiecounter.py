@@ -0,0 +1,64 @@
+# Generated by Django 2.2.14 on 2026-10-18 20:14
+
+import re
+
+from django.db import migrations, models
+import vng_api_common.fields
+
+GENERATED = re.compile(r"^VERZOEK-(\d{4})-(\d{10})$")
+
+
+def seed_counters(apps, schema_editor):
+    Verzoek = apps.get_model("datamodel", "Verzoek")
+    IdentificatieCounter = apps.get_model("datamodel", "IdentificatieCounter")
+
+    counters = {}
+    identificaties = Verzoek.objects.filter(
+        identificatie__regex=GENERATED.pattern
+    ).values_list("bronorganisatie", "identificatie")
+    for bronorganisatie, identificatie in identificaties.iterator():
+        year, number = GENERATED.match(identificatie).groups()
+        key = (bronorganisatie, int(year))
+        counters[key] = max(counters.get(key, 0), int(number))
+
+    IdentificatieCounter.objects.bulk_create(
+        [
+            IdentificatieCounter(
+                bronorganisatie=bronorganisatie, year=year, value=value
+            )
+            for (bronorganisatie, year), value in counters.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0006_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdentificatieCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bronorganisatie", vng_api_common.fields.RSINField(max_length=9)),
+                ("year", models.PositiveSmallIntegerField()),
+                ("value", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "identificatieteller",
+                "verbose_name_plural": "identificatietellers",
+                "unique_together": {("bronorganisatie", "year")},
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,140 @@
+# Generated by Django 2.2.14 on 2026-10-18 20:27
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0007_identificatiecounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="klantverzoek",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="klantverzoek",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+        migrations.AddField(
+            model_name="objectverzoek",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="objectverzoek",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoek",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoek",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekcontactmoment",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekcontactmoment",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekinformatieobject",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekinformatieobject",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekproduct",
+            name="_etag_value",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 hash of the values of the object in its current version.",
+                max_length=32,
+                verbose_name="etag value",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekproduct",
+            name="laatst_gewijzigd",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                help_text="Het tijdstip waarop het object voor het laatst is gewijzigd.",
+                verbose_name="laatst gewijzigd",
+            ),
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 2.2.14 on 2026-10-18 20:30
+
+from django.db import migrations, models
+import django.utils.timezone
+
+from verzoeken.utils.migrations import add_index_concurrently
+
+
+class Migration(migrations.Migration):
+
+    # the indexes on the existing tables are built concurrently, without blocking
+    # writes
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0008_etags"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        help_text="Het type van de verwijderde resource.", max_length=50
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(help_text="De UUID van de verwijderde resource."),
+                ),
+                (
+                    "laatst_gewijzigd",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Het tijdstip waarop de resource is verwijderd.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "tombstone",
+                "verbose_name_plural": "tombstones",
+            },
+        ),
+        add_index_concurrently(
+            "klantverzoek",
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="klantverzoek_gewijzigd_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "klantverzoek_gewijzigd_idx" '
+            'ON "datamodel_klantverzoek" ("laatst_gewijzigd", "uuid");',
+        ),
+        add_index_concurrently(
+            "objectverzoek",
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="objectverzoek_gewijzigd_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "objectverzoek_gewijzigd_idx" '
+            'ON "datamodel_objectverzoek" ("laatst_gewijzigd", "uuid");',
+        ),
+        add_index_concurrently(
+            "verzoek",
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="verzoek_gewijzigd_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_gewijzigd_idx" '
+            'ON "datamodel_verzoek" ("laatst_gewijzigd", "uuid");',
+        ),
+        add_index_concurrently(
+            "verzoekcontactmoment",
+            models.Index(fields=["laatst_gewijzigd", "uuid"], name="vcm_gewijzigd_idx"),
+            'CREATE INDEX CONCURRENTLY "vcm_gewijzigd_idx" '
+            'ON "datamodel_verzoekcontactmoment" ("laatst_gewijzigd", "uuid");',
+        ),
+        add_index_concurrently(
+            "verzoekinformatieobject",
+            models.Index(fields=["laatst_gewijzigd", "uuid"], name="vio_gewijzigd_idx"),
+            'CREATE INDEX CONCURRENTLY "vio_gewijzigd_idx" '
+            'ON "datamodel_verzoekinformatieobject" ("laatst_gewijzigd", "uuid");',
+        ),
+        add_index_concurrently(
+            "verzoekproduct",
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="verzoekproduct_gewijzigd_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoekproduct_gewijzigd_idx" '
+            'ON "datamodel_verzoekproduct" ("laatst_gewijzigd", "uuid");',
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="tombstone_gewijzigd_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 2.2.14 on 2026-10-18 20:33
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+from verzoeken.utils.migrations import add_index_concurrently
+
+BATCH_SIZE = 10000
+
+# keep the search vector up to date on every insert and update, including bulk
+# inserts and updates outside of the ORM
+CREATE_TRIGGER = """
+CREATE TRIGGER verzoek_zoekvector_update
+BEFORE INSERT OR UPDATE OF tekst ON datamodel_verzoek
+FOR EACH ROW EXECUTE PROCEDURE
+tsvector_update_trigger(zoekvector, 'pg_catalog.dutch', tekst);
+"""
+
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS verzoek_zoekvector_update ON datamodel_verzoek;"
+
+FILL_ZOEKVECTOR = """
+UPDATE datamodel_verzoek SET zoekvector = to_tsvector('pg_catalog.dutch', tekst)
+WHERE id > %s AND id <= %s;
+"""
+
+
+def fill_zoekvector(apps, schema_editor):
+    # in batches, so that the rows are only locked briefly
+    Verzoek = apps.get_model("datamodel", "Verzoek")
+    last_pk = Verzoek.objects.aggregate(last_pk=models.Max("pk"))["last_pk"] or 0
+    for start in range(0, last_pk, BATCH_SIZE):
+        schema_editor.execute(FILL_ZOEKVECTOR, (start, start + BATCH_SIZE))
+
+
+class Migration(migrations.Migration):
+
+    # every batch is committed on its own and the index is built concurrently,
+    # without blocking writes
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0009_tombstone"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="verzoek",
+            name="zoekvector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="De tekst van het VERZOEK voor het zoeken. Wordt door een trigger in de database bijgewerkt.",
+                null=True,
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.RunPython(fill_zoekvector, migrations.RunPython.noop),
+        add_index_concurrently(
+            "verzoek",
+            django.contrib.postgres.indexes.GinIndex(
+                fields=["zoekvector"], name="verzoek_zoekvector_idx"
+            ),
+            'CREATE INDEX CONCURRENTLY "verzoek_zoekvector_idx" '
+            'ON "datamodel_verzoek" USING gin ("zoekvector");',
+        ),
+    ]
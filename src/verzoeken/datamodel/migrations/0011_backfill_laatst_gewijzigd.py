@@ -0,0 +1,29 @@
+from django.db import migrations, models, transaction
+
+BATCH_SIZE = 10000
+
+
+def set_laatst_gewijzigd(apps, schema_editor):
+    # the best estimate for the existing VERZOEKen, updated in batches so that
+    # the rows are only locked briefly
+    Verzoek = apps.get_model("datamodel", "Verzoek")
+    last_pk = Verzoek.objects.aggregate(last_pk=models.Max("pk"))["last_pk"] or 0
+    for start in range(0, last_pk, BATCH_SIZE):
+        with transaction.atomic():
+            Verzoek.objects.filter(pk__gt=start, pk__lte=start + BATCH_SIZE).update(
+                laatst_gewijzigd=models.F("registratiedatum")
+            )
+
+
+class Migration(migrations.Migration):
+
+    # every batch is committed on its own
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0010_zoekvector"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_laatst_gewijzigd, migrations.RunPython.noop),
+    ]
@@ -1,22 +1,29 @@
 import uuid
+from typing import Optional
 
+from django.contrib.postgres.indexes import GinIndex, HashIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.fields import RSINField
 from vng_api_common.models import APIMixin
-from vng_api_common.utils import (
-    generate_unique_identification,
-    request_object_attribute,
-)
+from vng_api_common.utils import request_object_attribute
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from .constants import IndicatieMachtiging, KlantRol, ObjectTypes, VerzoekStatus
+from .etags import ETagMixin
+from .identificatie import generate_identificatie, register_identificatie
 
+# the text search configuration of the search vector of VERZOEKen, the
+# database trigger maintaining it uses the same configuration
+SEARCH_CONFIG = "dutch"
 
-class Verzoek(APIMixin, models.Model):
+
+class Verzoek(APIMixin, ETagMixin, models.Model):
     """
     Verzoek is een speciaal contactmoment.
     """
@@ -82,25 +89,124 @@ class Verzoek(APIMixin, models.Model):
         related_name="aanvullende_verzoek",
         help_text="URL-referentie naar het (eerdere) VERZOEK dat door dit VERZOEK wordt aangevuld.",
     )
+    zoekvector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_(
+            "De tekst van het VERZOEK voor het zoeken. Wordt door een trigger in "
+            "de database bijgewerkt."
+        ),
+    )
+
+    etag_ignored_fields = ("zoekvector",)
 
     class Meta:
         unique_together = ("bronorganisatie", "identificatie")
         verbose_name = "verzoek"
         verbose_name_plural = "verzoeken"
+        indexes = [
+            models.Index(
+                fields=["status", "registratiedatum"],
+                name="verzoek_status_regdatum_idx",
+            ),
+            models.Index(
+                fields=["bronorganisatie", "registratiedatum"],
+                name="verzoek_bronorg_regdatum_idx",
+            ),
+            # keyset pagination order
+            models.Index(
+                fields=["registratiedatum", "id"], name="verzoek_regdatum_id_idx"
+            ),
+            models.Index(
+                fields=["externe_identificatie"],
+                name="verzoek_externe_id_idx",
+                condition=~Q(externe_identificatie=""),
+            ),
+            # change feed order
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="verzoek_gewijzigd_idx"
+            ),
+            GinIndex(fields=["zoekvector"], name="verzoek_zoekvector_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_targets = instance._get_targets()
+        instance._loaded_identificatie = instance.__dict__.get("identificatie")
+        return instance
+
+    def _get_targets(self) -> Optional[set]:
+        """
+        Return the VERZOEKen referring to this VERZOEK in their resource.
+        """
+        deferred = self.get_deferred_fields()
+        if {"in_te_trekken_verzoek_id", "aangevulde_verzoek_id"} & deferred:
+            return None
+        return {self.in_te_trekken_verzoek_id, self.aangevulde_verzoek_id} - {None}
+
+    def _update_targets(self, targets: set) -> None:
+        for target in Verzoek.objects.filter(pk__in=targets):
+            target.save(update_fields=())
+
+    def get_etag_dependencies(self) -> list:
+        if self._state.adding:
+            return [None, None]
+
+        dependencies = []
+        for name in ("intrekkende_verzoek", "aanvullende_verzoek"):
+            try:
+                dependencies.append(getattr(self, name).pk)
+            except Verzoek.DoesNotExist:
+                dependencies.append(None)
+        return dependencies
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
-            self.identificatie = generate_unique_identification(
-                self, "registratiedatum"
-            )
+            self.identificatie = generate_identificatie(self, "registratiedatum")
+        elif self.identificatie != getattr(self, "_loaded_identificatie", None):
+            register_identificatie(self)
 
         super().save(*args, **kwargs)
+        self._loaded_identificatie = self.identificatie
+
+        # the VERZOEKen this VERZOEK (no longer) refers to changed as well
+        loaded_targets = getattr(self, "_loaded_targets", set())
+        targets = self._get_targets()
+        if loaded_targets is not None and targets is not None:
+            self._update_targets(loaded_targets ^ targets)
+            self._loaded_targets = targets
+
+    def delete(self, *args, **kwargs):
+        targets = self._get_targets()
+        result = super().delete(*args, **kwargs)
+        if targets:
+            self._update_targets(targets)
+        return result
 
     def unique_representation(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
 
 
-class ObjectVerzoek(APIMixin, models.Model):
+class IdentificatieCounter(models.Model):
+    """
+    The last number allocated for the generated identificaties of VERZOEKen.
+    """
+
+    bronorganisatie = RSINField()
+    year = models.PositiveSmallIntegerField()
+    value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "identificatieteller"
+        verbose_name_plural = "identificatietellers"
+        unique_together = ("bronorganisatie", "year")
+
+    def __str__(self):
+        return f"{self.bronorganisatie} - {self.year}: {self.value}"
+
+
+class ObjectVerzoek(APIMixin, ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -124,9 +230,15 @@ class ObjectVerzoek(APIMixin, models.Model):
         verbose_name = "object-verzoek"
         verbose_name_plural = "object-verzoeken"
         unique_together = ("verzoek", "object")
+        indexes = [
+            HashIndex(fields=["object"], name="objectverzoek_object_hash_idx"),
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="objectverzoek_gewijzigd_idx"
+            ),
+        ]
 
 
-class VerzoekProduct(APIMixin, models.Model):
+class VerzoekProduct(APIMixin, ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -144,6 +256,14 @@ class VerzoekProduct(APIMixin, models.Model):
         max_length=20, blank=True, help_text="De unieke code van het PRODUCT."
     )
 
+    class Meta:
+        indexes = [
+            HashIndex(fields=["product"], name="verzoekproduct_prod_hash_idx"),
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="verzoekproduct_gewijzigd_idx"
+            ),
+        ]
+
     def clean(self):
         if not self.product and not self.product_code:
             raise ValidationError(
@@ -160,7 +280,7 @@ class VerzoekProduct(APIMixin, models.Model):
         return f"({self.verzoek.unique_representation()}) - {product_id}"
 
 
-class VerzoekInformatieObject(models.Model):
+class VerzoekInformatieObject(ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -181,6 +301,12 @@ class VerzoekInformatieObject(models.Model):
         verbose_name = "verzoekinformatieobject"
         verbose_name_plural = "verzoekinformatieobjecten"
         unique_together = (("verzoek", "informatieobject"),)
+        indexes = [
+            HashIndex(
+                fields=["informatieobject"], name="vio_informatieobject_hash_idx"
+            ),
+            models.Index(fields=["laatst_gewijzigd", "uuid"], name="vio_gewijzigd_idx"),
+        ]
 
     def __str__(self):
         return str(self.uuid)
@@ -196,7 +322,7 @@ class VerzoekInformatieObject(models.Model):
         return self._unique_representation
 
 
-class VerzoekContactMoment(models.Model):
+class VerzoekContactMoment(ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -214,6 +340,10 @@ class VerzoekContactMoment(models.Model):
         verbose_name = "verzoekcontactmoment"
         verbose_name_plural = "verzoekcontactmomenten"
         unique_together = ("verzoek", "contactmoment")
+        indexes = [
+            HashIndex(fields=["contactmoment"], name="vcm_contactmoment_hash_idx"),
+            models.Index(fields=["laatst_gewijzigd", "uuid"], name="vcm_gewijzigd_idx"),
+        ]
 
     def __str__(self):
         return str(self.uuid)
@@ -223,7 +353,7 @@ class VerzoekContactMoment(models.Model):
         return f"({self.verzoek.unique_representation()}) - {contactmoment_id}"
 
 
-class KlantVerzoek(models.Model):
+class KlantVerzoek(ETagMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
     )
@@ -253,7 +383,40 @@ class KlantVerzoek(models.Model):
         verbose_name = "klantverzoek"
         verbose_name_plural = "klantverzoeken"
         unique_together = ("verzoek", "klant")
+        indexes = [
+            HashIndex(fields=["klant"], name="klantverzoek_klant_hash_idx"),
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="klantverzoek_gewijzigd_idx"
+            ),
+        ]
 
     def unique_representation(self):
         klant_id = self.klant.rstrip("/").split("/")[-1]
         return f"({self.verzoek.unique_representation()}) - {klant_id}"
+
+
+class Tombstone(models.Model):
+    """
+    The deletion of a VERZOEK or one of its relations, for the change feed.
+    """
+
+    resource = models.CharField(
+        max_length=50, help_text=_("Het type van de verwijderde resource.")
+    )
+    uuid = models.UUIDField(help_text=_("De UUID van de verwijderde resource."))
+    laatst_gewijzigd = models.DateTimeField(
+        default=timezone.now,
+        help_text=_("Het tijdstip waarop de resource is verwijderd."),
+    )
+
+    class Meta:
+        verbose_name = "tombstone"
+        verbose_name_plural = "tombstones"
+        indexes = [
+            models.Index(
+                fields=["laatst_gewijzigd", "uuid"], name="tombstone_gewijzigd_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.resource} {self.uuid}"
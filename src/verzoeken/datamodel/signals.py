@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete
+
+from .models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Tombstone,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+
+
+def create_tombstone(sender, instance=None, **kwargs):
+    Tombstone.objects.create(resource=sender._meta.model_name, uuid=instance.uuid)
+
+
+# the resources in the change feed
+for model in (
+    Verzoek,
+    ObjectVerzoek,
+    VerzoekProduct,
+    VerzoekInformatieObject,
+    VerzoekContactMoment,
+    KlantVerzoek,
+):
+    post_delete.connect(
+        create_tombstone,
+        sender=model,
+        dispatch_uid=f"datamodel.create_tombstone.{model._meta.model_name}",
+    )
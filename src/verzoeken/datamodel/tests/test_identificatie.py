@@ -0,0 +1,156 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from ..identificatie import clear_blocks
+from ..models import IdentificatieCounter, Verzoek
+from .factories import VerzoekFactory
+
+BRONORGANISATIE1 = "154760924"
+BRONORGANISATIE2 = "517439943"
+
+
+def registratiedatum(year: int) -> datetime:
+    return timezone.make_aware(datetime(year, 6, 1))
+
+
+class GenerateIdentificatieTests(TestCase):
+    def test_numbers_per_bronorganisatie_and_year(self):
+        verzoek1 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+        verzoek2 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+        verzoek3 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE2, registratiedatum=registratiedatum(2020)
+        )
+        verzoek4 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2021)
+        )
+
+        self.assertEqual(verzoek1.identificatie, "VERZOEK-2020-0000000001")
+        self.assertEqual(verzoek2.identificatie, "VERZOEK-2020-0000000002")
+        self.assertEqual(verzoek3.identificatie, "VERZOEK-2020-0000000001")
+        self.assertEqual(verzoek4.identificatie, "VERZOEK-2021-0000000001")
+
+    def test_continues_from_counter(self):
+        IdentificatieCounter.objects.create(
+            bronorganisatie=BRONORGANISATIE1, year=2020, value=41
+        )
+
+        with self.assertNumQueries(2):
+            verzoek = VerzoekFactory.create(
+                bronorganisatie=BRONORGANISATIE1,
+                registratiedatum=registratiedatum(2020),
+            )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2020-0000000042")
+
+    def test_provided_identificatie_is_kept(self):
+        verzoek = VerzoekFactory.create(identificatie="12345")
+
+        self.assertEqual(verzoek.identificatie, "12345")
+        self.assertFalse(IdentificatieCounter.objects.exists())
+
+    def test_provided_identificatie_in_generated_format(self):
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1,
+            registratiedatum=registratiedatum(2020),
+            identificatie="VERZOEK-2020-0000000001",
+        )
+
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2020-0000000002")
+
+    def test_provided_identificatie_below_counter(self):
+        IdentificatieCounter.objects.create(
+            bronorganisatie=BRONORGANISATIE1, year=2020, value=41
+        )
+
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, identificatie="VERZOEK-2020-0000000007"
+        )
+
+        self.assertEqual(IdentificatieCounter.objects.get().value, 41)
+
+    def test_changed_identificatie_in_generated_format(self):
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, identificatie="12345"
+        )
+        verzoek.identificatie = "VERZOEK-2020-0000000003"
+        verzoek.save()
+
+        # unchanged, the counter is not updated again
+        verzoek = Verzoek.objects.get()
+        with patch("verzoeken.datamodel.models.register_identificatie") as mock:
+            verzoek.save()
+        mock.assert_not_called()
+
+        self.assertEqual(IdentificatieCounter.objects.get().value, 3)
+
+
+@override_settings(VERZOEK_IDENTIFICATIE_BLOCK_SIZE=10)
+class BlockAllocationTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        clear_blocks()
+        self.addCleanup(clear_blocks)
+
+    def test_numbers_from_reserved_block(self):
+        verzoeken = [
+            VerzoekFactory.create(
+                bronorganisatie=BRONORGANISATIE1,
+                registratiedatum=registratiedatum(2020),
+            )
+            for _i in range(3)
+        ]
+
+        self.assertEqual(
+            [verzoek.identificatie for verzoek in verzoeken],
+            [f"VERZOEK-2020-000000000{number}" for number in range(1, 4)],
+        )
+        counter = IdentificatieCounter.objects.get()
+        self.assertEqual(counter.value, 10)
+
+    def test_rolled_back_block_is_not_used(self):
+        try:
+            with transaction.atomic():
+                VerzoekFactory.create(
+                    bronorganisatie=BRONORGANISATIE1,
+                    registratiedatum=registratiedatum(2020),
+                )
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertFalse(IdentificatieCounter.objects.exists())
+
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2020-0000000001")
+        self.assertEqual(IdentificatieCounter.objects.get().value, 10)
+
+    def test_provided_identificatie_in_reserved_block(self):
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1,
+            registratiedatum=registratiedatum(2020),
+            identificatie="VERZOEK-2020-0000000002",
+        )
+
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE1, registratiedatum=registratiedatum(2020)
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2020-0000000003")
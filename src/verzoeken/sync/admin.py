@@ -0,0 +1,25 @@
+from django.contrib import admin
+
+from .models import NotificationMessage, OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = [
+        "operation",
+        "verzoek",
+        "informatieobject",
+        "status",
+        "attempts",
+        "next_attempt",
+    ]
+    list_filter = ["status", "operation"]
+    readonly_fields = ["created", "last_error"]
+
+
+@admin.register(NotificationMessage)
+class NotificationMessageAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "kanaal", "status", "attempts", "next_attempt"]
+    list_filter = ["status", "kanaal"]
+    search_fields = ["hoofd_object"]
+    readonly_fields = ["created", "last_error"]
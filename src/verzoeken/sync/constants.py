@@ -0,0 +1,24 @@
+from django.utils.translation import ugettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class SyncOperations(DjangoChoices):
+    create = ChoiceItem("create", _("Create"))
+    delete = ChoiceItem("delete", _("Delete"))
+
+
+class OutboxStatus(DjangoChoices):
+    pending = ChoiceItem(
+        "pending",
+        _("Pending"),
+        description=_("The message still has to be delivered to the remote API."),
+    )
+    failed = ChoiceItem(
+        "failed",
+        _("Failed"),
+        description=_(
+            "Delivery failed for the maximum number of attempts and will not be "
+            "retried automatically."
+        ),
+    )
@@ -0,0 +1,78 @@
+"""
+Manage the mirrored OBJECT-INFORMATIEOBJECT relations in the Documenten API.
+"""
+import logging
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from verzoeken.api.auth import get_client_auth
+from verzoeken.api.utils import get_absolute_url
+
+logger = logging.getLogger(__name__)
+
+RESOURCE = "objectinformatieobject"
+
+
+class SyncError(Exception):
+    pass
+
+
+def get_verzoek_url(verzoek_uuid) -> str:
+    return get_absolute_url("verzoek-detail", uuid=verzoek_uuid)
+
+
+def get_client(informatieobject: str):
+    Client = import_string(settings.ZDS_CLIENT_CLASS)
+    client = Client.from_url(informatieobject)
+    client.auth = get_client_auth(informatieobject)
+    return client
+
+
+def create_remote_relation(verzoek_url: str, informatieobject: str) -> None:
+    logger.info("Verzoek: %s", verzoek_url)
+    logger.info("Informatieobject: %s", informatieobject)
+
+    client = get_client(informatieobject)
+    try:
+        client.create(
+            RESOURCE,
+            {
+                "object": verzoek_url,
+                "informatieobject": informatieobject,
+                "objectType": "verzoek",
+            },
+        )
+    except Exception as exc:
+        logger.error("Could not create remote relation", exc_info=1)
+        raise SyncError("Could not create remote relation") from exc
+
+
+def delete_remote_relation(verzoek_url: str, informatieobject: str) -> None:
+    """
+    Delete the remote relation.
+
+    :raises IndexError: if the Documenten API does not know the relation.
+    """
+    logger.info("Verzoek: %s", verzoek_url)
+    logger.info("Informatieobject: %s", informatieobject)
+
+    client = get_client(informatieobject)
+
+    # Retrieve the url of the relation between the object and the informatieobject
+    response = client.list(
+        RESOURCE,
+        query_params={"object": verzoek_url, "informatieobject": informatieobject},
+    )
+    try:
+        relation_url = response[0]["url"]
+    except IndexError as exc:
+        msg = "No relations found in DRC for this Verzoek"
+        logger.error(msg, exc_info=1)
+        raise IndexError(msg) from exc
+
+    try:
+        client.delete(RESOURCE, url=relation_url)
+    except Exception as exc:
+        logger.error("Could not delete remote relation", exc_info=1)
+        raise SyncError("Could not delete remote relation") from exc
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from verzoeken.sync.notifications import process_notifications
+
+
+class Command(BaseCommand):
+    help = "Send the queued notifications to the Notificaties API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the messages that are due and exit, instead of polling.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of messages to process per transaction.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling again when the queue is empty.",
+        )
+
+    def handle(self, **options):
+        batch_size = options["batch_size"]
+
+        while True:
+            processed = process_notifications(batch_size=batch_size)
+            if processed:
+                self.stdout.write(f"Processed {processed} message(s)")
+            # keep going while there's a backlog
+            if processed == batch_size:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
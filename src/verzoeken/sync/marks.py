@@ -0,0 +1,112 @@
+"""
+Keep track of the VerzoekInformatieObjecten that are being deleted.
+
+When a relation is deleted during the request, the Documenten API validates that
+the relation no longer exists in this API before it deletes its own side. The
+relation is therefore marked while the remote delete is in progress, and marked
+relations are hidden from the API.
+
+With Redis as ``drc_sync`` cache, the marks are stored in a sorted set scored on
+their expiry time, so that concurrent requests add and remove their own member
+atomically and a mark that is never removed (a crashed worker) expires on its
+own. Other cache backends are only used for development and tests, and fall back
+to a process-local read-modify-write.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Set
+
+from django.core.cache import caches
+
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = "drc_sync"
+CACHE_KEY = "vios_marked_for_delete"
+MARK_TIMEOUT = 5 * 60  # seconds
+
+_lock = threading.Lock()
+
+
+def _get_redis():
+    cache = caches[CACHE_ALIAS]
+    if not isinstance(cache, RedisCache):
+        return None, None
+    return get_redis_connection(CACHE_ALIAS), cache.make_key(CACHE_KEY)
+
+
+def mark_for_delete(uuid) -> None:
+    member = str(uuid)
+    expires = time.time() + MARK_TIMEOUT
+
+    redis, key = _get_redis()
+    if redis is None:
+        cache = caches[CACHE_ALIAS]
+        with _lock:
+            marks = cache.get(CACHE_KEY) or {}
+            marks[member] = expires
+            cache.set(CACHE_KEY, marks, MARK_TIMEOUT)
+        return
+
+    try:
+        with redis.pipeline() as pipe:
+            pipe.zadd(key, {member: expires})
+            pipe.expire(key, MARK_TIMEOUT)
+            pipe.execute()
+    except RedisError:
+        logger.warning("Could not mark %s for delete", member, exc_info=True)
+
+
+def unmark_for_delete(uuid) -> None:
+    member = str(uuid)
+
+    redis, key = _get_redis()
+    if redis is None:
+        cache = caches[CACHE_ALIAS]
+        with _lock:
+            marks = cache.get(CACHE_KEY) or {}
+            marks.pop(member, None)
+            cache.set(CACHE_KEY, marks, MARK_TIMEOUT)
+        return
+
+    try:
+        redis.zrem(key, member)
+    except RedisError:
+        logger.warning("Could not unmark %s for delete", member, exc_info=True)
+
+
+def get_marked_for_delete() -> Set[str]:
+    """
+    Return the UUIDs of the relations that are currently marked for delete.
+    """
+    now = time.time()
+
+    redis, key = _get_redis()
+    if redis is None:
+        marks = caches[CACHE_ALIAS].get(CACHE_KEY) or {}
+        return {member for member, expires in marks.items() if expires > now}
+
+    try:
+        with redis.pipeline() as pipe:
+            pipe.zremrangebyscore(key, "-inf", now)
+            pipe.zrangebyscore(key, now, "+inf")
+            _, members = pipe.execute()
+    except RedisError:
+        logger.warning("Could not retrieve the relations marked for delete")
+        return set()
+
+    return {member.decode("utf-8") for member in members}
+
+
+@contextmanager
+def marked_for_delete(uuid):
+    mark_for_delete(uuid)
+    try:
+        yield
+    finally:
+        unmark_for_delete(uuid)
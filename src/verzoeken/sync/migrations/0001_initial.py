@@ -0,0 +1,88 @@
+# Generated by Django 2.2.14 on 2026-10-18 19:51
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "operation",
+                    models.CharField(
+                        choices=[("create", "Create"), ("delete", "Delete")],
+                        max_length=20,
+                        verbose_name="operation",
+                    ),
+                ),
+                (
+                    "verzoek",
+                    models.URLField(
+                        help_text="URL-referentie naar het VERZOEK.",
+                        max_length=1000,
+                        verbose_name="verzoek",
+                    ),
+                ),
+                (
+                    "informatieobject",
+                    models.URLField(
+                        help_text="URL-referentie naar het INFORMATIEOBJECT (in de Documenten API).",
+                        max_length=1000,
+                        verbose_name="informatieobject",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("failed", "Failed")],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="attempts"),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The message is not delivered before this moment.",
+                        verbose_name="next attempt",
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="last error")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox message",
+                "verbose_name_plural": "outbox messages",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                fields=["status", "next_attempt"], name="outbox_status_next_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 2.2.14 on 2026-10-18 20:02
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sync", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="kanaal")),
+                (
+                    "hoofd_object",
+                    models.URLField(
+                        help_text="URL-referentie naar het hoofdobject van de notificatie.",
+                        max_length=1000,
+                        verbose_name="hoofd object",
+                    ),
+                ),
+                (
+                    "message",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        help_text="The notification as it is sent.",
+                        verbose_name="message",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("failed", "Failed")],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="attempts"),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The message is not delivered before this moment.",
+                        verbose_name="next attempt",
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="last error")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+            ],
+            options={
+                "verbose_name": "notification message",
+                "verbose_name_plural": "notification messages",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="notificationmessage",
+            index=models.Index(
+                fields=["status", "next_attempt"], name="notification_status_next_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.14 on 2026-10-18 21:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sync", "0002_notificationmessage"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                fields=["verzoek", "informatieobject", "status", "id"],
+                name="outbox_relation_status_idx",
+            ),
+        ),
+    ]
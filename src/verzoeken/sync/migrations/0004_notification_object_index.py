@@ -0,0 +1,20 @@
+# Generated by Django 2.2.14 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sync", "0003_outbox_relation_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationmessage",
+            index=models.Index(
+                fields=["hoofd_object", "status", "id"],
+                name="notification_object_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,108 @@
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from .constants import OutboxStatus, SyncOperations
+
+
+class OutboxMessage(models.Model):
+    """
+    A pending change of a relation that is mirrored in a remote API.
+
+    Messages are written in the same database transaction as the change of the
+    relation itself, and delivered afterwards by the ``process_drc_sync``
+    management command. Delivered messages are deleted.
+    """
+
+    operation = models.CharField(
+        _("operation"), max_length=20, choices=SyncOperations.choices
+    )
+    verzoek = models.URLField(
+        _("verzoek"), max_length=1000, help_text=_("URL-referentie naar het VERZOEK.")
+    )
+    informatieobject = models.URLField(
+        _("informatieobject"),
+        max_length=1000,
+        help_text=_("URL-referentie naar het INFORMATIEOBJECT (in de Documenten API)."),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.pending,
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    next_attempt = models.DateTimeField(
+        _("next attempt"),
+        default=timezone.now,
+        help_text=_("The message is not delivered before this moment."),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("outbox message")
+        verbose_name_plural = _("outbox messages")
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt"], name="outbox_status_next_idx"
+            ),
+            # the pending predecessors of a message
+            models.Index(
+                fields=["verzoek", "informatieobject", "status", "id"],
+                name="outbox_relation_status_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.operation} {self.verzoek} - {self.informatieobject}"
+
+
+class NotificationMessage(models.Model):
+    """
+    A notification that still has to be sent to the Notificaties API.
+
+    Messages are written in the same database transaction as the change they
+    notify about, and sent afterwards by the ``process_notifications``
+    management command. Sent messages are deleted.
+    """
+
+    kanaal = models.CharField(_("kanaal"), max_length=50)
+    hoofd_object = models.URLField(
+        _("hoofd object"),
+        max_length=1000,
+        help_text=_("URL-referentie naar het hoofdobject van de notificatie."),
+    )
+    message = JSONField(_("message"), help_text=_("The notification as it is sent."))
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.pending,
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    next_attempt = models.DateTimeField(
+        _("next attempt"),
+        default=timezone.now,
+        help_text=_("The message is not delivered before this moment."),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("notification message")
+        verbose_name_plural = _("notification messages")
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt"], name="notification_status_next_idx"
+            ),
+            # the pending predecessors of a message
+            models.Index(
+                fields=["hoofd_object", "status", "id"],
+                name="notification_object_status_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.message.get('actie')} {self.message.get('resourceUrl')}"
@@ -0,0 +1,100 @@
+"""
+Queue for the notifications sent to the Notificaties API.
+
+Instead of sending the notification while handling the request, it is stored as
+a :class:`NotificationMessage` in the same transaction as the change itself. A
+worker (see the ``process_notifications`` management command) sends the
+messages afterwards in batches, retrying failed deliveries with exponential
+backoff. Notifications about the same main object are sent in order.
+"""
+import logging
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from vng_api_common.notifications.models import NotificationsConfig
+
+from .constants import OutboxStatus
+from .models import NotificationMessage
+from .outbox import claim, get_backoff
+
+logger = logging.getLogger(__name__)
+
+
+def _build_message(message: dict) -> NotificationMessage:
+    return NotificationMessage(
+        kanaal=message["kanaal"], hoofd_object=message["hoofdObject"], message=message
+    )
+
+
+def enqueue_notification(message: dict) -> None:
+    _build_message(message).save()
+
+
+def enqueue_notifications(messages: List[dict]) -> None:
+    NotificationMessage.objects.bulk_create(
+        [_build_message(message) for message in messages]
+    )
+
+
+def deliver_notification(client, message: NotificationMessage) -> bool:
+    """
+    Send a single message, and either delete it or schedule the next attempt.
+    """
+    try:
+        client.create("notificaties", message.message)
+    except Exception as exc:
+        message.attempts += 1
+        message.last_error = str(exc)
+        if message.attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+            message.status = OutboxStatus.failed
+            logger.error("Giving up on %s after %d attempts", message, message.attempts)
+        else:
+            message.next_attempt = timezone.now() + get_backoff(
+                message.attempts,
+                settings.NOTIFICATIONS_RETRY_BACKOFF,
+                settings.NOTIFICATIONS_RETRY_BACKOFF_MAX,
+            )
+        message.save(update_fields=["attempts", "last_error", "status", "next_attempt"])
+        return False
+
+    message.delete()
+    return True
+
+
+def process_notifications(batch_size: int = 100) -> int:
+    """
+    Send a batch of due messages, returning the number of processed messages.
+
+    Like :func:`verzoeken.sync.outbox.process_outbox`, messages are claimed and
+    sent outside of a transaction, and a message is held back while an older
+    message for the same main object is still pending. All messages of a batch
+    are sent with the same client.
+    """
+    predecessors = NotificationMessage.objects.filter(
+        status=OutboxStatus.pending,
+        hoofd_object=OuterRef("hoofd_object"),
+        pk__lt=OuterRef("pk"),
+    )
+    queryset = NotificationMessage.objects.annotate(
+        has_predecessors=Exists(predecessors)
+    ).filter(has_predecessors=False)
+
+    timeout = settings.NOTIFICATIONS_CLAIM_TIMEOUT
+    deadline = timezone.now() + timedelta(seconds=timeout)
+    messages = claim(queryset, batch_size, timeout)
+    if not messages:
+        return 0
+
+    client = NotificationsConfig.get_client()
+    processed = 0
+    for message in messages:
+        if timezone.now() >= deadline:
+            break
+        deliver_notification(client, message)
+        processed += 1
+
+    return processed
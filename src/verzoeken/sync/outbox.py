@@ -0,0 +1,141 @@
+"""
+Transactional outbox for the synchronisation with the Documenten API.
+
+Instead of calling the Documenten API while handling the request, the change is
+recorded as an :class:`OutboxMessage` in the same transaction. A worker (see the
+``process_drc_sync`` management command) delivers the messages afterwards,
+retrying failed deliveries with exponential backoff.
+
+Messages are claimed in a short transaction and delivered outside of it, so no
+rows are locked and no transaction is kept open during the calls to the remote
+API. The outcome of every delivery is committed on its own.
+"""
+import logging
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+
+from verzoeken.datamodel.models import VerzoekInformatieObject
+
+from .constants import OutboxStatus, SyncOperations
+from .drc import create_remote_relation, delete_remote_relation, get_verzoek_url
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(operation: str, relation: VerzoekInformatieObject) -> None:
+    verzoek_url = get_verzoek_url(relation.verzoek.uuid)
+
+    if operation == SyncOperations.delete:
+        # a relation that was never created remotely doesn't need to be deleted
+        cancelled, _ = OutboxMessage.objects.filter(
+            operation=SyncOperations.create,
+            status=OutboxStatus.pending,
+            attempts=0,
+            verzoek=verzoek_url,
+            informatieobject=relation.informatieobject,
+        ).delete()
+        if cancelled:
+            return
+
+    OutboxMessage.objects.create(
+        operation=operation,
+        verzoek=verzoek_url,
+        informatieobject=relation.informatieobject,
+    )
+
+
+def get_backoff(attempts: int, backoff: int, maximum: int) -> timedelta:
+    seconds = backoff * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, maximum))
+
+
+def claim(queryset: QuerySet, batch_size: int, timeout: int) -> List:
+    """
+    Claim a batch of due messages for ``timeout`` seconds.
+
+    The messages are locked with ``SKIP LOCKED`` only while they're claimed, by
+    moving their next attempt past the claim. Other workers skip them in the
+    meantime, and retry them if this worker doesn't finish in time.
+    """
+    with transaction.atomic():
+        messages = list(
+            queryset.select_for_update(skip_locked=True)
+            .filter(status=OutboxStatus.pending, next_attempt__lte=timezone.now())
+            .order_by("pk")[:batch_size]
+        )
+        if messages:
+            queryset.model.objects.filter(pk__in=[msg.pk for msg in messages]).update(
+                next_attempt=timezone.now() + timedelta(seconds=timeout)
+            )
+    return messages
+
+
+def deliver(message: OutboxMessage) -> bool:
+    """
+    Deliver a single message, and either delete it or schedule the next attempt.
+    """
+    try:
+        if message.operation == SyncOperations.create:
+            create_remote_relation(message.verzoek, message.informatieobject)
+        else:
+            try:
+                delete_remote_relation(message.verzoek, message.informatieobject)
+            except IndexError:
+                # nothing left to delete remotely, so the goal is reached
+                pass
+    except Exception as exc:
+        message.attempts += 1
+        message.last_error = str(exc.__cause__ or exc)
+        if message.attempts >= settings.DRC_SYNC_MAX_ATTEMPTS:
+            message.status = OutboxStatus.failed
+            logger.error("Giving up on %s after %d attempts", message, message.attempts)
+        else:
+            message.next_attempt = timezone.now() + get_backoff(
+                message.attempts,
+                settings.DRC_SYNC_RETRY_BACKOFF,
+                settings.DRC_SYNC_RETRY_BACKOFF_MAX,
+            )
+        message.save(update_fields=["attempts", "last_error", "status", "next_attempt"])
+        return False
+
+    message.delete()
+    return True
+
+
+def process_outbox(batch_size: int = 100) -> int:
+    """
+    Deliver a batch of due messages, returning the number of processed messages.
+
+    Messages are claimed (see :func:`claim`), so multiple workers can process
+    the outbox concurrently. A message is held back while an older message for
+    the same relation is still pending, preserving the order of operations.
+    Messages whose claim expired during the batch are left to the next one.
+    """
+    predecessors = OutboxMessage.objects.filter(
+        status=OutboxStatus.pending,
+        verzoek=OuterRef("verzoek"),
+        informatieobject=OuterRef("informatieobject"),
+        pk__lt=OuterRef("pk"),
+    )
+    queryset = OutboxMessage.objects.annotate(
+        has_predecessors=Exists(predecessors)
+    ).filter(has_predecessors=False)
+
+    timeout = settings.DRC_SYNC_CLAIM_TIMEOUT
+    deadline = timezone.now() + timedelta(seconds=timeout)
+    messages = claim(queryset, batch_size, timeout)
+
+    processed = 0
+    for message in messages:
+        if timezone.now() >= deadline:
+            break
+        deliver(message)
+        processed += 1
+
+    return processed
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import VerzoekInformatieObject
+from verzoeken.datamodel.tests.factories import VerzoekInformatieObjectFactory
+from verzoeken.sync.marks import (
+    get_marked_for_delete,
+    mark_for_delete,
+    marked_for_delete,
+    unmark_for_delete,
+)
+
+UUID1 = "1e47f2b6-7cd5-4ea5-a2b4-c6cf5d1f4e7b"
+UUID2 = "5a6a2de1-7a38-4d8d-9c46-dc9c8bd02a4e"
+
+
+class MarksTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(caches["drc_sync"].clear)
+
+    def test_mark_and_unmark(self):
+        self.assertEqual(get_marked_for_delete(), set())
+
+        mark_for_delete(UUID1)
+        mark_for_delete(UUID2)
+        self.assertEqual(get_marked_for_delete(), {UUID1, UUID2})
+
+        unmark_for_delete(UUID1)
+        self.assertEqual(get_marked_for_delete(), {UUID2})
+
+    def test_context_manager_unmarks_on_error(self):
+        with self.assertRaises(ValueError):
+            with marked_for_delete(UUID1):
+                self.assertEqual(get_marked_for_delete(), {UUID1})
+                raise ValueError
+
+        self.assertEqual(get_marked_for_delete(), set())
+
+    def test_marks_expire(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            mark_for_delete(UUID1)
+        with freeze_time("2020-01-01T12:03:00Z"):
+            mark_for_delete(UUID2)
+
+        with freeze_time("2020-01-01T12:06:00Z"):
+            self.assertEqual(get_marked_for_delete(), {UUID2})
+
+
+@override_settings(DRC_SYNC_OUTBOX=False)
+class MarkedRelationsHiddenTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(caches["drc_sync"].clear)
+
+    @patch("verzoeken.sync.signals.sync_create_vio")
+    def test_marked_relation_is_not_listed(self, *mocks):
+        vio1, vio2 = VerzoekInformatieObjectFactory.create_batch(2)
+
+        with marked_for_delete(vio1.uuid):
+            response = self.client.get(reverse(VerzoekInformatieObject))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["url"], f"http://testserver{reverse(vio2)}")
+
+    @override_settings(DRC_SYNC_OUTBOX=True)
+    @patch("verzoeken.api.viewsets.get_marked_for_delete")
+    def test_outbox_skips_marks(self, mocked_get_marked):
+        VerzoekInformatieObjectFactory.create()
+
+        response = self.client.get(reverse(VerzoekInformatieObject))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+        mocked_get_marked.assert_not_called()
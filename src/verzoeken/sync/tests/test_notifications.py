@@ -0,0 +1,144 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url
+from zds_client import ClientError
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.tests.factories import VerzoekProductFactory
+from verzoeken.sync.constants import OutboxStatus
+from verzoeken.sync.models import NotificationMessage
+from verzoeken.sync.notifications import process_notifications
+
+KLANT = "http://some.klanten.nl/api/v1/klanten/951e4660-3835-4643-8f9c-e523e364a30f"
+
+
+@freeze_time("2018-09-07T00:00:00Z")
+@override_settings(
+    NOTIFICATIONS_DISABLED=False,
+    NOTIFICATIONS_QUEUE=True,
+    NOTIFICATIONS_MAX_ATTEMPTS=2,
+    NOTIFICATIONS_RETRY_BACKOFF=10,
+)
+class NotificationQueueTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = patch("zds_client.Client.from_url")
+        self.mocked_client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def create_verzoek(self) -> dict:
+        response = self.client.post(
+            get_operation_url("verzoek_create"),
+            {
+                "bronorganisatie": "423182687",
+                "klant": KLANT,
+                "status": VerzoekStatus.ontvangen,
+                "tekst": "some text",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.json()
+
+    def test_notification_is_queued(self):
+        data = self.create_verzoek()
+
+        self.mocked_client.create.assert_not_called()
+        message = NotificationMessage.objects.get()
+        self.assertEqual(message.hoofd_object, data["url"])
+        self.assertEqual(message.kanaal, "verzoeken")
+
+        processed = process_notifications()
+
+        self.assertEqual(processed, 1)
+        self.mocked_client.create.assert_called_once_with(
+            "notificaties",
+            {
+                "kanaal": "verzoeken",
+                "hoofdObject": data["url"],
+                "resource": "verzoek",
+                "resourceUrl": data["url"],
+                "actie": "create",
+                "aanmaakdatum": "2018-09-07T00:00:00Z",
+                "kenmerken": {"bronorganisatie": "423182687"},
+            },
+        )
+        self.assertFalse(NotificationMessage.objects.exists())
+
+    def test_failed_delivery_is_retried(self):
+        self.create_verzoek()
+        self.mocked_client.create.side_effect = ClientError({"detail": "error"})
+
+        process_notifications()
+
+        message = NotificationMessage.objects.get()
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(message.status, OutboxStatus.pending)
+        self.assertEqual(message.next_attempt, timezone.now() + timedelta(seconds=10))
+
+        with freeze_time("2018-09-07T00:00:10Z"):
+            process_notifications()
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxStatus.failed)
+
+    def test_notifications_for_the_same_main_object_are_sent_in_order(self):
+        verzoek_product = VerzoekProductFactory.create(
+            verzoek__bronorganisatie=423182687
+        )
+        self.client.delete(
+            get_operation_url("verzoekproduct_delete", uuid=verzoek_product.uuid)
+        )
+        self.create_verzoek()
+        self.client.delete(
+            get_operation_url("verzoek_delete", uuid=verzoek_product.verzoek.uuid)
+        )
+        self.assertEqual(NotificationMessage.objects.count(), 3)
+
+        # the delete of the verzoek waits for the delete of the verzoekproduct
+        self.assertEqual(process_notifications(), 2)
+        sent = [call[0][1] for call in self.mocked_client.create.call_args_list]
+        self.assertEqual(
+            [(message["resource"], message["actie"]) for message in sent],
+            [("verzoekproduct", "destroy"), ("verzoek", "create")],
+        )
+
+        self.assertEqual(process_notifications(), 1)
+        self.assertEqual(
+            self.mocked_client.create.call_args[0][1]["resource"], "verzoek"
+        )
+        self.assertEqual(self.mocked_client.create.call_args[0][1]["actie"], "destroy")
+
+    def test_claimed_notifications_are_skipped(self):
+        self.create_verzoek()
+        # another worker polling during the delivery
+        self.mocked_client.create.side_effect = lambda *args: self.assertEqual(
+            process_notifications(), 0
+        )
+
+        self.assertEqual(process_notifications(), 1)
+
+        self.mocked_client.create.assert_called_once()
+        self.assertFalse(NotificationMessage.objects.exists())
+
+    def test_management_command(self):
+        self.create_verzoek()
+        self.create_verzoek()
+
+        call_command(
+            "process_notifications", once=True, batch_size=1, stdout=StringIO()
+        )
+
+        self.assertEqual(self.mocked_client.create.call_count, 2)
+        self.assertFalse(NotificationMessage.objects.exists())
@@ -0,0 +1,181 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from verzoeken.datamodel.tests.factories import VerzoekInformatieObjectFactory
+from verzoeken.sync.constants import OutboxStatus, SyncOperations
+from verzoeken.sync.drc import SyncError
+from verzoeken.sync.models import OutboxMessage
+from verzoeken.sync.outbox import process_outbox
+
+INFORMATIEOBJECT = "https://drc.nl/api/v1/enkelvoudiginformatieobjecten/1234"
+
+
+@override_settings(
+    DRC_SYNC_OUTBOX=True,
+    DRC_SYNC_MAX_ATTEMPTS=3,
+    DRC_SYNC_RETRY_BACKOFF=10,
+    DRC_SYNC_RETRY_BACKOFF_MAX=15,
+    DRC_SYNC_CLAIM_TIMEOUT=60,
+)
+class OutboxTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        patcher_create = patch("verzoeken.sync.outbox.create_remote_relation")
+        self.mocked_create = patcher_create.start()
+        self.addCleanup(patcher_create.stop)
+
+        patcher_delete = patch("verzoeken.sync.outbox.delete_remote_relation")
+        self.mocked_delete = patcher_delete.start()
+        self.addCleanup(patcher_delete.stop)
+
+    def test_create_relation_enqueues_message(self):
+        vio = VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.operation, SyncOperations.create)
+        self.assertEqual(message.informatieobject, INFORMATIEOBJECT)
+        self.assertEqual(
+            message.verzoek,
+            f"https://example.com/api/v1/verzoeken/{vio.verzoek.uuid}",
+        )
+        self.mocked_create.assert_not_called()
+
+    def test_delete_undelivered_relation_cancels_create(self):
+        vio = VerzoekInformatieObjectFactory.create()
+
+        vio.delete()
+
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_process_outbox(self):
+        vio = VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+        verzoek_url = OutboxMessage.objects.get().verzoek
+
+        processed = process_outbox()
+
+        self.assertEqual(processed, 1)
+        self.mocked_create.assert_called_once_with(verzoek_url, INFORMATIEOBJECT)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+        vio.delete()
+        process_outbox()
+
+        self.mocked_delete.assert_called_once_with(verzoek_url, INFORMATIEOBJECT)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_delete_missing_remote_relation_is_delivered(self):
+        vio = VerzoekInformatieObjectFactory.create()
+        process_outbox()
+        self.mocked_delete.side_effect = IndexError
+
+        vio.delete()
+        process_outbox()
+
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    @freeze_time("2020-01-01T12:00:00Z")
+    def test_failed_delivery_is_retried_with_backoff(self):
+        VerzoekInformatieObjectFactory.create()
+        self.mocked_create.side_effect = SyncError("Could not create remote relation")
+
+        process_outbox()
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.status, OutboxStatus.pending)
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(message.last_error, "Could not create remote relation")
+        self.assertEqual(message.next_attempt, timezone.now() + timedelta(seconds=10))
+
+        # not due yet
+        self.assertEqual(process_outbox(), 0)
+
+        with freeze_time("2020-01-01T12:00:10Z"):
+            process_outbox()
+
+        message.refresh_from_db()
+        self.assertEqual(message.attempts, 2)
+        # capped by DRC_SYNC_RETRY_BACKOFF_MAX
+        self.assertEqual(
+            message.next_attempt, timezone.now() + timedelta(seconds=10 + 15)
+        )
+
+        with freeze_time("2020-01-01T12:00:25Z"):
+            process_outbox()
+
+        message.refresh_from_db()
+        self.assertEqual(message.attempts, 3)
+        self.assertEqual(message.status, OutboxStatus.failed)
+
+    def test_messages_for_the_same_relation_are_delivered_in_order(self):
+        vio = VerzoekInformatieObjectFactory.create()
+        self.mocked_create.side_effect = SyncError("Could not create remote relation")
+        process_outbox()
+        OutboxMessage.objects.update(next_attempt=timezone.now())
+
+        vio.delete()
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+        self.mocked_create.side_effect = None
+        self.assertEqual(process_outbox(), 1)
+        self.mocked_delete.assert_not_called()
+
+        self.assertEqual(process_outbox(), 1)
+        self.mocked_delete.assert_called_once()
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_claimed_messages_are_skipped(self):
+        VerzoekInformatieObjectFactory.create()
+        # another worker polling during the delivery
+        self.mocked_create.side_effect = lambda *args: self.assertEqual(
+            process_outbox(), 0
+        )
+
+        self.assertEqual(process_outbox(), 1)
+
+        self.mocked_create.assert_called_once()
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_expired_claim_stops_the_batch(self):
+        VerzoekInformatieObjectFactory.create_batch(2)
+
+        with freeze_time("2020-01-01T12:00:00Z") as frozen_time:
+            OutboxMessage.objects.update(next_attempt=timezone.now())
+            self.mocked_create.side_effect = lambda *args: frozen_time.tick(
+                timedelta(seconds=60)
+            )
+
+            self.assertEqual(process_outbox(), 1)
+
+            # the other message is retried once the claim expired
+            message = OutboxMessage.objects.get()
+            self.assertEqual(message.attempts, 0)
+            self.assertLessEqual(message.next_attempt, timezone.now())
+
+    def test_management_command(self):
+        VerzoekInformatieObjectFactory.create_batch(2)
+
+        call_command("process_drc_sync", once=True, batch_size=1, stdout=StringIO())
+
+        self.assertEqual(self.mocked_create.call_count, 2)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+
+@override_settings(DRC_SYNC_OUTBOX=False)
+class SynchronousSyncTests(TestCase):
+    @patch("verzoeken.sync.signals.create_remote_relation")
+    def test_create_relation_calls_remote(self, mocked_create):
+        vio = VerzoekInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
+
+        mocked_create.assert_called_once_with(
+            f"https://example.com/api/v1/verzoeken/{vio.verzoek.uuid}",
+            INFORMATIEOBJECT,
+        )
+        self.assertFalse(OutboxMessage.objects.exists())
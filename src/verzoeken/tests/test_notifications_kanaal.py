@@ -12,7 +12,7 @@ from verzoeken.datamodel.models import Verzoek
 
 @override_settings(IS_HTTPS=True)
 class CreateNotifKanaalTestCase(APITestCase):
-    @patch("zds_client.Client")
+    @patch("verzoeken.utils.clients.PooledClient")
     def test_kanaal_create_with_name(self, mock_client):
         """
         Test is request to create kanaal is send with specified kanaal name
@@ -39,7 +39,7 @@ class CreateNotifKanaalTestCase(APITestCase):
             },
         )
 
-    @patch("zds_client.Client")
+    @patch("verzoeken.utils.clients.PooledClient")
     @override_settings(NOTIFICATIONS_KANAAL="dummy-kanaal")
     def test_kanaal_create_without_name(self, mock_client):
         """
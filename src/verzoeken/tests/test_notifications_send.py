@@ -14,7 +14,7 @@ KLANT = "http://some.klanten.nl/api/v1/klanten/951e4660-3835-4643-8f9c-e523e364a
 
 
 @freeze_time("2018-09-07T00:00:00Z")
-@override_settings(NOTIFICATIONS_DISABLED=False)
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_QUEUE=False)
 class SendNotifTestCase(JWTAuthMixin, APITestCase):
 
     heeft_alle_autorisaties = True
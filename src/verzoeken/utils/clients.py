@@ -0,0 +1,163 @@
+"""
+Re-use HTTP connections for the outbound calls to other ZGW APIs.
+
+Every API root gets its own :class:`requests.Session`, kept for the lifetime of
+the process, so that subsequent calls re-use the open (TLS) connections from
+its pool instead of connecting again for every request.
+"""
+import copy
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Union
+from urllib.parse import urljoin, urlparse
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+from zds_client import Client, ClientError
+from zds_client.client import UUID_PATTERN, Object, get_headers
+from zds_client.config import ClientConfig
+
+from .metrics import observe_outbound
+from .performance import record_http_call
+
+
+class SessionRegistry:
+    """
+    Hold a :class:`requests.Session` per API root, with usage statistics.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.stats = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "requests": 0, "duration": 0.0}
+        )
+
+    def get_session(self, api_root: str) -> requests.Session:
+        session = self._sessions.get(api_root)
+        if session is not None:
+            self.stats[api_root]["hits"] += 1
+            return session
+
+        with self._lock:
+            if api_root not in self._sessions:
+                self._sessions[api_root] = self._create_session()
+                self.stats[api_root]["misses"] += 1
+            else:
+                self.stats[api_root]["hits"] += 1
+            return self._sessions[api_root]
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=settings.ZGW_CLIENT_POOL_SIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, api_root: str, method: str, url: str, **kwargs):
+        session = self.get_session(api_root)
+        kwargs.setdefault(
+            "timeout",
+            (settings.ZGW_CLIENT_CONNECT_TIMEOUT, settings.ZGW_CLIENT_READ_TIMEOUT),
+        )
+
+        start = time.monotonic()
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            duration = time.monotonic() - start
+            stats = self.stats[api_root]
+            stats["requests"] += 1
+            stats["duration"] += duration
+            record_http_call(duration)
+            observe_outbound(api_root, method.upper(), duration)
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {api_root: stats.copy() for api_root, stats in self.stats.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self.stats.clear()
+
+
+registry = SessionRegistry()
+
+
+class PooledClient(Client):
+    """
+    :class:`zds_client.Client` sending its requests through the session registry.
+    """
+
+    def request(
+        self, path: str, operation: str, method="GET", expected_status=200, **kwargs
+    ) -> Union[List[Object], Object]:
+        # identical to Client.request, apart from the session being used
+        url = urljoin(self.base_url, path)
+
+        headers = kwargs.pop("headers", {})
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        headers.update(get_headers(self.schema, operation))
+
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = registry.request(self.base_url, method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            headers,
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
+
+
+def get_api_root(url: str) -> str:
+    """
+    Determine the API root of a resource URL, the same way as ``Client.from_url``.
+    """
+    bits = re.split(UUID_PATTERN, urlparse(url).path)
+    base_path = (bits[0].rstrip("/").rsplit("/", 1))[0] + "/"
+    return f"{ClientConfig.from_url(url).base_url}{base_path}"
+
+
+def fetch(url: str, params=None, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement for :func:`requests.get`, used as ``LINK_FETCHER``.
+    """
+    return registry.request(get_api_root(url), "GET", url, params=params, **kwargs)
@@ -0,0 +1,164 @@
+"""
+Expose Prometheus metrics of the API at ``/metrics``.
+
+The request metrics are observed by
+:class:`verzoeken.utils.performance.PerformanceMiddleware`, the outbound
+calls by the session registry in :mod:`verzoeken.utils.clients`.
+
+Behind uWSGI every worker process has its own metrics. With the
+``prometheus_multiproc_dir`` environment variable pointing to an (empty)
+directory, the workers write their metrics to files in that directory and
+every scrape aggregates the metrics of all workers.
+
+Only the addresses in ``METRICS_ALLOWED_IPS`` can scrape the metrics, for
+others the endpoint doesn't exist.
+"""
+import ipaddress
+import os
+from functools import lru_cache
+from typing import Tuple
+
+from django.conf import settings
+from django.db.models import Count
+from django.http import Http404, HttpResponse
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from verzoeken.sync.constants import OutboxStatus
+from verzoeken.sync.models import NotificationMessage, OutboxMessage
+
+try:
+    import uwsgi
+except ImportError:  # not running under uWSGI
+    uwsgi = None
+
+REQUEST_DURATION = Histogram(
+    "verzoeken_request_duration_seconds",
+    "Duration of the requests per view.",
+    ["view", "method", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "verzoeken_request_db_queries",
+    "Number of database queries of the requests per view.",
+    ["view"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, float("inf")),
+)
+OUTBOUND_DURATION = Histogram(
+    "verzoeken_outbound_request_duration_seconds",
+    "Duration of the calls to other APIs.",
+    ["api_root", "method"],
+)
+CACHE_LOOKUPS = Counter(
+    "verzoeken_cache_lookups_total",
+    "Number of cache lookups.",
+    ["cache", "result"],
+)
+
+
+def get_view_name(request) -> str:
+    """
+    Name the view as ``<viewset>.<action>``, or the URL name for other views.
+    """
+    resolver_match = request.resolver_match
+    if resolver_match is None:
+        return "-"
+
+    view = resolver_match.func
+    actions = getattr(view, "actions", None)
+    if actions and request.method.lower() in actions:
+        return f"{view.cls.__name__}.{actions[request.method.lower()]}"
+    return resolver_match.view_name or "-"
+
+
+def observe_request(request, status_code: int, duration: float, db_queries: int):
+    view = get_view_name(request)
+    REQUEST_DURATION.labels(view, request.method, status_code).observe(duration)
+    REQUEST_DB_QUERIES.labels(view).observe(db_queries)
+
+
+def observe_outbound(api_root: str, method: str, duration: float) -> None:
+    OUTBOUND_DURATION.labels(api_root, method).observe(duration)
+
+
+def observe_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class StateCollector:
+    """
+    Collect the metrics that describe the current state, at scrape time.
+    """
+
+    def collect(self):
+        for name, model in (
+            ("drc_sync", OutboxMessage),
+            ("notifications", NotificationMessage),
+        ):
+            gauge = GaugeMetricFamily(
+                f"verzoeken_{name}_queue_messages",
+                f"Number of {name} messages in the queue.",
+                labels=["status"],
+            )
+            counts = dict(
+                model.objects.values_list("status").annotate(count=Count("pk"))
+            )
+            for status in OutboxStatus.values:
+                gauge.add_metric([status], counts.get(status, 0))
+            yield gauge
+
+        if uwsgi is not None:
+            gauge = GaugeMetricFamily(
+                "verzoeken_uwsgi_workers",
+                "Number of uWSGI workers.",
+                labels=["status"],
+            )
+            statuses = [worker["status"] for worker in uwsgi.workers()]
+            for status in sorted(set(statuses)):
+                gauge.add_metric([status], statuses.count(status))
+            yield gauge
+
+
+def get_registry() -> CollectorRegistry:
+    if not os.environ.get("prometheus_multiproc_dir"):
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@lru_cache(maxsize=None)
+def get_allowed_networks(allowed_ips: Tuple[str, ...]) -> list:
+    return [ipaddress.ip_network(ip, strict=False) for ip in allowed_ips]
+
+
+def is_allowed(remote_addr: str) -> bool:
+    try:
+        address = ipaddress.ip_address(remote_addr)
+    except ValueError:
+        return False
+
+    networks = get_allowed_networks(tuple(settings.METRICS_ALLOWED_IPS))
+    return any(address in network for network in networks)
+
+
+def metrics_view(request):
+    if not is_allowed(request.META.get("REMOTE_ADDR", "")):
+        raise Http404
+
+    registry = get_registry()
+    state_registry = CollectorRegistry()
+    state_registry.register(StateCollector())
+    return HttpResponse(
+        generate_latest(registry) + generate_latest(state_registry),
+        content_type=CONTENT_TYPE_LATEST,
+    )
@@ -0,0 +1,21 @@
+from django.db import migrations
+from django.db.models import Index
+
+
+def add_index_concurrently(model_name: str, index: Index, sql: str):
+    """
+    Add an index without blocking writes to the table while it's built.
+
+    Django 2.2 has no ``AddIndexConcurrently``, so the index is created with
+    the given ``CREATE INDEX CONCURRENTLY`` statement, while the migration state
+    records a regular ``AddIndex``. The migration must set ``atomic = False``,
+    as the index can't be built concurrently inside a transaction.
+    """
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[
+            migrations.RunSQL(
+                sql, reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}";'
+            )
+        ],
+        state_operations=[migrations.AddIndex(model_name=model_name, index=index)],
+    )
@@ -0,0 +1,116 @@
+"""
+Measure the timings and query counts of the requests.
+
+The measurements of every request are exposed as Prometheus metrics (see
+:mod:`verzoeken.utils.metrics`). Every sampled request is also written as a
+single line of ``key=value`` pairs to the ``performance`` logger, which writes
+to ``performance.log``. The queries and outbound HTTP calls are recorded for
+the thread handling the request, so the numbers are also correct with a
+threaded server. Work done while a streaming response is consumed is not
+included.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+
+from .metrics import observe_request
+
+logger = logging.getLogger("performance")
+
+_local = threading.local()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.db_queries = 0
+        self.db_duration = 0.0
+        self.http_calls = 0
+        self.http_duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # used as database execute wrapper
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_duration += time.monotonic() - start
+
+
+def get_metrics() -> Optional[RequestMetrics]:
+    return getattr(_local, "metrics", None)
+
+
+def record_http_call(duration: float) -> None:
+    """
+    Record an outbound HTTP call for the request being handled, if sampled.
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.http_calls += 1
+        metrics.http_duration += duration
+
+
+def is_sampled() -> bool:
+    rate = settings.PERFORMANCE_LOG_SAMPLE_RATE
+    if rate <= 0:
+        return False
+    return rate == 1 or random.random() < 1 / rate
+
+
+def get_response_size(response) -> Optional[int]:
+    if response.has_header("Content-Length"):
+        return int(response["Content-Length"])
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+class PerformanceMiddleware:
+    """
+    Measure the duration, database queries and outbound HTTP calls of requests.
+
+    Only one in ``PERFORMANCE_LOG_SAMPLE_RATE`` requests is logged, a rate of 0
+    disables the logging.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        _local.metrics = metrics
+        start = time.monotonic()
+        try:
+            with connection.execute_wrapper(metrics):
+                response = self.get_response(request)
+        finally:
+            duration = time.monotonic() - start
+            _local.metrics = None
+
+        observe_request(request, response.status_code, duration, metrics.db_queries)
+        if not is_sampled():
+            return response
+
+        resolver_match = request.resolver_match
+        size = get_response_size(response)
+        logger.info(
+            "method=%s path=%s view=%s status=%s duration_ms=%.1f db_queries=%d "
+            "db_ms=%.1f http_calls=%d http_ms=%.1f size=%s",
+            request.method,
+            request.path,
+            resolver_match.view_name if resolver_match else "-",
+            response.status_code,
+            duration * 1000,
+            metrics.db_queries,
+            metrics.db_duration * 1000,
+            metrics.http_calls,
+            metrics.http_duration * 1000,
+            "-" if size is None else size,
+        )
+        return response
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+
+from verzoeken.utils.clients import PooledClient, fetch, get_api_root, registry
+
+ZAAK = "https://zrc.nl/api/v1/zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+ZAKEN_ROOT = "https://zrc.nl/api/v1/"
+
+
+class ClientsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        registry.clear()
+        self.addCleanup(registry.clear)
+
+    def test_get_api_root(self):
+        self.assertEqual(get_api_root(ZAAK), ZAKEN_ROOT)
+        self.assertEqual(
+            get_api_root(
+                "http://drc.nl:8000/api/v1/enkelvoudiginformatieobjecten/"
+                "5c0f4b6b-0a3f-4d5a-a1be-5f0c3a3f8fd0"
+            ),
+            "http://drc.nl:8000/api/v1/",
+        )
+
+    def test_session_reused_per_api_root(self):
+        session = registry.get_session(ZAKEN_ROOT)
+
+        self.assertIs(registry.get_session(ZAKEN_ROOT), session)
+        self.assertIsNot(registry.get_session("https://drc.nl/api/v1/"), session)
+        self.assertEqual(registry.get_stats()[ZAKEN_ROOT]["misses"], 1)
+        self.assertEqual(registry.get_stats()[ZAKEN_ROOT]["hits"], 1)
+
+    @override_settings(ZGW_CLIENT_CONNECT_TIMEOUT=1, ZGW_CLIENT_READ_TIMEOUT=2)
+    def test_fetch(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, json={"url": ZAAK})
+
+            response = fetch(ZAAK, headers={"Accept-Crs": "EPSG:4326"})
+            fetch(ZAAK)
+
+        self.assertEqual(response.json(), {"url": ZAAK})
+        self.assertEqual(m.last_request.timeout, (1, 2))
+        self.assertEqual(m.request_history[0].headers["Accept-Crs"], "EPSG:4326")
+
+        stats = registry.get_stats()[ZAKEN_ROOT]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    @patch("zds_client.client.get_operation_url", return_value="/api/v1/zaken")
+    def test_pooled_client(self, *mocks):
+        client = PooledClient.from_url(ZAAK)
+        client._schema = {"paths": {}}
+
+        with requests_mock.Mocker() as m:
+            m.get("https://zrc.nl/api/v1/zaken", json=[{"url": ZAAK}])
+
+            zaken = client.list("zaak")
+
+        self.assertEqual(zaken, [{"url": ZAAK}])
+        self.assertEqual(registry.get_stats()[ZAKEN_ROOT]["requests"], 1)
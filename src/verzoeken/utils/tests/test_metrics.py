@@ -0,0 +1,95 @@
+from django.test import override_settings
+
+import requests_mock
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import Verzoek
+from verzoeken.datamodel.tests.factories import VerzoekFactory
+from verzoeken.sync.constants import OutboxStatus
+from verzoeken.sync.models import NotificationMessage
+from verzoeken.utils.clients import fetch
+
+ZAAK = "https://zrc.nl/api/v1/zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+
+
+def get_value(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_request_observed_per_action(self):
+        VerzoekFactory.create()
+        labels = {"view": "VerzoekViewSet.list", "method": "GET", "status": "200"}
+        before = get_value("verzoeken_request_duration_seconds_count", **labels)
+
+        response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            get_value("verzoeken_request_duration_seconds_count", **labels),
+            before + 1,
+        )
+        self.assertGreater(
+            get_value("verzoeken_request_db_queries_sum", view="VerzoekViewSet.list"),
+            0,
+        )
+
+    def test_outbound_call_observed(self):
+        labels = {"api_root": "https://zrc.nl/api/v1/", "method": "GET"}
+        before = get_value(
+            "verzoeken_outbound_request_duration_seconds_count", **labels
+        )
+
+        with requests_mock.Mocker() as m:
+            m.get(ZAAK, json={})
+            fetch(ZAAK)
+
+        self.assertEqual(
+            get_value("verzoeken_outbound_request_duration_seconds_count", **labels),
+            before + 1,
+        )
+
+    def test_metrics_endpoint(self):
+        NotificationMessage.objects.create(
+            kanaal="verzoeken", hoofd_object="https://example.com", message={}
+        )
+        NotificationMessage.objects.create(
+            kanaal="verzoeken",
+            hoofd_object="https://example.com",
+            message={},
+            status=OutboxStatus.failed,
+        )
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = response.content.decode("utf-8")
+        self.assertIn("# TYPE verzoeken_request_duration_seconds histogram", content)
+        self.assertIn(
+            'verzoeken_notifications_queue_messages{status="pending"} 1.0', content
+        )
+        self.assertIn(
+            'verzoeken_notifications_queue_messages{status="failed"} 1.0', content
+        )
+        self.assertIn(
+            'verzoeken_drc_sync_queue_messages{status="pending"} 0.0', content
+        )
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.0/8"])
+    def test_metrics_endpoint_allowed_network(self):
+        response = self.client.get("/metrics", REMOTE_ADDR="10.1.2.3")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.0/8"])
+    def test_metrics_endpoint_not_allowed(self):
+        for remote_addr in ["127.0.0.1", "192.168.1.1", ""]:
+            with self.subTest(remote_addr=remote_addr):
+                response = self.client.get("/metrics", REMOTE_ADDR=remote_addr)
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import KlantVerzoek, Verzoek
+from verzoeken.datamodel.tests.factories import VerzoekFactory
+
+KLANT = "http://some.klanten.nl/api/v1/klanten/12345"
+
+
+def parse(line: str) -> dict:
+    return dict(pair.split("=", 1) for pair in line.split())
+
+
+@override_settings(PERFORMANCE_LOG_SAMPLE_RATE=1)
+class PerformanceMiddlewareTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_request_logged(self):
+        VerzoekFactory.create()
+
+        with self.assertLogs("performance", level="INFO") as logs:
+            response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(logs.records), 1)
+
+        line = parse(logs.records[0].getMessage())
+        self.assertEqual(line["method"], "GET")
+        self.assertEqual(line["path"], reverse(Verzoek))
+        self.assertEqual(line["view"], "verzoek-list")
+        self.assertEqual(line["status"], "200")
+        self.assertGreater(int(line["db_queries"]), 0)
+        self.assertEqual(line["http_calls"], "0")
+        self.assertEqual(int(line["size"]), len(response.content))
+
+    def test_outbound_calls_recorded(self):
+        data = {"verzoek": reverse(VerzoekFactory.create()), "klant": KLANT}
+
+        with self.assertLogs("performance", level="INFO") as logs:
+            with requests_mock.Mocker() as m:
+                m.get(KLANT, json={})
+                response = self.client.post(reverse(KlantVerzoek), data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+        line = parse(logs.records[0].getMessage())
+        self.assertEqual(line["view"], "klantverzoek-list")
+        self.assertEqual(line["http_calls"], "1")
+
+    @override_settings(PERFORMANCE_LOG_SAMPLE_RATE=0)
+    @patch("verzoeken.utils.performance.logger")
+    def test_disabled(self, mock_logger):
+        response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_logger.info.assert_not_called()